@@ -17,7 +17,9 @@ if __TYPE_CHECKING:  # pragma: no cover
     from .main import *  # noqa: F403
     from .path import *  # noqa: F403
     from .processor import *  # noqa: F403
+    from .safe_writer import Durability as Durability
     from .validators import *  # noqa: F403
+    from .watcher import *  # noqa: F403
 else:
     from .basic import __all__ as __basic_all
     from .lazy_import import lazy_import as __lazy_import
@@ -47,13 +49,17 @@ else:
             "AttrKey": ".path",
             "IndexKey": ".path",
             "Path": ".path",
+            "PathCache": ".path",
+            "PathCacheInfo": ".path",
             "PathSyntaxParser": ".path",
+            "Durability": ".safe_writer",
             "ComponentValidatorFactory": ".validators",
             "DefaultValidatorFactory": ".validators",
             "FieldDefinition": ".validators",
             "ValidatorOptions": ".validators",
             "ValidatorTypes": ".validators",
             "pydantic_validator": ".validators",
+            "ConfigWatcher": ".watcher",
         }
     )
     __all__.remove("__version__")
@@ -7,11 +7,13 @@ import os
 from abc import ABC
 from abc import abstractmethod
 from collections import OrderedDict
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from copy import deepcopy
+from functools import lru_cache
 from re import Pattern
 from typing import Any
 from typing import Self
@@ -20,6 +22,7 @@ from typing import override
 
 from ._protocols import Indexed
 from ._protocols import MutableIndexed
+from .utils import run_in_executor
 
 type AnyKey = ABCKey[Any, Any]
 """
@@ -335,6 +338,33 @@ class ABCConfigData(ABC):
         self.read_only = freeze
         return self
 
+    def snapshot(self) -> Self:
+        """
+        获取配置数据的快照
+
+        快照与原配置数据互不影响
+
+        :return: 配置数据快照
+        :rtype: Self
+
+        .. versionadded:: 0.3.1
+        """
+        return deepcopy(self)
+
+    @property
+    def version(self) -> int | None:
+        """
+        配置数据的修改版本号
+
+        每次通过配置数据的方法修改后单调递增，为None时表示不追踪修改
+
+        :return: 修改版本号
+        :rtype: int | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return None
+
     @override
     def __format__(self, format_spec: str) -> str:
         if format_spec == "r":
@@ -546,6 +576,67 @@ class ABCIndexedConfigData[D: Indexed[Any, Any]](ABCConfigData, MutableIndexed[A
            重命名 ``set_default`` 为 ``setdefault``
         """
 
+    def retrieve_many(self, paths: Iterable[PathLike], *, return_raw_value: bool = False) -> list[Any]:
+        r"""
+        批量获取路径的值
+
+        与按输入顺序逐个调用 :py:meth:`retrieve` 等价
+
+        :param paths: 路径
+        :type paths: Iterable[PathLike]
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 按输入顺序排列的路径的值
+        :rtype: list[Any]
+
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        例子
+        ----
+
+           >>> from c41811.config import MappingConfigData
+           >>> data = MappingConfigData({"server": {"host": "localhost", "port": 8080}})
+           >>> data.retrieve_many([r"server\.host", r"server\.port"])
+           ['localhost', 8080]
+
+        .. versionadded:: 0.3.1
+        """
+        return [self.retrieve(path, return_raw_value=return_raw_value) for path in paths]
+
+    def modify_many(self, values: Mapping[PathLike, Any], *, allow_create: bool = True) -> Self:
+        r"""
+        批量修改路径的值
+
+        与按输入顺序逐个调用 :py:meth:`modify` 等价
+
+        :param values: 路径到值的映射
+        :type values: Mapping[PathLike, Any]
+        :param allow_create: 是否允许创建不存在的路径，默认为True
+        :type allow_create: bool
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        :raise ConfigDataReadOnlyError: 配置数据为只读
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        例子
+        ----
+
+           >>> from c41811.config import MappingConfigData
+           >>> data = MappingConfigData({"server": {"host": "localhost"}})
+           >>> data.modify_many({r"server\.host": "0.0.0.0", r"server\.port": 8080})
+           MappingConfigData({'server': {'host': '0.0.0.0', 'port': 8080}})
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        for path, value in values.items():
+            self.modify(path, value, allow_create=allow_create)
+        return self
+
     @abstractmethod
     def __contains__(self, key: Any) -> bool: ...
 
@@ -602,6 +693,139 @@ class ABCProcessorHelper(ABC):  # noqa: B024
         return os.path.normpath(os.path.join(root_path, namespace, file_name))
 
 
+type _FileNameMatch = str | Pattern[str]
+
+
+class FileNameProcessorTable(OrderedDict[_FileNameMatch, list[str]]):
+    """
+    带有文件名索引的 :py:attr:`ABCSLProcessorPool.FileNameProcessors`
+
+    字符串匹配按长度分桶存入哈希表，查找时只需对每种已注册的长度切片一次，
+    正则匹配逐个尝试，匹配结果按文件名缓存，表被修改后在下次查找时重建索引
+
+    .. caution::
+       值列表可以原地修改，但新增或删除键必须通过字典方法进行
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    memo_size: int = 1024
+    """
+    按文件名缓存的匹配结果数量上限
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        :param args: 传递给 :py:class:`~collections.OrderedDict` 的位置参数
+        :param kwargs: 传递给 :py:class:`~collections.OrderedDict` 的关键字参数
+        """  # noqa: D205
+        self._lookup: Callable[[str], tuple[_FileNameMatch, ...]] | None = None
+        super().__init__(*args, **kwargs)
+
+    def match(self, file_name: str) -> tuple[_FileNameMatch, ...]:
+        """
+        获取与文件名匹配的所有键
+
+        :param file_name: 文件名
+        :type file_name: str
+
+        :return: 匹配的键，按表中的顺序排列
+        :rtype: tuple[str | Pattern[str], ...]
+        """  # noqa: RUF002
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._lookup = self._build()
+        return lookup(file_name)
+
+    def _build(self) -> Callable[[str], tuple[_FileNameMatch, ...]]:
+        """
+        重建索引
+
+        :return: 带缓存的查找函数
+        :rtype: Callable[[str], tuple[str | Pattern[str], ...]]
+        """
+        order: dict[_FileNameMatch, int] = {}
+        suffixes: dict[str, str] = {}
+        patterns: list[Pattern[str]] = []
+        for i, key in enumerate(self):
+            order[key] = i
+            if isinstance(key, str):
+                suffixes[key] = key
+            else:
+                patterns.append(key)
+        lengths = tuple(sorted({len(suffix) for suffix in suffixes}, reverse=True))
+        # 空后缀总是匹配, 单独处理以免切片file_name[-0:]得到整个文件名
+        always = ("",) if "" in suffixes else ()
+        lengths = tuple(length for length in lengths if length)
+
+        @lru_cache(maxsize=self.memo_size)
+        def lookup(file_name: str) -> tuple[_FileNameMatch, ...]:
+            matched: list[_FileNameMatch] = [*always]
+            for length in lengths:
+                suffix = suffixes.get(file_name[-length:])
+                if suffix is not None:
+                    matched.append(suffix)
+            # 正则各自的分组、内联标志与反向引用无法安全地合并为一个表达式
+            matched.extend(pattern for pattern in patterns if pattern.fullmatch(file_name))
+            matched.sort(key=order.__getitem__)
+            return tuple(matched)
+
+        return lookup
+
+    def _invalidate(self) -> None:
+        """使索引失效"""
+        self._lookup = None
+
+    @override
+    def __setitem__(self, key: _FileNameMatch, value: list[str]) -> None:
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    @override
+    def __delitem__(self, key: _FileNameMatch) -> None:
+        super().__delitem__(key)
+        self._invalidate()
+
+    @override
+    def move_to_end(self, key: _FileNameMatch, last: bool = True) -> None:
+        super().move_to_end(key, last)
+        self._invalidate()
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    @override
+    def pop(self, key: _FileNameMatch, *args: Any) -> Any:
+        result = super().pop(key, *args)
+        self._invalidate()
+        return result
+
+    @override
+    def popitem(self, last: bool = True) -> tuple[_FileNameMatch, list[str]]:
+        result = super().popitem(last)
+        self._invalidate()
+        return result
+
+    @override
+    def setdefault(self, key: _FileNameMatch, default: Any = None) -> Any:
+        result = super().setdefault(key, default)
+        self._invalidate()
+        return result
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    @override
+    def __ior__(self, other: Any) -> Any:
+        result = super().__ior__(other)
+        self._invalidate()
+        return result
+
+
 class ABCSLProcessorPool(ABC):
     """SL处理器池"""
 
@@ -619,9 +843,7 @@ class ABCSLProcessorPool(ABC):
         .. versionchanged:: 0.2.0
            重命名 ``SLProcessor`` 为 ``SLProcessors``
         """
-        self.FileNameProcessors: OrderedDict[str | Pattern[str], list[str]] = (
-            OrderedDict()
-        )  # {FileNameMatch: [RegName]}
+        self.FileNameProcessors: FileNameProcessorTable = FileNameProcessorTable()  # {FileNameMatch: [RegName]}
         # noinspection SpellCheckingInspection
         """
         文件名处理器注册表
@@ -639,6 +861,9 @@ class ABCSLProcessorPool(ABC):
            重命名 ``FileExtProcessor`` 为 ``FileNameProcessors``
 
            现在是顺序敏感的
+
+        .. versionchanged:: 0.3.1
+           类型改为 :py:class:`FileNameProcessorTable` 以建立文件名索引
         """  # noqa: RUF001
         self._root_path = root_path
 
@@ -672,6 +897,7 @@ class ABCConfigFile[D: ABCConfigData](ABC):
         self._config: D = initial_config
 
         self._config_format: str | None = config_format
+        self._clean_state: tuple[D, int] | None = None
 
     @property
     def config(self) -> D:
@@ -691,6 +917,31 @@ class ABCConfigFile[D: ABCConfigData](ABC):
         """配置文件的格式"""
         return self._config_format
 
+    @property
+    def dirty(self) -> bool:
+        """
+        配置数据自上次 :py:meth:`mark_clean` 后是否可能被修改过
+
+        配置数据被替换或不追踪修改( :py:attr:`ABCConfigData.version` 为None)时总是视为被修改
+
+        .. versionadded:: 0.3.1
+        """
+        state = self._clean_state
+        return state is None or state[0] is not self._config or state[1] != self._config.version
+
+    def mark_clean(self) -> Self:
+        """
+        将当前的配置数据标记为与磁盘上的文件一致
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        .. versionadded:: 0.3.1
+        """
+        version = self._config.version
+        self._clean_state = None if version is None else (self._config, version)
+        return self
+
     @abstractmethod
     def save(
         self,
@@ -1067,6 +1318,22 @@ class ABCConfigSL(ABC):
            重命名 ``file_ext`` 为 ``supported_file_patterns``
         """
 
+    def sniff(self, head: bytes) -> float:  # noqa: ARG002
+        """
+        根据文件开头的内容判断文件是否可能由该处理器处理
+
+        文件名没有匹配任何处理器时，配置池按所有处理器的返回值从高到低尝试加载，返回值不大于0的处理器不会被尝试
+
+        :param head: 文件开头至多 :py:attr:`~config.basic.core.BasicConfigPool.sniff_size` 字节的内容
+        :type head: bytes
+
+        :return: 可能性，范围为0到1，默认实现总是返回0
+        :rtype: float
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return 0.0
+
     def register_to(self, config_pool: ABCSLProcessorPool) -> Self:
         """
         注册到配置池中
@@ -1149,6 +1416,72 @@ class ABCConfigSL(ABC):
            添加参数 ``processor_pool``
         """
 
+    async def asave(
+        self,
+        processor_pool: ABCSLProcessorPool,
+        config_file: ABCConfigFile[Any],
+        root_path: str,
+        namespace: str,
+        file_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :py:meth:`save` 的异步版本
+
+        默认在 :py:func:`~config.utils.default_executor` 中调用 :py:meth:`save`
+
+        :param processor_pool: 配置池
+        :type processor_pool: ABCSLProcessorPool
+        :param config_file: 待保存配置
+        :type config_file: ABCConfigFile
+        :param root_path: 保存的根目录
+        :type root_path: str
+        :param namespace: 配置的命名空间
+        :type namespace: str
+        :param file_name: 配置文件名
+        :type file_name: str
+
+        :raise FailedProcessConfigFileError: 处理配置文件失败
+
+        .. versionadded:: 0.3.1
+        """
+        await run_in_executor(
+            None, self.save, processor_pool, config_file, root_path, namespace, file_name, *args, **kwargs
+        )
+
+    async def aload(
+        self,
+        processor_pool: ABCSLProcessorPool,
+        root_path: str,
+        namespace: str,
+        file_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> ABCConfigFile[Any]:
+        """
+        :py:meth:`load` 的异步版本
+
+        默认在 :py:func:`~config.utils.default_executor` 中调用 :py:meth:`load`
+
+        :param processor_pool: 配置池
+        :type processor_pool: ABCSLProcessorPool
+        :param root_path: 保存的根目录
+        :type root_path: str
+        :param namespace: 配置的命名空间
+        :type namespace: str
+        :param file_name: 配置文件名
+        :type file_name: str
+
+        :return: 配置对象
+        :rtype: ABCConfigFile
+
+        :raise FailedProcessConfigFileError: 处理配置文件失败
+
+        .. versionadded:: 0.3.1
+        """
+        return await run_in_executor(None, self.load, processor_pool, root_path, namespace, file_name, *args, **kwargs)
+
     @abstractmethod
     def initialize(
         self,
@@ -1253,6 +1586,7 @@ __all__ = (
     "ABCProcessorHelper",
     "ABCSLProcessorPool",
     "AnyKey",
+    "FileNameProcessorTable",
     "PathLike",
     "SLArgumentType",
 )
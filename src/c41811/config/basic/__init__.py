@@ -23,6 +23,7 @@ if __TYPE_CHECKING:  # pragma: no cover
     from .core import BasicIndexedConfigData
     from .core import BasicSingleConfigData
     from .core import ConfigFile
+    from .core import PathAccessor
     from .core import PHelper
     from .environment import EnvironmentConfigData
     from .factory import ConfigDataFactory
@@ -32,6 +33,8 @@ if __TYPE_CHECKING:  # pragma: no cover
     from .number import NumberConfigData
     from .object import NoneConfigData
     from .object import ObjectConfigData
+    from .persistent import PersistentMappingConfigData
+    from .persistent import PersistentSequenceConfigData
     from .sequence import SequenceConfigData
     from .sequence import StringConfigData
 
@@ -54,6 +57,9 @@ if __TYPE_CHECKING:  # pragma: no cover
         "NumberConfigData",
         "ObjectConfigData",
         "PHelper",
+        "PathAccessor",
+        "PersistentMappingConfigData",
+        "PersistentSequenceConfigData",
         "SequenceConfigData",
         "StringConfigData",
     ]
@@ -79,6 +85,9 @@ else:
             "NumberConfigData": ".number",
             "ObjectConfigData": ".object",
             "PHelper": ".core",
+            "PathAccessor": ".core",
+            "PersistentMappingConfigData": ".persistent",
+            "PersistentSequenceConfigData": ".persistent",
             "SequenceConfigData": ".sequence",
             "StringConfigData": ".sequence",
         }
@@ -87,11 +96,11 @@ else:
 
     def __cfg_data_factory_types_lazy_initializer() -> None:
         from builtins import object as __object  # noqa: PLC0415
-        from collections import OrderedDict as __OrderedDict  # noqa: PLC0415
         from collections.abc import Mapping as __Mapping  # noqa: PLC0415
         from collections.abc import Sequence as __Sequence  # noqa: PLC0415
         from numbers import Number as __Number  # noqa: PLC0415
 
+        from .factory import _TypeDispatchTable  # noqa: PLC0415
         from .mapping import MappingConfigData  # noqa: PLC0415
         from .number import BoolConfigData  # noqa: PLC0415
         from .number import NumberConfigData  # noqa: PLC0415
@@ -100,11 +109,27 @@ else:
         from .sequence import SequenceConfigData  # noqa: PLC0415
         from .sequence import StringConfigData  # noqa: PLC0415
         from ..abc import ABCConfigData  # noqa: PLC0415
+        from ..errors import DependencyNotFoundError  # noqa: PLC0415
 
-        ConfigDataFactory.TYPES = __OrderedDict(
+        try:
+            from pyrsistent import PMap as __PMap  # noqa: PLC0415
+            from pyrsistent import PVector as __PVector  # noqa: PLC0415
+
+            from .persistent import PersistentMappingConfigData  # noqa: PLC0415
+            from .persistent import PersistentSequenceConfigData  # noqa: PLC0415
+
+            persistent_types: tuple[tuple[tuple[type, ...], type], ...] = (
+                ((__PMap,), PersistentMappingConfigData),
+                ((__PVector,), PersistentSequenceConfigData),
+            )
+        except (ImportError, DependencyNotFoundError):
+            persistent_types = ()
+
+        ConfigDataFactory.TYPES = _TypeDispatchTable(
             (
                 ((ABCConfigData,), lambda _: _),
                 ((type(None),), NoneConfigData),
+                *persistent_types,
                 ((__Mapping,), MappingConfigData),
                 ((str, bytes), StringConfigData),
                 ((__Sequence,), SequenceConfigData),
@@ -10,6 +10,7 @@
 from collections.abc import Callable
 from functools import update_wrapper
 from typing import Any
+from typing import cast
 
 import wrapt
 
@@ -44,8 +45,7 @@ def _generate_operators[S: Any](
 
     # noinspection PyTypeHints
     def inplace_op(self: S, other: Any) -> S:
-        self._data = inplace_func(self._data, other)
-        return self
+        return cast(S, self._apply_inplace(inplace_func, other))
 
     return forward_op, reverse_op, inplace_op
 
@@ -8,9 +8,11 @@
 """
 
 from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import MutableMapping
+from collections.abc import Sequence
 from contextlib import suppress
 from copy import deepcopy
 from dataclasses import dataclass
@@ -21,6 +23,9 @@ from typing import cast
 from typing import override
 
 from .core import BasicConfigData
+from .core import PathAccessor
+from .core import _PathTrie
+from .core import _retrieve_each
 from .factory import ConfigDataFactory
 from .utils import check_read_only
 from .utils import fmt_path
@@ -126,6 +131,9 @@ class ComponentConfigData[D: ABCIndexedConfigData[Any], M: ComponentMeta[Any]](
         redundant = self._members.keys() - self._filename2meta.keys()
         if missing | redundant:
             raise ComponentMemberMismatchError(missing=missing, redundant=redundant)
+        self._member_versions: tuple[tuple[D, int | None], ...] = tuple(
+            (member, member.version) for member in self._members.values()
+        )
 
     @property
     def meta(self) -> M:
@@ -159,6 +167,31 @@ class ComponentConfigData[D: ABCIndexedConfigData[Any], M: ComponentMeta[Any]](
         """组件数据是否为只读"""
         return not isinstance(self._members, MutableMapping)
 
+    @property
+    @override
+    def version(self) -> int | None:
+        """
+        组件的修改版本号，组件自身被修改或任意成员被修改、替换、删除后递增，任意成员不追踪修改时为None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        state: list[tuple[D, int | None]] = []
+        for member in self._members.values():
+            version = member.version
+            if version is None:
+                return None
+            state.append((member, version))
+
+        # 比较成员对象与其版本号的序列而不是求和, 替换成员时新成员的版本号可能更小
+        previous = self._member_versions
+        if len(state) != len(previous) or any(
+            member is not previous_member or version != previous_version
+            for (member, version), (previous_member, previous_version) in zip(state, previous, strict=True)
+        ):
+            self._member_versions = tuple(state)
+            self._version += 1
+        return self._version
+
     @property
     def filename2meta(self) -> Mapping[str, ComponentMember]:
         """文件名到成员元信息的映射"""
@@ -246,6 +279,196 @@ class ComponentConfigData[D: ABCIndexedConfigData[Any], M: ComponentMeta[Any]](
             ),
         )
 
+    @override
+    def retrieve_many(self, paths: Iterable[PathLike], *, return_raw_value: bool = False) -> list[Any]:
+        """
+        批量获取路径的值
+
+        整批路径按成员顺序一次性分派给各成员，每个成员只处理仍未解析的路径
+
+        :param paths: 路径
+        :type paths: Iterable[PathLike]
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 按输入顺序排列的路径的值
+        :rtype: list[Any]
+
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        results, failed = self._retrieve_many([fmt_path(path) for path in paths], return_raw_value=return_raw_value)
+        if failed:
+            raise failed[min(failed)]
+        return results
+
+    def _retrieve_many(
+        self, paths: Sequence[ABCPath[Any]], *, return_raw_value: bool
+    ) -> tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]:
+        """
+        批量解析成员配置数据并获取路径的值，不抛出路径相关的错误
+
+        与 :py:meth:`_resolve_members` 一致，多个成员都失败时仅保留其中 :py:attr:`KeyInfo.index` 最大的错误
+
+        :param paths: 路径
+        :type paths: Sequence[ABCPath[Any]]
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 按输入顺序排列的路径的值与获取失败的路径下标到错误的映射
+        :rtype: tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        results: list[Any] = [None] * len(paths)
+        failed: dict[int, RequiredPathNotFoundError | ConfigDataTypeError] = {}
+        selected, unselected = self._split_selected(paths)
+        jobs = [(indexes, [meta] if self._has_member(meta) else []) for meta, indexes in selected.items()]
+        jobs.append((unselected, self._meta.orders.read))
+
+        for indexes, order in jobs:
+            pending = indexes
+            if not order:
+                for index in pending:
+                    failed[index] = RequiredPathNotFoundError(
+                        key_info=KeyInfo(paths[index], paths[index][0], 0),
+                        operate=ConfigOperate.Read,
+                    )
+            for member in order:
+                if not pending:
+                    break
+                member_results, member_failed = _retrieve_member(
+                    self._member(member), [paths[index] for index in pending], return_raw_value=return_raw_value
+                )
+                unresolved: list[int] = []
+                for member_index, index in enumerate(pending):
+                    err = member_failed.get(member_index)
+                    if err is None:
+                        results[index] = member_results[member_index]
+                        failed.pop(index, None)
+                        continue
+                    if index not in failed or err.key_info.index > failed[index].key_info.index:
+                        failed[index] = err
+                    unresolved.append(index)
+                pending = unresolved
+        return results, failed
+
+    def _has_member(self, member: str) -> bool:
+        """
+        判断成员文件名或其别名是否存在
+
+        :param member: 成员名
+        :type member: str
+
+        :return: 成员是否存在
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        return member in self._members or member in self._alias2filename
+
+    @staticmethod
+    def _split_selected(paths: Sequence[ABCPath[Any]]) -> tuple[dict[str, list[int]], list[int]]:
+        """
+        将通过元信息指定了成员的路径按成员分组
+
+        :param paths: 路径
+        :type paths: Sequence[ABCPath[Any]]
+
+        :return: 成员名到路径下标的映射与未指定成员的路径下标
+        :rtype: tuple[dict[str, list[int]], list[int]]
+
+        .. versionadded:: 0.3.1
+        """
+        selected: dict[str, list[int]] = {}
+        unselected: list[int] = []
+        for index, path in enumerate(paths):
+            if path and (path[0].meta is not None):
+                selected.setdefault(path[0].meta, []).append(index)
+            else:
+                unselected.append(index)
+        return selected, unselected
+
+    @override
+    @check_read_only
+    def modify_many(self, values: Mapping[PathLike, Any], *, allow_create: bool = True) -> Self:
+        """
+        批量修改路径的值
+
+        整批路径先按 :py:attr:`~ComponentOrders.update` 一次性确定各自所在的成员，再按成员分组调用成员的
+        :py:meth:`~config.abc.ABCIndexedConfigData.modify_many` ，
+        不存在于任何成员中的路径与分组修改失败的路径最后按输入顺序逐个调用 :py:meth:`modify` 。
+        存在某个路径是另一个路径的前缀或指定了不存在的成员时，全部按输入顺序逐个调用 :py:meth:`modify`
+
+        .. attention::
+           抛出错误时其它成员中的路径可能已被修改
+
+        :param values: 路径到值的映射
+        :type values: Mapping[PathLike, Any]
+        :param allow_create: 是否允许创建不存在的路径，默认为True
+        :type allow_create: bool
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        :raise ConfigDataReadOnlyError: 配置数据为只读
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        items = [(fmt_path(path), value) for path, value in values.items()]
+        _, overlapping = _PathTrie.build(path for path, _ in items)
+        selected, pending = self._split_selected([path for path, _ in items])
+        if overlapping or not all(map(self._has_member, selected)):
+            for path, value in items:
+                self.modify(path, value, allow_create=allow_create)
+            return self
+
+        groups: dict[str, list[int]] = selected
+        rest: list[int] = []
+
+        # 一次性确定未指定成员的路径所在的成员
+        for member in self._meta.orders.update:
+            if not pending:
+                break
+            _, member_failed = _retrieve_member(
+                self._member(member), [items[index][0] for index in pending], return_raw_value=True
+            )
+            groups.setdefault(member, []).extend(
+                index for member_index, index in enumerate(pending) if member_index not in member_failed
+            )
+            pending = [index for member_index, index in enumerate(pending) if member_index in member_failed]
+        rest.extend(pending)
+
+        for member, indexes in groups.items():
+            try:
+                self._member(member).modify_many(dict(items[index] for index in indexes), allow_create=allow_create)
+            except (RequiredPathNotFoundError, ConfigDataTypeError):
+                rest.extend(indexes)
+        for index in sorted(rest):
+            self.modify(*items[index], allow_create=allow_create)
+        return self
+
+    def accessor(self, path: PathLike) -> PathAccessor[Self]:
+        """
+        将路径预编译为访问器
+
+        :param path: 路径
+        :type path: PathLike
+
+        :return: 路径访问器
+        :rtype: PathAccessor[Self]
+
+        .. note::
+           组件配置数据需要按顺序在成员间分派，访问器的每次访问都会直接调用对应方法
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return PathAccessor(self, path)
+
     @override
     @check_read_only
     def modify(self, path: PathLike, *args: Any, **kwargs: Any) -> Self:
@@ -487,6 +710,29 @@ class ComponentConfigData[D: ABCIndexedConfigData[Any], M: ComponentMeta[Any]](
         del self._members[index]  # type: ignore[attr-defined]
 
 
+def _retrieve_member(
+    member: ABCIndexedConfigData[Any], paths: Sequence[ABCPath[Any]], *, return_raw_value: bool
+) -> tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]:
+    """
+    批量获取成员配置数据中路径的值，不抛出路径相关的错误
+
+    :param member: 成员配置数据
+    :type member: ABCIndexedConfigData[Any]
+    :param paths: 路径
+    :type paths: Sequence[ABCPath[Any]]
+    :param return_raw_value: 是否获取原始值
+    :type return_raw_value: bool
+
+    :return: 按输入顺序排列的路径的值与获取失败的路径下标到错误的映射
+    :rtype: tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if isinstance(member, ComponentConfigData):
+        return member._retrieve_many(paths, return_raw_value=return_raw_value)  # noqa: SLF001
+    return _retrieve_each(member, paths, return_raw_value=return_raw_value)
+
+
 __all__ = (
     "ComponentConfigData",
     "ComponentMember",
@@ -7,17 +7,34 @@
 .. versionadded:: 0.2.0
 """
 
+import os
+import threading
+import time
+import warnings
 from abc import ABC
 from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Generator
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
+from collections.abc import MutableMapping
+from collections.abc import MutableSequence
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import contextmanager
 from contextlib import suppress
+from contextvars import ContextVar
+from contextvars import copy_context
+from copy import copy
 from copy import deepcopy
-from re import Pattern
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
+from typing import ClassVar
 from typing import Literal
 from typing import Self
 from typing import cast
@@ -25,6 +42,7 @@ from typing import overload
 from typing import override
 
 from .factory import ConfigDataFactory
+from .utils import _ModifyLock
 from .utils import check_read_only
 from .utils import fmt_path
 from .._protocols import Indexed
@@ -43,7 +61,144 @@ from ..errors import ConfigOperate
 from ..errors import FailedProcessConfigFileError
 from ..errors import KeyInfo
 from ..errors import RequiredPathNotFoundError
+from ..errors import UnsavedChangesError
 from ..errors import UnsupportedConfigFormatError
+from ..path import AttrKey
+from ..path import IndexKey
+from ..safe_writer import CommitBatch
+from ..safe_writer import Durability
+from ..safe_writer import batch_commit
+from ..safe_writer import current_batch
+from ..safe_writer import safe_open
+from ..utils import CopyPolicy
+from ..utils import Unset
+from ..utils import run_in_executor
+
+_DerivedCopyPolicy: ContextVar[CopyPolicy | None] = ContextVar("_DerivedCopyPolicy", default=None)
+"""
+创建派生配置数据时继承的拷贝策略
+"""
+
+
+class _CopyOnWrite:
+    """
+    记录快照之后由配置数据独占的容器节点
+
+    快照之后原配置数据与快照共享所有节点，修改前沿路径把共享的节点浅拷贝为独占节点，
+    未被修改的节点会一直被共享
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    __slots__ = ("limit", "owned")
+
+    _SHALLOW_COPY_TYPES: frozenset[type] = frozenset({dict, list, OrderedDict})
+    """
+    浅拷贝即可完整复制自身状态的容器类型，其余类型独占时会被深拷贝
+    """  # noqa: RUF001
+
+    def __init__(self) -> None:
+        self.owned: dict[int, Any] = {}
+        self.limit = 64
+
+    def own(self, node: Any, root: Any) -> Any:
+        """
+        获取节点的独占版本
+
+        :param node: 节点
+        :type node: Any
+        :param root: 当前的根节点，用于清理不再可达的独占节点
+        :type root: Any
+
+        :return: 可以原地修改的节点
+        :rtype: Any
+        """  # noqa: RUF002
+        if id(node) in self.owned or not isinstance(node, MutableMapping | MutableSequence):
+            return node
+        if len(self.owned) > self.limit:
+            self._prune(root)
+        copied = copy(node) if type(node) in self._SHALLOW_COPY_TYPES else deepcopy(node)
+        self.owned[id(copied)] = copied
+        return copied
+
+    def _prune(self, root: Any) -> None:
+        """
+        丢弃不再能从根节点到达的独占节点，避免无限增长
+
+        独占节点只会被挂在独占节点下，所以只需遍历独占节点
+
+        :param root: 根节点
+        :type root: Any
+        """  # noqa: RUF002
+        reachable: dict[int, Any] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) not in self.owned or id(node) in reachable:
+                continue
+            reachable[id(node)] = node
+            stack.extend(node.values() if isinstance(node, Mapping) else node)
+        self.owned = reachable
+        self.limit = max(64, len(reachable) * 2)
+
+
+class _PathTrie:
+    """
+    按公共前缀合并路径的前缀树
+
+    每个节点记录到达该节点的键与以该节点结尾的路径在输入中的下标，
+    子节点以键的类型，值与元信息组成的元组索引，避免反复调用键的 ``__hash__`` 与 ``__eq__``
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    __slots__ = ("children", "indexes", "key")
+
+    def __init__(self, key: AnyKey | None = None) -> None:
+        self.key = key
+        self.children: dict[tuple[type, Any, str | None], _PathTrie] = {}
+        self.indexes: list[int] = []
+
+    @classmethod
+    def build(cls, paths: Iterable[ABCPath[Any]]) -> tuple["_PathTrie", bool]:
+        """
+        由路径构建前缀树
+
+        :param paths: 路径
+        :type paths: Iterable[ABCPath[Any]]
+
+        :return: 前缀树根节点与是否存在某个路径是另一个路径的前缀
+        :rtype: tuple[_PathTrie, bool]
+        """
+        root = cls()
+        overlapping = False
+        for index, path in enumerate(paths):
+            node = root
+            for key in path:
+                if node.indexes:
+                    overlapping = True
+                ident = (type(key), key._key, key._meta)  # noqa: SLF001
+                child = node.children.get(ident)
+                if child is None:
+                    node.children[ident] = child = cls(key)
+                node = child
+            if node.children:
+                overlapping = True
+            node.indexes.append(index)
+        return root, overlapping
+
+    def all_indexes(self) -> Iterator[int]:
+        """
+        遍历子树中所有路径的下标
+
+        :return: 路径下标
+        :rtype: Iterator[int]
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.indexes
+            stack.extend(node.children.values())
 
 
 class BasicConfigData[D](ABCConfigData, ABC):
@@ -55,9 +210,13 @@ class BasicConfigData[D](ABCConfigData, ABC):
 
     .. versionchanged:: 0.2.0
        重命名 ``BaseConfigData`` 为 ``BasicConfigData``
+
+    .. versionchanged:: 0.3.1
+       追踪修改版本号 :py:attr:`version`
     """
 
     _read_only: bool | None = False
+    _version: int = 0
 
     @property
     @override
@@ -76,25 +235,102 @@ class BasicConfigData[D](ABCConfigData, ABC):
             raise ConfigDataReadOnlyError
         self._read_only = bool(value)
 
+    @property
+    @override
+    def version(self) -> int | None:
+        return self._version
+
+    def _touch(self) -> None:
+        """
+        标记配置数据已被修改，由 :py:func:`~config.basic.utils.check_read_only` 与其余修改方法调用
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        self._version += 1
+
 
 class BasicSingleConfigData[D](BasicConfigData[D], ABC):
     """
     单文件配置数据基类
 
     .. versionadded:: 0.2.0
+
+    .. versionchanged:: 0.3.1
+       拷贝原始数据时遵循 :py:attr:`copy_policy`
+    """
+
+    copy_policy: CopyPolicy = CopyPolicy.FAST
     """
+    向外返回原始数据时的拷贝策略，可以在类或实例上修改
+
+    由该配置数据派生出的配置数据(例如 :py:meth:`~config.abc.ABCIndexedConfigData.retrieve` 返回的子配置数据)会继承该策略
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
 
     def __init__(self, data: D):
         """
         :param data: 配置的原始数据
         :type data: Any
         """  # noqa: D205
-        self._data: D = deepcopy(data)
+        policy = _DerivedCopyPolicy.get()
+        if policy is not None and policy is not self.copy_policy:
+            self.copy_policy = policy
+        self._data: D = self.copy_policy.copy(data)
 
     @property
     def data(self) -> D:
         """配置的原始数据*快照*"""
-        return deepcopy(self._data)
+        return self.copy_policy.copy(self._data)
+
+    def _mutable_data(self) -> D:
+        """
+        获取可以原地修改的原始数据
+
+        :return: 原始数据
+        :rtype: D
+
+        .. versionadded:: 0.3.1
+        """
+        return self._data
+
+    def _apply_inplace(self, inplace_func: Callable[[Any, Any], Any], other: Any) -> Self:
+        """
+        对原始数据执行原地操作，由 :py:func:`~config.basic._generate_operators.generate` 生成的原地操作符调用
+
+        :param inplace_func: 原地操作函数
+        :type inplace_func: Callable[[Any, Any], Any]
+        :param other: 另一个操作数
+        :type other: Any
+
+        :return: 返回当前实例
+        :rtype: Self
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        self._touch()
+        self._data = inplace_func(self._mutable_data(), other)
+        return self
+
+    def _derive[R](self, factory: Callable[[Any], R], data: Any) -> R:
+        """
+        以当前拷贝策略创建派生的配置数据
+
+        :param factory: 配置数据工厂
+        :type factory: Callable[[Any], R]
+        :param data: 原始数据
+        :type data: Any
+
+        :return: 派生的配置数据
+        :rtype: R
+
+        .. versionadded:: 0.3.1
+        """
+        token = _DerivedCopyPolicy.set(self.copy_policy)
+        try:
+            return factory(data)
+        finally:
+            _DerivedCopyPolicy.reset(token)
 
     @override
     def __eq__(self, other: Any) -> bool:
@@ -128,13 +364,91 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
 
     .. versionchanged:: 0.2.0
        重命名 ``BaseSupportsIndexConfigData`` 为 ``BasicIndexedConfigData``
+
+    .. versionchanged:: 0.3.1
+       :py:meth:`snapshot` 与 :py:func:`copy.deepcopy` 改为写时复制
     """
 
+    _cow: _CopyOnWrite | None = None
+
+    _FAST_PATH_METHODS: ClassVar[frozenset[str]] = frozenset({"retrieve", "exists", "modify", "delete"})
+    """
+    本类定义的可以被 :py:class:`PathAccessor` 与批量操作绕过而直接访问内部数据的方法
+
+    子类复写这些方法且行为不变时需要在自身重新声明，否则快速路径会回退到调用对应方法
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
+
+    _fast_write: bool = True
+    """
+    是否允许 :py:class:`PathAccessor` 与批量修改绕过 :py:meth:`modify` 与 :py:meth:`delete` 直接写入内部数据，
+    实例需要同步维护额外状态时置为False
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
+
+    @override
+    def snapshot(self) -> Self:
+        """
+        获取配置数据的写时复制快照
+
+        快照本身是O(1)的，快照与原配置数据共享所有节点，任意一方修改时才会沿修改路径复制被共享的节点
+
+        获取快照与修改配置数据互斥，其他线程正在进行的修改要么完整地出现在快照中，要么完全不出现
+
+        :return: 配置数据快照
+        :rtype: Self
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        # 替换写时复制状态的同时不能有写入者持有旧状态下的独占节点
+        with _ModifyLock:
+            token = _DerivedCopyPolicy.set(CopyPolicy.NONE)
+            try:
+                result = self.from_data(self._data)
+            finally:
+                _DerivedCopyPolicy.reset(token)
+            self._cow = _CopyOnWrite()
+        vars(result).pop("copy_policy", None)
+        if result.copy_policy is not self.copy_policy:
+            result.copy_policy = self.copy_policy
+
+        result._cow = _CopyOnWrite()  # noqa: SLF001
+        return result
+
+    @override
+    def __deepcopy__(self, memo: dict[Any, Any]) -> Self:
+        # 同一次深拷贝中多次引用同一个配置数据时返回同一个快照
+        with suppress(KeyError):
+            return cast(Self, memo[id(self)])
+        result = memo[id(self)] = self.snapshot()
+        return result
+
+    @override
+    def _mutable_data(self) -> D:
+        if self._cow is not None:
+            self._data = self._cow.own(self._data, self._data)
+        return self._data
+
+    def _unshare(self) -> None:
+        """
+        完全脱离与快照共享的数据，用于需要向外暴露内部数据引用的场景
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        with _ModifyLock:
+            if self._cow is not None:
+                self._data = deepcopy(self._data)
+                self._cow = None
+
     def _process_path[X, Y](
         self,
         path: ABCPath[Any],
-        path_checker: Callable[[Any, AnyKey, ABCPath[Any], int], X],
+        path_checker: Callable[[Any, AnyKey, int, int], X],
         process_return: Callable[[Any], Y],
+        *,
+        mutable: bool = False,
     ) -> X | Y:
         # noinspection GrazieInspection
         """
@@ -144,26 +458,40 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
         :type path: ABCPath
         :param path_checker: 检查并处理每个路径段，返回值非None时结束操作并返回值
         :type path_checker:
-            Callable[(current_data: Any, current_key: ABCKey, last_path: ABCPath, path_index: int), X]
+            Callable[(current_data: Any, current_key: ABCKey, remaining: int, path_index: int), X]
         :param process_return: 处理最终结果，该函数返回值会被直接返回
         :type process_return: Callable[(current_data: Any), Y]
+        :param mutable: 是否会修改路径上的数据，为真时沿路径复制与快照共享的节点
+        :type mutable: bool
 
         :return: 处理结果
         :rtype: X | Y
 
         .. versionchanged:: 0.2.0
            重命名参数 ``process_check`` 为 ``path_checker``
+
+        .. versionchanged:: 0.3.1
+           ``path_checker`` 的第三个参数由剩余路径 ``last_path`` 改为剩余键数 ``remaining`` ，
+           避免每个路径段都切片创建一次路径对象
+
+           添加参数 ``mutable``
         """  # noqa: RUF002
-        current_data = self._data
+        cow = self._cow if mutable else None
+        current_data = self._mutable_data() if cow is not None else self._data
+        last_index = len(path) - 1
 
         for key_index, current_key in enumerate(path):
-            last_path: ABCPath[Any] = path[key_index + 1 :]
-
-            check_result = path_checker(current_data, current_key, last_path, key_index)
+            check_result = path_checker(current_data, current_key, last_index - key_index, key_index)
             if check_result is not None:
                 return check_result
 
-            current_data = current_key.__get_inner_element__(current_data)
+            inner_data = current_key.__get_inner_element__(current_data)
+            if cow is not None and key_index != last_index:
+                owned_data = cow.own(inner_data, self._data)
+                if owned_data is not inner_data:
+                    current_key.__set_inner_element__(current_data, owned_data)
+                inner_data = owned_data
+            current_data = inner_data
 
         return process_return(current_data)
 
@@ -171,7 +499,7 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
     def retrieve(self, path: PathLike, *, return_raw_value: bool = False) -> Any:
         path = fmt_path(path)
 
-        def checker(current_data: Any, current_key: AnyKey, _last_path: ABCPath[Any], key_index: int) -> None:
+        def checker(current_data: Any, current_key: AnyKey, _remaining: int, key_index: int) -> None:
             missing_protocol = current_key.__supports__(current_data)
             if missing_protocol:
                 raise ConfigDataTypeError(
@@ -182,24 +510,230 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
                     KeyInfo(cast(ABCPath[Any], path), current_key, key_index), ConfigOperate.Read
                 )
 
-        def process_return[V: Any](current_data: V) -> V | ABCConfigData:
-            if return_raw_value:
-                return deepcopy(current_data)
+        def process_return(current_data: Any) -> Any:
+            return self._retrieved(current_data, return_raw_value=return_raw_value)
+
+        return self._process_path(path, checker, process_return)
+
+    def _retrieved(self, current_data: Any, *, return_raw_value: bool) -> Any:
+        """
+        将路径上取得的原始值转换为 :py:meth:`retrieve` 的返回值
 
-            is_sequence = isinstance(current_data, Sequence) and not isinstance(current_data, str | bytes)
-            if isinstance(current_data, Mapping) or is_sequence:
-                return ConfigDataFactory(current_data)  # type: ignore[return-value]
+        :param current_data: 路径上的原始值
+        :type current_data: Any
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
 
-            return deepcopy(current_data)
+        :return: 转换后的返回值
+        :rtype: Any
 
-        return self._process_path(path, checker, process_return)
+        .. versionadded:: 0.3.1
+        """
+        if return_raw_value:
+            return self.copy_policy.copy(current_data)
+
+        data_type = type(current_data)
+        is_sequence = _is_subtype(data_type, Sequence) and not issubclass(data_type, str | bytes)
+        if _is_subtype(data_type, Mapping) or is_sequence:
+            return self._derive(ConfigDataFactory, current_data)
+
+        return self.copy_policy.copy(current_data)
+
+    @override
+    def retrieve_many(self, paths: Iterable[PathLike], *, return_raw_value: bool = False) -> list[Any]:
+        """
+        批量获取路径的值
+
+        路径会先合并为前缀树，每段公共前缀只遍历一次，结果与错误均与按输入顺序逐个调用 :py:meth:`retrieve` 一致
+
+        :param paths: 路径
+        :type paths: Iterable[PathLike]
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 按输入顺序排列的路径的值
+        :rtype: list[Any]
+
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        results, failed = self._retrieve_many([fmt_path(path) for path in paths], return_raw_value=return_raw_value)
+        if failed:
+            raise failed[min(failed)]
+        return results
+
+    def _retrieve_many(
+        self, paths: Sequence[ABCPath[Any]], *, return_raw_value: bool
+    ) -> tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]:
+        """
+        批量获取路径的值，不抛出路径相关的错误
+
+        :param paths: 路径
+        :type paths: Sequence[ABCPath[Any]]
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 按输入顺序排列的路径的值与获取失败的路径下标到错误的映射
+        :rtype: tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        if not _fast_path_compatible(type(self), "retrieve"):
+            return _retrieve_each(self, paths, return_raw_value=return_raw_value)
+
+        trie, _ = _PathTrie.build(paths)
+        results: list[Any] = [None] * len(paths)
+        failed_indexes: list[int] = []
+        stack: list[tuple[_PathTrie, Any]] = [(trie, self._data)]
+        while stack:
+            node, current_data = stack.pop()
+            for index in node.indexes:
+                results[index] = self._retrieved(current_data, return_raw_value=return_raw_value)
+            for child in node.children.values():
+                inner_data = _inner_element(current_data, cast(AnyKey, child.key))
+                if inner_data is Unset:
+                    failed_indexes.extend(child.all_indexes())
+                    continue
+                if child.children:
+                    stack.append((child, inner_data))
+                    continue
+                for index in child.indexes:
+                    results[index] = self._retrieved(inner_data, return_raw_value=return_raw_value)
+
+        # 失败的路径交由retrieve重新处理以得到完全一致的错误
+        failed: dict[int, RequiredPathNotFoundError | ConfigDataTypeError] = {}
+        for index in failed_indexes:
+            try:
+                results[index] = self.retrieve(paths[index], return_raw_value=return_raw_value)
+            except (RequiredPathNotFoundError, ConfigDataTypeError) as err:
+                failed[index] = err
+        return results, failed
+
+    @override
+    @check_read_only
+    def modify_many(self, values: Mapping[PathLike, Any], *, allow_create: bool = True) -> Self:
+        """
+        批量修改路径的值
+
+        路径会先合并为前缀树并完整检查一遍，全部可以修改时每段公共前缀只遍历一次并只检查一次只读，
+        同一容器内的修改按输入顺序进行。
+        存在某个路径是另一个路径的前缀或任意路径无法修改时，按输入顺序逐个调用 :py:meth:`modify` ，
+        以保证结果与错误完全一致
+
+        :param values: 路径到值的映射
+        :type values: Mapping[PathLike, Any]
+        :param allow_create: 是否允许创建不存在的路径，默认为True
+        :type allow_create: bool
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        :raise ConfigDataReadOnlyError: 配置数据为只读
+        :raise ConfigDataTypeError: 配置数据类型错误
+        :raise RequiredPathNotFoundError: 需求的键不存在
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        items = [(fmt_path(path), value) for path, value in values.items()]
+        if not (self._fast_write and _fast_path_compatible(type(self), "modify")):
+            return super().modify_many(dict(items), allow_create=allow_create)
+
+        trie, overlapping = _PathTrie.build(path for path, _ in items)
+        if overlapping or not self._can_modify_trie(trie, allow_create=allow_create):
+            for path, value in items:
+                self.modify(path, value, allow_create=allow_create)
+            return self
+
+        self._modify_trie(trie, [value for _, value in items])
+        return self
+
+    def _modify_trie(self, trie: _PathTrie, values: list[Any]) -> None:
+        """
+        沿前缀树修改路径的值，需要先通过 :py:meth:`_can_modify_trie` 检查
+
+        :param trie: 前缀树
+        :type trie: _PathTrie
+        :param values: 按路径下标排列的值
+        :type values: list[Any]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        cow = self._cow
+        stack: list[tuple[_PathTrie, Any]] = [(trie, self._mutable_data() if cow is not None else self._data)]
+        while stack:
+            node, current_data = stack.pop()
+            leaves: list[tuple[int, AnyKey]] = []
+            for child in node.children.values():
+                key = cast(AnyKey, child.key)
+                if not child.children:
+                    leaves.append((child.indexes[-1], key))
+                    continue
+                if not key.__contains_inner_element__(current_data):
+                    key.__set_inner_element__(current_data, type(self._data)())
+                inner_data = key.__get_inner_element__(current_data)
+                if cow is not None:
+                    owned_data = cow.own(inner_data, self._data)
+                    if owned_data is not inner_data:
+                        key.__set_inner_element__(current_data, owned_data)
+                    inner_data = owned_data
+                stack.append((child, inner_data))
+            for index, key in sorted(leaves, key=itemgetter(0)):
+                key.__set_inner_element__(current_data, values[index])
+
+    def _can_modify_trie(self, trie: _PathTrie, *, allow_create: bool) -> bool:
+        """
+        检查前缀树中的所有路径是否都可以直接修改
+
+        :param trie: 前缀树
+        :type trie: _PathTrie
+        :param allow_create: 是否允许创建不存在的路径
+        :type allow_create: bool
+
+        :return: 是否都可以直接修改
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        stack: list[tuple[_PathTrie, Any]] = [(trie, self._data)]
+        while stack:
+            node, current_data = stack.pop()
+            for child in node.children.values():
+                key = cast(AnyKey, child.key)
+                if key.__supports_modify__(current_data):
+                    return False
+                if key.__contains_inner_element__(current_data):
+                    if child.children:
+                        stack.append((child, key.__get_inner_element__(current_data)))
+                    continue
+                # 只有映射能够保证创建不存在的键时不会出错
+                if not allow_create or type(key) is not AttrKey:
+                    return False
+                if child.children:
+                    stack.append((child, type(self._data)()))
+        return True
+
+    def accessor(self, path: PathLike) -> "PathAccessor[Self]":
+        """
+        将路径预编译为访问器
+
+        :param path: 路径
+        :type path: PathLike
+
+        :return: 路径访问器
+        :rtype: PathAccessor[Self]
+
+        .. versionadded:: 0.3.1
+        """
+        return PathAccessor(self, path)
 
     @override
     @check_read_only
     def modify(self, path: PathLike, value: Any, *, allow_create: bool = True) -> Self:
         path = fmt_path(path)
 
-        def checker(current_data: Any, current_key: AnyKey, last_path: ABCPath[Any], key_index: int) -> None:
+        def checker(current_data: Any, current_key: AnyKey, remaining: int, key_index: int) -> None:
             missing_protocol = current_key.__supports_modify__(current_data)
             if missing_protocol:
                 raise ConfigDataTypeError(
@@ -212,10 +746,10 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
                     )
                 current_key.__set_inner_element__(current_data, type(self._data)())
 
-            if not last_path:
+            if not remaining:
                 current_key.__set_inner_element__(current_data, value)
 
-        self._process_path(path, checker, lambda *_: None)
+        self._process_path(path, checker, lambda *_: None, mutable=True)
         return self
 
     @override
@@ -226,7 +760,7 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
         def checker(
             current_data: Any,
             current_key: AnyKey,
-            last_path: ABCPath[Any],
+            remaining: int,
             key_index: int,
         ) -> Literal[True] | None:
             missing_protocol = current_key.__supports_modify__(current_data)
@@ -239,12 +773,12 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
                     KeyInfo(cast(ABCPath[Any], path), current_key, key_index), ConfigOperate.Delete
                 )
 
-            if not last_path:
+            if not remaining:
                 current_key.__delete_inner_element__(current_data)
                 return True
             return None  # 被mypy强制要求
 
-        self._process_path(path, checker, lambda *_: None)
+        self._process_path(path, checker, lambda *_: None, mutable=True)
         return self
 
     @override
@@ -257,7 +791,7 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
     def exists(self, path: PathLike, *, ignore_wrong_type: bool = False) -> bool:
         path = fmt_path(path)
 
-        def checker(current_data: Any, current_key: AnyKey, _last_path: ABCPath[Any], key_index: int) -> bool | None:
+        def checker(current_data: Any, current_key: AnyKey, _remaining: int, key_index: int) -> bool | None:
             missing_protocol = current_key.__supports__(current_data)
             if missing_protocol:
                 if ignore_wrong_type:
@@ -303,16 +837,325 @@ class BasicIndexedConfigData[D: Indexed[Any, Any]](BasicSingleConfigData[D], ABC
         data = self._data[index]
         is_sequence = isinstance(data, Sequence) and not isinstance(data, str | bytes)
         if isinstance(data, Mapping) or is_sequence:
-            return cast(Self, ConfigDataFactory(data))
-        return cast(D, deepcopy(data))
+            return cast(Self, self._derive(ConfigDataFactory, data))
+        return cast(D, self.copy_policy.copy(data))
 
     @override
     def __setitem__(self, index: Any, value: Any) -> None:
-        self._data[index] = value  # type: ignore[index]
+        with _ModifyLock:
+            self._touch()
+            self._mutable_data()[index] = value  # type: ignore[index]
 
     @override
     def __delitem__(self, index: Any) -> None:
-        del self._data[index]  # type: ignore[attr-defined]
+        with _ModifyLock:
+            self._touch()
+            del self._mutable_data()[index]  # type: ignore[attr-defined]
+
+
+def _issubclass(cls: type, base: type) -> bool:
+    """
+    带缓存的 :py:func:`issubclass` ，避免抽象基类每次实例检查的开销
+
+    :param cls: 类
+    :type cls: type
+    :param base: 基类
+    :type base: type
+
+    :return: 是否为子类
+    :rtype: bool
+    """  # noqa: RUF002
+    return issubclass(cls, base)
+
+
+_is_subtype = cast(Callable[[type, type], bool], lru_cache(maxsize=512)(_issubclass))
+
+
+def _retrieve_each(
+    config: ABCIndexedConfigData[Any], paths: Sequence[ABCPath[Any]], *, return_raw_value: bool
+) -> tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]:
+    """
+    逐个获取路径的值，不抛出路径相关的错误
+
+    :param config: 配置数据
+    :type config: ABCIndexedConfigData[Any]
+    :param paths: 路径
+    :type paths: Sequence[ABCPath[Any]]
+    :param return_raw_value: 是否获取原始值
+    :type return_raw_value: bool
+
+    :return: 按输入顺序排列的路径的值与获取失败的路径下标到错误的映射
+    :rtype: tuple[list[Any], dict[int, RequiredPathNotFoundError | ConfigDataTypeError]]
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if isinstance(config, BasicIndexedConfigData) and _fast_path_compatible(type(config), "retrieve"):
+        return config._retrieve_many(paths, return_raw_value=return_raw_value)  # noqa: SLF001
+
+    results: list[Any] = []
+    failed: dict[int, RequiredPathNotFoundError | ConfigDataTypeError] = {}
+    for index, path in enumerate(paths):
+        try:
+            results.append(config.retrieve(path, return_raw_value=return_raw_value))
+        except (RequiredPathNotFoundError, ConfigDataTypeError) as err:
+            results.append(None)
+            failed[index] = err
+    return results, failed
+
+
+def _inner_element(data: Any, key: AnyKey) -> Any:
+    """
+    获取键对应的内部元素
+
+    :param data: 配置数据
+    :type data: Any
+    :param key: 键
+    :type key: AnyKey
+
+    :return: 内部元素，类型不支持或键不存在时为 :py:const:`~config.utils.Unset`
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if type(key) is AttrKey:
+        # 最常见的映射键直接内联判断, 省去三次键方法调用
+        if _is_subtype(type(data), Mapping) and key._key in data:  # noqa: SLF001
+            return data[key._key]  # noqa: SLF001
+        return Unset
+    if key.__supports__(data) or not key.__contains_inner_element__(data):
+        return Unset
+    return key.__get_inner_element__(data)
+
+
+def _fast_path_compatible(cls: type, name: str) -> bool:
+    """
+    判断类的方法是否可以被快速路径绕过
+
+    即定义该方法的类在自身的 ``_FAST_PATH_METHODS`` 中声明了该方法，未声明的复写视为不兼容
+
+    :param cls: 类
+    :type cls: type
+    :param name: 方法名
+    :type name: str
+
+    :return: 是否可以绕过
+    :rtype: bool
+    """  # noqa: RUF002
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return name in vars(klass).get("_FAST_PATH_METHODS", ())
+    return False  # pragma: no cover
+
+
+class PathAccessor[C: ABCIndexedConfigData[Any]]:
+    """
+    预编译的路径访问器
+
+    路径只会在创建时解析一次，对 :py:class:`BasicIndexedConfigData` 且路径仅由
+    :py:class:`~config.path.AttrKey` 与 :py:class:`~config.path.IndexKey` 组成时，
+    每次访问只执行一个最小的循环，遇到任何异常情况(类型错误，路径不存在等)时回退到配置数据的对应方法以抛出相同的错误，
+    其余情况直接调用配置数据的对应方法
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    __slots__ = ("_config", "_fast_delete", "_fast_exists", "_fast_modify", "_fast_retrieve", "_path", "_steps")
+
+    def __init__(self, config: C, path: PathLike):
+        """
+        :param config: 配置数据
+        :type config: C
+        :param path: 路径
+        :type path: PathLike
+        """  # noqa: D205
+        self._config = config
+        self._path: ABCPath[Any] = fmt_path(path)
+
+        steps: list[tuple[bool, Any]] = []
+        for key in self._path:
+            if type(key) not in {AttrKey, IndexKey}:
+                break
+            steps.append((type(key) is AttrKey, key._key))  # noqa: SLF001
+        else:
+            if steps and isinstance(config, BasicIndexedConfigData):
+                self._steps: tuple[tuple[bool, Any], ...] = tuple(steps)
+                cls = type(config)
+                self._fast_retrieve = _fast_path_compatible(cls, "retrieve")
+                self._fast_exists = _fast_path_compatible(cls, "exists")
+                self._fast_modify = _fast_path_compatible(cls, "modify")
+                self._fast_delete = _fast_path_compatible(cls, "delete")
+                return
+        self._steps = ()
+        self._fast_retrieve = self._fast_exists = self._fast_modify = self._fast_delete = False
+
+    @property
+    def config(self) -> C:
+        """绑定的配置数据"""
+        return self._config
+
+    @property
+    def path(self) -> ABCPath[Any]:
+        """预编译的路径"""
+        return self._path
+
+    def get(self, *, return_raw_value: bool = False) -> Any:
+        """
+        获取路径的值
+
+        :param return_raw_value: 是否获取原始值
+        :type return_raw_value: bool
+
+        :return: 路径的值
+        :rtype: Any
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.retrieve`
+        """
+        config = self._config
+        if not self._fast_retrieve:
+            return config.retrieve(self._path, return_raw_value=return_raw_value)
+
+        current = config._data  # type: ignore[attr-defined]  # noqa: SLF001
+        for is_attr, key in self._steps:
+            if is_attr:
+                if not (_is_subtype(type(current), Mapping) and key in current):
+                    return config.retrieve(self._path, return_raw_value=return_raw_value)
+                current = current[key]
+                continue
+            if not _is_subtype(type(current), Sequence):
+                return config.retrieve(self._path, return_raw_value=return_raw_value)
+            try:
+                current = current[key]
+            except IndexError:
+                return config.retrieve(self._path, return_raw_value=return_raw_value)
+        return config._retrieved(current, return_raw_value=return_raw_value)  # type: ignore[attr-defined]  # noqa: SLF001
+
+    def exists(self, *, ignore_wrong_type: bool = False) -> bool:
+        """
+        判断路径是否存在
+
+        :param ignore_wrong_type: 忽略配置数据类型错误
+        :type ignore_wrong_type: bool
+
+        :return: 路径是否存在
+        :rtype: bool
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.exists`
+        """
+        config = self._config
+        if not self._fast_exists:
+            return config.exists(self._path, ignore_wrong_type=ignore_wrong_type)
+
+        current = config._data  # type: ignore[attr-defined]  # noqa: SLF001
+        for is_attr, key in self._steps:
+            if not _is_subtype(type(current), Mapping if is_attr else Sequence):
+                return config.exists(self._path, ignore_wrong_type=ignore_wrong_type)
+            if is_attr:
+                if key not in current:
+                    return False
+                current = current[key]
+                continue
+            try:
+                current = current[key]
+            except IndexError:
+                return False
+        return True
+
+    def set(self, value: Any, *, allow_create: bool = True) -> None:
+        """
+        修改路径的值
+
+        :param value: 值
+        :type value: Any
+        :param allow_create: 是否允许创建不存在的路径
+        :type allow_create: bool
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.modify`
+        """
+        # 持有锁直到修改完成, 避免快照共享已经取得的容器
+        with _ModifyLock:
+            current = self._parent() if self._fast_modify else None
+            if current is None:
+                self._config.modify(self._path, value, allow_create=allow_create)
+                return
+
+            is_attr, key = self._steps[-1]
+            if is_attr:
+                if not _is_subtype(type(current), MutableMapping) or (not allow_create and key not in current):
+                    self._config.modify(self._path, value, allow_create=allow_create)
+                    return
+            elif not (_is_subtype(type(current), MutableSequence) and -len(current) <= key < len(current)):
+                self._config.modify(self._path, value, allow_create=allow_create)
+                return
+            current[key] = value
+
+    def delete(self) -> None:
+        """
+        删除路径
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.delete`
+        """
+        # 持有锁直到修改完成, 避免快照共享已经取得的容器
+        with _ModifyLock:
+            current = self._parent() if self._fast_delete else None
+            if current is None:
+                self._config.delete(self._path)
+                return
+
+            is_attr, key = self._steps[-1]
+            if is_attr:
+                if not (_is_subtype(type(current), MutableMapping) and key in current):
+                    self._config.delete(self._path)
+                    return
+            elif not (_is_subtype(type(current), MutableSequence) and -len(current) <= key < len(current)):
+                self._config.delete(self._path)
+                return
+            del current[key]
+
+    def _parent(self) -> Any | None:
+        """
+        检查只读并获取路径最后一个键所在的可变容器，沿途复制与快照共享的节点
+
+        :return: 最后一个键所在的容器，需要回退到完整实现时为 :py:const:`None`
+        :rtype: Any | None
+
+        :raise ConfigDataReadOnlyError: 配置数据为只读
+        """  # noqa: RUF002
+        config = cast(BasicIndexedConfigData[Any], self._config)
+        if not config._fast_write:  # noqa: SLF001
+            return None
+        if config.read_only:
+            raise ConfigDataReadOnlyError
+        config._touch()  # noqa: SLF001
+        cow = config._cow  # noqa: SLF001
+        current = config._mutable_data() if cow is not None else config._data  # noqa: SLF001
+
+        for is_attr, key in self._steps[:-1]:
+            if is_attr:
+                if not (_is_subtype(type(current), MutableMapping) and key in current):
+                    return None
+                inner = current[key]
+            else:
+                if not _is_subtype(type(current), MutableSequence):
+                    return None
+                try:
+                    inner = current[key]
+                except IndexError:
+                    return None
+            if cow is not None:
+                owned = cow.own(inner, config._data)  # noqa: SLF001
+                if owned is not inner:
+                    current[key] = owned
+                inner = owned
+            current = inner
+        return current
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}({self._path.unparse()!r})>"
 
 
 class ConfigFile[D: ABCConfigData](ABCConfigFile[D]):
@@ -402,6 +1245,9 @@ class PHelper(ABCProcessorHelper):
     """处理器助手类"""
 
 
+type _LoadArguments = tuple[tuple[Any, ...], dict[str, Any], str | tuple[str, ...] | None, bool]
+
+
 class BasicConfigPool(ABCConfigPool, ABC):
     """
     基础配置池类
@@ -410,16 +1256,94 @@ class BasicConfigPool(ABCConfigPool, ABC):
 
     .. versionchanged:: 0.2.0
        重命名 ``BaseConfigPool`` 为 ``BasicConfigPool``
+
+    .. versionchanged:: 0.3.1
+       支持按文件状态重新验证缓存 :py:attr:`revalidate_interval`
+
+       现在是线程安全的，每个命名空间的文件字典在修改时整体替换(写时复制)，
+       修改同一命名空间时持有该命名空间的互斥锁，读取无需加锁，
+       :py:meth:`save_all` 等遍历操作基于注册表的浅拷贝快照而不再深拷贝
+    """  # noqa: RUF002
+
+    sniff_size: int = 4096
     """
+    文件名没有匹配任何SL处理器时读取文件开头用于判断格式的字节数，详见 :py:meth:`ABCConfigSL.sniff`
 
-    def __init__(self, root_path: str = "./.config"):
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
+
+    def __init__(
+        self,
+        root_path: str = "./.config",
+        *,
+        revalidate_interval: float | None = None,
+        executor: Executor | None = None,
+        durability: Durability = Durability.FILE_AND_DIR,
+    ):
         """
         :param root_path: 配置根路径
         :type root_path: str
+        :param revalidate_interval: 详见 :py:attr:`revalidate_interval`
+        :type revalidate_interval: float | None
+        :param executor: 详见 :py:attr:`executor`
+        :type executor: Executor | None
+        :param durability: 详见 :py:attr:`durability`
+        :type durability: Durability
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``revalidate_interval``
+
+           添加参数 ``executor``
+
+           添加参数 ``durability``
         """  # noqa: D205
         super().__init__(root_path)
         self._configs: dict[str, dict[str, ABCConfigFile[Any]]] = {}
         self._helper = PHelper()
+        self._file_stats: dict[tuple[str, str], tuple[tuple[int, int, int], float]] = {}
+        self._loading: dict[tuple[str, str], tuple[Future[ABCConfigFile[Any]], int, _LoadArguments]] = {}
+        self._loading_lock = threading.Lock()
+        self._namespace_locks: dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self._learned_formats: dict[tuple[str, str], str] = {}
+        self._failed_formats: dict[tuple[str, str], frozenset[str]] = {}
+
+        self.revalidate_interval = revalidate_interval
+        """
+        缓存的重新验证间隔(秒)，为None时不重新验证
+
+        不为None时 :py:meth:`load` 命中缓存后会比较文件当前与加载时的 ``(st_mtime_ns, st_size, st_ino)`` ，
+        不一致时重新加载文件，同一文件两次检查之间至少间隔该秒数以限制 ``stat`` 调用频率
+
+        缓存的配置文件有未保存的修改( :py:attr:`~config.abc.ABCConfigFile.dirty` )时保留内存中的配置文件并发出
+        :py:class:`RuntimeWarning` ，之后保存会覆盖磁盘上的修改
+
+        .. note::
+           只对位于 :py:meth:`~config.abc.ABCProcessorHelper.calc_path` 计算出的路径上的文件生效，
+           其余缓存与未启用时一样一直有效
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF001
+
+        self.executor = executor
+        """
+        异步接口执行阻塞操作的线程池，为None时使用 :py:func:`~config.utils.default_executor`
+
+        .. note::
+           每个异步调用在完成前都占用线程池中的一个线程，包括等待文件锁与等待其他线程加载同一文件的时间，
+           线程池的线程都被占用时之后的调用会排队等待。
+           默认线程池由所有配置池共享，需要隔离或限制某个配置池的并发数时传入独立的线程池，
+           例如 ``ThreadPoolExecutor(max_workers=4)``
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF001
+
+        self.durability = durability
+        """
+        SL处理器写入文件时的默认持久化级别，SL处理器自身设置了 ``durability`` 时以SL处理器为准
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF001
 
     @property
     @override
@@ -447,26 +1371,208 @@ class BasicConfigPool(ABCConfigPool, ABC):
         namespace: str,
         file_name: str | None = None,
     ) -> dict[str, ABCConfigFile[Any]] | ABCConfigFile[Any] | None:
-        if namespace not in self._configs:
+        result = self._configs.get(namespace)
+        if result is None:
             return None
-        result = self._configs[namespace]
 
         if file_name is None:
             return result
 
-        if file_name in result:
-            return result[file_name]
-
-        return None
+        return result.get(file_name)
 
     @override
     def set(self, namespace: str, file_name: str, config: ABCConfigFile[Any]) -> Self:
-        if namespace not in self._configs:
-            self._configs[namespace] = {}
-
-        self._configs[namespace][file_name] = config
+        with self._namespace_lock(namespace):
+            files = dict(self._configs.get(namespace, {}))
+            files[file_name] = config
+            self._configs[namespace] = files
+            self._file_stats.pop((namespace, file_name), None)
         return self
 
+    def _namespace_lock(self, namespace: str) -> threading.Lock:
+        """
+        获取命名空间的互斥锁
+
+        :param namespace: 命名空间
+        :type namespace: str
+
+        :return: 修改该命名空间时需要持有的锁
+        :rtype: threading.Lock
+
+        .. versionadded:: 0.3.1
+        """
+        lock = self._namespace_locks.get(namespace)
+        if lock is None:
+            with self._registry_lock:
+                lock = self._namespace_locks.setdefault(namespace, threading.Lock())
+        return lock
+
+    def _stat(self, namespace: str, file_name: str) -> tuple[int, int, int] | None:
+        """
+        获取配置文件的状态签名
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+
+        :return: ``(st_mtime_ns, st_size, st_ino)`` ，文件不存在时为None
+        :rtype: tuple[int, int, int] | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        try:
+            stat = os.stat(self.helper.calc_path(self.root_path, namespace, file_name))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _record_stat(self, namespace: str, file_name: str, signature: tuple[int, int, int] | None) -> None:
+        """
+        记录配置文件的状态签名
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param signature: 状态签名，为None时不记录
+        :type signature: tuple[int, int, int] | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        if signature is not None:
+            self._file_stats[namespace, file_name] = (signature, time.monotonic())
+
+    def _is_stale(self, namespace: str, file_name: str) -> bool:
+        """
+        检查缓存的配置文件是否已在磁盘上被修改
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+
+        :return: 是否需要重新加载
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        interval = self.revalidate_interval
+        if interval is None:
+            return False
+        record = self._file_stats.get((namespace, file_name))
+        if record is None:
+            return False
+
+        signature, checked = record
+        now = time.monotonic()
+        if now - checked < interval:
+            return False
+        current = self._stat(namespace, file_name)
+        if current is None:
+            return False
+        if current != signature:
+            # 不更新检查时间, 由重新加载记录新的状态, 避免aload委托给load时再次检查被间隔跳过
+            return True
+        self._file_stats[namespace, file_name] = (signature, now)
+        return False
+
+    def _reusable(self, namespace: str, file_name: str, cache: ABCConfigFile[Any]) -> bool:
+        """
+        检查缓存的配置文件能否直接返回
+
+        文件在磁盘上被修改但缓存的配置文件有未保存的修改时发出警告并保留缓存，
+        同时记录文件当前的状态，同一次修改只警告一次
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param cache: 缓存的配置文件
+        :type cache: ABCConfigFile[Any]
+
+        :return: 能否直接返回缓存
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        if not self._is_stale(namespace, file_name):
+            return True
+        if not cache.dirty:
+            return False
+        warnings.warn(
+            f"config file {namespace!r} {file_name!r} was modified on disk but has unsaved changes, "
+            "keeping the in-memory copy",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        self._record_stat(namespace, file_name, self._stat(namespace, file_name))
+        return True
+
+    def tracked_files(self) -> dict[tuple[str, str], str]:
+        """
+        获取记录了文件状态的配置文件
+
+        即通过 :py:meth:`load` 或 :py:meth:`save` 与磁盘上的文件对应的配置文件
+
+        :return: ``(命名空间, 文件名)`` 到文件路径的映射
+        :rtype: dict[tuple[str, str], str]
+
+        .. versionadded:: 0.3.1
+        """
+        return {key: self.helper.calc_path(self.root_path, *key) for key in dict(self._file_stats)}
+
+    def refresh(self, namespace: str, file_name: str, *args: Any, **kwargs: Any) -> bool:
+        """
+        配置文件在磁盘上被修改时重新加载并替换缓存
+
+        以缓存的配置文件的 :py:attr:`~config.abc.ABCConfigFile.config_format` 重新加载，
+        加载完成后才会替换缓存，加载期间其他线程仍然获取到旧的配置文件
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+
+        :return: 是否重新加载
+        :rtype: bool
+
+        :raise UnsupportedConfigFormatError: 不支持的配置格式
+        :raise FailedProcessConfigFileError: 处理配置文件失败
+        :raise UnsavedChangesError:
+           缓存的配置文件有未保存的修改(包括重新加载期间被修改或被替换)，此时不会替换缓存，
+           并记录文件当前的状态以免同一次修改被重复报告
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        cache = self.get(namespace, file_name)
+        record = self._file_stats.get((namespace, file_name))
+        if cache is None or record is None:
+            return False
+        signature = self._stat(namespace, file_name)
+        if signature is None or signature == record[0]:
+            return False
+        if cache.dirty:
+            self._record_stat(namespace, file_name, signature)
+            raise UnsavedChangesError(namespace, file_name)
+
+        def processor(pool: Self, ns: str, fn: str, cf: str) -> ABCConfigFile[Any]:
+            config_file_cls = self.SLProcessors[cf].supported_file_classes[0]
+            return config_file_cls.load(pool, ns, fn, cf, *args, **kwargs).mark_clean()
+
+        result = self._try_sl_processors(namespace, file_name, cache.config_format, processor)
+        with self._namespace_lock(namespace):
+            files = self._configs.get(namespace, {})
+            # 重新加载期间缓存可能被修改或被替换, 此时替换会丢失修改
+            if files.get(file_name) is not cache:
+                raise UnsavedChangesError(namespace, file_name)
+            if cache.dirty:
+                self._record_stat(namespace, file_name, signature)
+                raise UnsavedChangesError(namespace, file_name)
+            self._configs[namespace] = {**files, file_name: result}
+            self._record_stat(namespace, file_name, signature)
+        return True
+
     def _get_formats(
         self,
         file_name: str,
@@ -507,26 +1613,22 @@ class BasicConfigPool(ABCConfigPool, ABC):
         3.configfile_format非None
 
         .. versionadded:: 0.2.0
+
+        .. versionchanged:: 0.3.1
+           通过 :py:meth:`~config.abc.FileNameProcessorTable.match` 的索引匹配文件名而不再遍历所有文件名处理器
         """  # noqa: RUF002
-        result_formats = []
         # 先尝试从传入的参数中获取配置文件格式
         if config_formats is None:
-            config_formats = []
+            result_formats = []
         elif isinstance(config_formats, str):
-            config_formats = [config_formats]
+            result_formats = [config_formats]
         else:
-            config_formats = list(config_formats)
-        result_formats.extend(config_formats)
-
-        def _check_file_name(match: str | Pattern[str]) -> bool:
-            if isinstance(match, str):
-                return file_name.endswith(match)
-            return bool(match.fullmatch(file_name))  # 目前没SL处理器用得上 # pragma: no cover
+            result_formats = list(config_formats)
 
         # 再尝试从文件名匹配配置文件格式
-        for m in self.FileNameProcessors:
-            if _check_file_name(m):
-                result_formats.extend(self.FileNameProcessors[m])
+        registry = self.FileNameProcessors
+        for m in registry.match(file_name):
+            result_formats.extend(registry[m])
 
         # 最后尝试从配置文件对象本身获取配置文件格式
         if configfile_format is not None:
@@ -535,7 +1637,7 @@ class BasicConfigPool(ABCConfigPool, ABC):
         if not result_formats:
             raise UnsupportedConfigFormatError(None)
 
-        return OrderedDict.fromkeys(result_formats)
+        return dict.fromkeys(result_formats)
 
     def _try_sl_processors[R](
         self,
@@ -544,6 +1646,8 @@ class BasicConfigPool(ABCConfigPool, ABC):
         config_formats: str | Iterable[str] | None,
         processor: Callable[[Self, str, str, str], R],
         file_config_format: str | None = None,
+        *,
+        sniff: bool = False,
     ) -> R:
         """
         自动尝试推断ABCConfigFile所支持的config_format
@@ -565,6 +1669,8 @@ class BasicConfigPool(ABCConfigPool, ABC):
 
            .. seealso::
               :py:attr:`ABCConfigFile.config_format`
+        :param sniff: 文件名没有匹配任何SL处理器时是否根据文件内容判断配置格式，详见 :py:meth:`_sniff_formats`
+        :type sniff: bool
 
         :return: 处理器返回值
         :rtype: R
@@ -581,23 +1687,41 @@ class BasicConfigPool(ABCConfigPool, ABC):
 
         .. versionchanged:: 0.2.0
            拆分格式计算到方法 :py:meth:`_get_formats`
+
+        .. versionchanged:: 0.3.1
+           未指定config_formats时记住每个文件上次成功的配置格式并优先尝试，
+           失败过的配置格式延后尝试
+
+           添加参数 ``sniff``
         """  # noqa: RUF002
 
         def callback_wrapper(cfg_fmt: str) -> R:
             return processor(self, namespace, file_name, cfg_fmt)
 
+        key = namespace, file_name
+        sniffed: list[str] = []
+        if sniff and not config_formats and not self.FileNameProcessors.match(file_name):
+            sniffed = self._sniff_formats(namespace, file_name)
+        formats: Iterable[str] = self._get_formats(file_name, sniffed or config_formats, file_config_format)
+        if not config_formats:
+            formats = self._order_formats(key, formats)
+
         # 尝试从多个SL加载器中找到能正确加载的那一个
         errors: dict[str, FailedProcessConfigFileError[Any] | UnsupportedConfigFormatError] = {}
-        for config_format in self._get_formats(file_name, config_formats, file_config_format):
+        for config_format in formats:
             if config_format not in self.SLProcessors:
                 errors[config_format] = UnsupportedConfigFormatError(config_format)
                 continue
             try:
                 # 能正常运行直接返回结果不再进行尝试
-                return callback_wrapper(config_format)
+                result = callback_wrapper(config_format)
             except FailedProcessConfigFileError as err:
                 errors[config_format] = err
+                continue
+            self._learn_formats(key, config_format, errors)
+            return result
 
+        self._learn_formats(key, None, errors)
         for error in errors.values():
             if isinstance(error, UnsupportedConfigFormatError):
                 raise error from None
@@ -605,6 +1729,102 @@ class BasicConfigPool(ABCConfigPool, ABC):
         # 如果没有一个SL加载器能正确加载则抛出异常
         raise FailedProcessConfigFileError(errors)
 
+    def _sniff_formats(self, namespace: str, file_name: str) -> list[str]:
+        """
+        根据文件开头的内容判断可能的配置格式
+
+        与SL处理器加载时一样通过 :py:func:`~config.safe_writer.safe_open` 读取文件，
+        取开头至多 :py:attr:`sniff_size` 字节交给所有SL处理器的 :py:meth:`ABCConfigSL.sniff` 评分，
+        返回值相同时保持注册顺序
+
+        读取到的内容不会传递给SL处理器，SL处理器加载时会重新读取文件
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+
+        :return: 按可能性从高到低排列的配置格式，文件无法读取时为空
+        :rtype: list[str]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        try:
+            # 持有与加载时相同的锁, 避免同进程的保存在替换文件时因文件被打开而失败
+            with safe_open(self.helper.calc_path(self.root_path, namespace, file_name), "rb") as f:
+                head = f.read(self.sniff_size)
+        except OSError:
+            return []
+
+        scores: list[tuple[float, str]] = []
+        for reg_name, sl_processor in self.SLProcessors.items():
+            score = sl_processor.sniff(head)
+            if score > 0:
+                scores.append((score, reg_name))
+        scores.sort(key=itemgetter(0), reverse=True)
+        return [reg_name for _, reg_name in scores]
+
+    def _order_formats(self, key: tuple[str, str], formats: Iterable[str]) -> Iterable[str]:
+        """
+        按之前的尝试结果调整配置格式的尝试顺序
+
+        上次成功的配置格式最先尝试，失败过的配置格式最后尝试，其余保持原顺序
+
+        :param key: ``(命名空间, 文件名)``
+        :type key: tuple[str, str]
+        :param formats: 配置格式
+        :type formats: Iterable[str]
+
+        :return: 调整后的配置格式
+        :rtype: Iterable[str]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        learned = self._learned_formats.get(key)
+        failed = self._failed_formats.get(key)
+        if learned is None and failed is None:
+            return formats
+
+        ordered = list(formats)
+        if failed is not None:
+            ordered.sort(key=lambda fmt: fmt in failed)
+        if learned is not None and learned in ordered:
+            ordered.remove(learned)
+            ordered.insert(0, learned)
+        return ordered
+
+    def _learn_formats(
+        self,
+        key: tuple[str, str],
+        succeeded: str | None,
+        errors: Mapping[str, FailedProcessConfigFileError[Any] | UnsupportedConfigFormatError],
+    ) -> None:
+        """
+        记录配置格式的尝试结果
+
+        :param key: ``(命名空间, 文件名)``
+        :type key: tuple[str, str]
+        :param succeeded: 成功的配置格式，全部失败时为None
+        :type succeeded: str | None
+        :param errors: 失败的配置格式与错误
+        :type errors: Mapping[str, FailedProcessConfigFileError[Any] | UnsupportedConfigFormatError]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        failed = frozenset(fmt for fmt, err in errors.items() if isinstance(err, FailedProcessConfigFileError))
+        if succeeded is not None:
+            self._learned_formats[key] = succeeded
+            failed = (self._failed_formats.get(key, frozenset()) | failed) - {succeeded}
+        elif not failed:
+            return
+        else:
+            failed |= self._failed_formats.get(key, frozenset())
+
+        if failed:
+            self._failed_formats[key] = failed
+        else:
+            self._failed_formats.pop(key, None)
+
     @override
     def save(
         self,
@@ -618,34 +1838,190 @@ class BasicConfigPool(ABCConfigPool, ABC):
         if config is not None:
             self.set(namespace, file_name, config)
 
-        file = self._configs[namespace][file_name]
+        self._save(namespace, file_name, self._configs[namespace][file_name], config_formats, args, kwargs)
+        return self
+
+    def _save(
+        self,
+        namespace: str,
+        file_name: str,
+        file: ABCConfigFile[Any],
+        config_formats: str | Iterable[str] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """
+        保存给定的配置文件
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param file: 配置文件
+        :type file: ABCConfigFile[Any]
+        :param config_formats: 配置格式
+        :type config_formats: str | Iterable[str] | None
+        :param args: 传递给 :py:meth:`ABCConfigFile.save` 的位置参数
+        :type args: tuple[Any, ...]
+        :param kwargs: 传递给 :py:meth:`ABCConfigFile.save` 的关键字参数
+        :type kwargs: dict[str, Any]
+
+        .. versionadded:: 0.3.1
+        """
+        # 在写入前记录状态, 写入期间的修改会使配置文件保持为脏
+        config = file.config
+        version = config.version
 
         def processor(pool: Self, ns: str, fn: str, cf: str) -> None:
             file.save(pool, ns, fn, cf, *args, **kwargs)
 
         self._try_sl_processors(namespace, file_name, config_formats, processor, file_config_format=file.config_format)
-        return self
+
+        def record_stat() -> None:
+            self._record_stat(namespace, file_name, self._stat(namespace, file_name))
+
+        batch = current_batch()
+        if batch is None:
+            record_stat()
+        else:
+            # 批量提交结束前磁盘上仍是旧文件
+            batch.call_after_commit(record_stat)
+        file._clean_state = None if version is None else (config, version)  # noqa: SLF001
 
     @override
     def save_all(
-        self, *, ignore_err: bool = False
+        self, *, ignore_err: bool = False, parallel: int | None = None, only_dirty: bool = False
     ) -> dict[str, dict[str, tuple[ABCConfigFile[Any], Exception]]] | None:
-        errors: dict[str, dict[str, tuple[ABCConfigFile[Any], Exception]]] = {}
-        for namespace, configs in deepcopy(self._configs).items():
-            errors[namespace] = {}
-            for file_name, config in configs.items():
-                try:
-                    self.save(namespace, file_name)
-                except Exception as err:
-                    if not ignore_err:
-                        raise
-                    errors[namespace][file_name] = (config, err)
+        """
+        保存所有配置
+
+        :param ignore_err: 是否忽略保存导致的错误
+        :type ignore_err: bool
+        :param parallel:
+           并行保存的最大线程数，为None时在当前线程依次保存，
+           目标路径相同的配置文件总是在同一个线程中依次保存，不会同时写入同一个文件
+        :type parallel: int | None
+        :param only_dirty: 是否跳过自上次加载或保存后未被修改的配置文件，详见 :py:attr:`ABCConfigFile.dirty`
+        :type only_dirty: bool
+
+        :return: ignore_err为True时返回{Namespace: {FileName: (ConfigObj, Exception)}}，否则返回None
+        :rtype: dict[str, dict[str, tuple[ABCConfigFile, Exception]]] | None
+
+        :raise ValueError: parallel小于1
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``parallel``
+
+           添加参数 ``only_dirty``
+        """  # noqa: RUF002
+        # 保存快照中的配置文件, 期间被并发移除的文件不会导致失败
+        snapshot = self._configs.copy()
+        files = [
+            (ns, fn, config)
+            for ns, configs in snapshot.items()
+            for fn, config in configs.items()
+            if not only_dirty or config.dirty
+        ]
+
+        if parallel is None:
+            failed = self._save_group(files, ignore_err=ignore_err)
+        else:
+            failed = self._save_parallel(files, parallel, ignore_err=ignore_err)
 
         if not ignore_err:
             return None
 
+        errors: dict[str, dict[str, tuple[ABCConfigFile[Any], Exception]]] = {namespace: {} for namespace in snapshot}
+        for namespace, file_name, config, err in failed:
+            errors[namespace][file_name] = (config, err)
         return {k: v for k, v in errors.items() if v}
 
+    def _save_group(
+        self, files: Iterable[tuple[str, str, ABCConfigFile[Any]]], *, ignore_err: bool
+    ) -> list[tuple[str, str, ABCConfigFile[Any], Exception]]:
+        """
+        依次保存配置文件
+
+        :param files: ``(命名空间, 文件名, 配置文件)``
+        :type files: Iterable[tuple[str, str, ABCConfigFile[Any]]]
+        :param ignore_err: 是否忽略保存导致的错误
+        :type ignore_err: bool
+
+        :return: 保存失败的 ``(命名空间, 文件名, 配置文件, 错误)``
+        :rtype: list[tuple[str, str, ABCConfigFile[Any], Exception]]
+
+        .. versionadded:: 0.3.1
+        """
+        failed = []
+        for namespace, file_name, config in files:
+            try:
+                self._save(namespace, file_name, config, None, (), {})
+            except Exception as err:
+                if not ignore_err:
+                    raise
+                failed.append((namespace, file_name, config, err))
+        return failed
+
+    def _save_parallel(
+        self, files: list[tuple[str, str, ABCConfigFile[Any]]], parallel: int, *, ignore_err: bool
+    ) -> list[tuple[str, str, ABCConfigFile[Any], Exception]]:
+        """
+        按目标路径分组后在线程池中并行保存配置文件
+
+        :param files: ``(命名空间, 文件名, 配置文件)``
+        :type files: list[tuple[str, str, ABCConfigFile[Any]]]
+        :param parallel: 最大线程数
+        :type parallel: int
+        :param ignore_err: 是否忽略保存导致的错误
+        :type ignore_err: bool
+
+        :return: 保存失败的 ``(命名空间, 文件名, 配置文件, 错误)``
+        :rtype: list[tuple[str, str, ABCConfigFile[Any], Exception]]
+
+        :raise ValueError: parallel小于1
+
+        .. versionadded:: 0.3.1
+        """
+        if parallel < 1:
+            msg = f"parallel must be at least 1, got {parallel}"
+            raise ValueError(msg)
+
+        groups: dict[str, list[tuple[str, str, ABCConfigFile[Any]]]] = {}
+        for file in files:
+            target = os.path.normcase(os.path.abspath(self.helper.calc_path(self.root_path, file[0], file[1])))
+            groups.setdefault(target, []).append(file)
+
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="C41811.Config.save_all") as executor:
+            # 复制上下文使工作线程加入当前的批量提交
+            futures = [
+                executor.submit(copy_context().run, self._save_group, group, ignore_err=ignore_err)
+                for group in groups.values()
+            ]
+            try:
+                # 按提交顺序获取结果, 抛出最先提交的分组中的错误
+                return [failure for future in futures for failure in future.result()]
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    @contextmanager
+    def batch_commit(self) -> Generator[CommitBatch, Any, None]:
+        """
+        批量提交上下文中的所有保存 (上下文管理器)
+
+        上下文中保存的配置文件仍会各自同步文件内容，但替换目标文件推迟到退出上下文时依次进行，
+        每个受影响的目录只同步一次，上下文中发生异常时不会替换任何文件
+
+        详见 :py:func:`~config.safe_writer.batch_commit`
+
+        :return: 批量提交
+        :rtype: Generator[CommitBatch, Any, None]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        with batch_commit() as batch:
+            yield batch
+
     @override
     def initialize(
         self,
@@ -697,15 +2073,124 @@ class BasicConfigPool(ABCConfigPool, ABC):
            重命名参数 ``allow_create`` 为 ``allow_initialize``
 
            现在由 :py:meth:`ABCConfigFile.initialize` 创建新的空 :py:class:`ABCConfigFile` 对象
-        """
+
+        .. versionchanged:: 0.3.1
+           设置了 :py:attr:`revalidate_interval` 时文件在磁盘上被修改后会重新加载
+
+           多个线程以相同的参数同时加载同一个未缓存的配置文件时只有第一个线程会解析文件，
+           其余线程等待其完成并得到同一个配置文件对象(或同一个异常)，
+           参数不同的线程等待其完成后按自身的参数重新调用 :py:meth:`load`
+        """  # noqa: RUF002
         cache = self.get(namespace, file_name)
-        if cache is not None:
+        if cache is not None and self._reusable(namespace, file_name, cache):
             return cache
 
+        if config_formats is not None and not isinstance(config_formats, str):
+            # 迭代器只能消费一次, 且需要与其他线程的参数比较
+            config_formats = tuple(config_formats)
+        arguments: _LoadArguments = (args, kwargs, config_formats, allow_initialize)
+        key = (namespace, file_name)
+        with self._loading_lock:
+            current = self.get(namespace, file_name)
+            if current is not None and current is not cache:
+                # 等待锁期间其他线程已完成加载
+                return current
+            flight = self._loading.get(key)
+            if flight is None:
+                future: Future[ABCConfigFile[Any]] = Future()
+                self._loading[key] = (future, threading.get_ident(), arguments)
+
+        if flight is not None:
+            return self._join_load(namespace, file_name, flight, arguments)
+
+        try:
+            result = self._load(namespace, file_name, *arguments)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._loading_lock:
+                del self._loading[key]
+
+    def _join_load(
+        self,
+        namespace: str,
+        file_name: str,
+        flight: tuple[Future[ABCConfigFile[Any]], int, _LoadArguments],
+        arguments: _LoadArguments,
+    ) -> ABCConfigFile[Any]:
+        """
+        等待其他线程正在进行的加载
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param flight: 正在进行的加载的结果，发起加载的线程标识符与加载参数
+        :type flight: tuple[Future[ABCConfigFile[Any]], int, _LoadArguments]
+        :param arguments: 当前调用的加载参数
+        :type arguments: _LoadArguments
+
+        :return: 配置对象
+        :rtype: ABCConfigFile
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        future, ident, flight_arguments = flight
+        if ident == threading.get_ident():
+            # 同一线程内的重入加载直接解析, 等待自身会导致死锁
+            return self._load(namespace, file_name, *arguments)
+        if flight_arguments == arguments:
+            return future.result()
+
+        # 参数不同时不能共享结果, 例如文件不存在时是否允许初始化会得到不同的结果,
+        # 等待其完成后重新加载, 成功时命中缓存, 与顺序调用的行为一致
+        wait((future,))
+        args, kwargs, config_formats, allow_initialize = arguments
+        return self.load(
+            namespace, file_name, *args, config_formats=config_formats, allow_initialize=allow_initialize, **kwargs
+        )
+
+    def _load(
+        self,
+        namespace: str,
+        file_name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        config_formats: str | Iterable[str] | None,
+        allow_initialize: bool,  # noqa: FBT001
+    ) -> ABCConfigFile[Any]:
+        """
+        解析配置文件并放入配置池
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param args: 传递给 :py:meth:`ABCConfigFile.load` 的位置参数
+        :type args: tuple[Any, ...]
+        :param kwargs: 传递给 :py:meth:`ABCConfigFile.load` 的关键字参数
+        :type kwargs: dict[str, Any]
+        :param config_formats: 配置格式
+        :type config_formats: str | Iterable[str] | None
+        :param allow_initialize: 是否允许初始化配置文件
+        :type allow_initialize: bool
+
+        :return: 配置对象
+        :rtype: ABCConfigFile
+
+        .. versionadded:: 0.3.1
+        """
+        # 先于解析获取状态, 解析期间的修改会在下次检查时被发现
+        signature = self._stat(namespace, file_name)
+
         def processor(pool: Self, ns: str, fn: str, cf: str) -> ABCConfigFile[Any]:
             config_file_cls = self.SLProcessors[cf].supported_file_classes[0]
             try:
-                result = config_file_cls.load(pool, ns, fn, cf, *args, **kwargs)
+                result = config_file_cls.load(pool, ns, fn, cf, *args, **kwargs).mark_clean()
             except FileNotFoundError:
                 if not allow_initialize:
                     raise
@@ -714,17 +2199,125 @@ class BasicConfigPool(ABCConfigPool, ABC):
             pool.set(namespace, file_name, result)
             return result
 
-        return self._try_sl_processors(namespace, file_name, config_formats, processor)
+        result = self._try_sl_processors(namespace, file_name, config_formats, processor, sniff=True)
+        self._record_stat(namespace, file_name, signature)
+        return result
+
+    async def aload(
+        self,
+        namespace: str,
+        file_name: str,
+        *args: Any,
+        config_formats: str | Iterable[str] | None = None,
+        allow_initialize: bool = False,
+        **kwargs: Any,
+    ) -> ABCConfigFile[Any]:
+        """
+        :py:meth:`load` 的异步版本
+
+        命中缓存时直接返回，否则在 :py:attr:`executor` 中读取并解析文件，等待文件锁与解析时不会阻塞事件循环，
+        但会占用线程池的一个线程，详见 :py:attr:`executor`
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param config_formats: 配置格式
+        :type config_formats: str | Iterable[str] | None
+        :param allow_initialize: 是否允许初始化配置文件
+        :type allow_initialize: bool
+
+        :return: 配置对象
+        :rtype: ABCConfigFile
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        cache = self.get(namespace, file_name)
+        if cache is not None and self._reusable(namespace, file_name, cache):
+            return cache
+        return await run_in_executor(
+            self.executor,
+            self.load,
+            namespace,
+            file_name,
+            *args,
+            config_formats=config_formats,
+            allow_initialize=allow_initialize,
+            **kwargs,
+        )
+
+    async def asave(
+        self,
+        namespace: str,
+        file_name: str,
+        config_formats: str | Iterable[str] | None = None,
+        config: ABCConfigFile[Any] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        :py:meth:`save` 的异步版本
+
+        在 :py:attr:`executor` 中序列化并写入文件，期间占用线程池的一个线程，详见 :py:attr:`executor`
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param config_formats: 配置格式
+        :type config_formats: str | Iterable[str] | None
+        :param config: 配置文件，可选，提供此参数相当于自动调用了一遍pool.set
+        :type config: ABCConfigFile | None
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return await run_in_executor(
+            self.executor, self.save, namespace, file_name, config_formats, config, *args, **kwargs
+        )
+
+    async def asave_all(
+        self, *, ignore_err: bool = False, parallel: int | None = None, only_dirty: bool = False
+    ) -> dict[str, dict[str, tuple[ABCConfigFile[Any], Exception]]] | None:
+        """
+        :py:meth:`save_all` 的异步版本
+
+        在 :py:attr:`executor` 中保存，期间占用线程池的一个线程，详见 :py:attr:`executor` ，
+        ``parallel`` 大于1时并行保存使用的是另外创建的线程池
+
+        :param ignore_err: 是否忽略保存导致的错误
+        :type ignore_err: bool
+        :param parallel: 详见 :py:meth:`save_all`
+        :type parallel: int | None
+        :param only_dirty: 详见 :py:meth:`save_all`
+        :type only_dirty: bool
+
+        :return: ignore_err为True时返回{Namespace: {FileName: (ConfigObj, Exception)}}，否则返回None
+        :rtype: dict[str, dict[str, tuple[ABCConfigFile, Exception]]] | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return await run_in_executor(
+            self.executor, self.save_all, ignore_err=ignore_err, parallel=parallel, only_dirty=only_dirty
+        )
 
     @override
     def remove(self, namespace: str, file_name: str | None = None) -> Self:
-        if file_name is None:
-            del self._configs[namespace]
-            return self
-
-        del self._configs[namespace][file_name]
-        if not self._configs[namespace]:
-            del self._configs[namespace]
+        with self._namespace_lock(namespace):
+            if file_name is None:
+                for name in self._configs.pop(namespace):
+                    self._file_stats.pop((namespace, name), None)
+                return self
+
+            files = dict(self._configs[namespace])
+            del files[file_name]
+            self._file_stats.pop((namespace, file_name), None)
+            if files:
+                self._configs[namespace] = files
+            else:
+                del self._configs[namespace]
         return self
 
     @override
@@ -738,8 +2331,8 @@ class BasicConfigPool(ABCConfigPool, ABC):
             if len(item) != 2:
                 msg = f"item must be a tuple of length 2, got {item}"
                 raise ValueError(msg)
-            return deepcopy(self.configs[item[0]][item[1]])
-        return deepcopy(self.configs[item])
+            return deepcopy(self._configs[item[0]][item[1]])
+        return deepcopy(self._configs[item])  # 文件字典写时复制, 拷贝期间不会被修改
 
     def __contains__(self, item: Any) -> bool:
         """.. versionadded:: 0.1.2"""
@@ -752,16 +2345,16 @@ class BasicConfigPool(ABCConfigPool, ABC):
         if len(item) != 2:
             msg = f"item must be a tuple of length 2, got {item}"
             raise ValueError(msg)
-        return (item[0] in self._configs) and (item[1] in self._configs[item[0]])
+        return item[1] in self._configs.get(item[0], {})
 
     def __len__(self) -> int:
         """配置文件总数"""
-        return sum(len(v) for v in self._configs.values())
+        return sum(len(v) for v in self._configs.copy().values())
 
     @property
     def configs(self) -> dict[str, dict[str, ABCConfigFile[Any]]]:
         """配置文件字典"""
-        return deepcopy(self._configs)
+        return deepcopy(self._configs.copy())
 
     @override
     def __repr__(self) -> str:
@@ -775,4 +2368,5 @@ __all__ = (
     "BasicSingleConfigData",
     "ConfigFile",
     "PHelper",
+    "PathAccessor",
 )
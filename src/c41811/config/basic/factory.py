@@ -7,22 +7,133 @@
 .. versionadded:: 0.3.0
 """
 
+from abc import get_cache_token
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
+from typing import override
 
 if TYPE_CHECKING:
-    from collections import OrderedDict
     from collections.abc import Callable
 
     from ..abc import ABCConfigData
 else:
-    from collections import OrderedDict
     from collections.abc import Callable
 
     ABCConfigData = Any
 
 
+type _Types = tuple[type, ...]
+type _ConfigDataCls = Callable[[Any], ABCConfigData] | type
+
+
+class _TypeDispatchTable(OrderedDict[_Types, _ConfigDataCls]):
+    """
+    带有按具体类型分派缓存的 :py:attr:`ConfigDataFactory.TYPES`
+
+    每个具体类型只按顺序执行一次 :py:func:`isinstance` 检查，
+    之后直接查表，表被修改或有抽象基类注册了新的虚拟子类时清空缓存
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._cache: dict[type, _ConfigDataCls | None] = {}
+        self._cache_token: object = get_cache_token()
+        super().__init__(*args, **kwargs)
+
+    def dispatch(self, data: Any) -> _ConfigDataCls | None:
+        """
+        获取数据对应的配置数据类
+
+        :param data: 数据
+        :type data: Any
+
+        :return: 配置数据类，不支持时为None
+        :rtype: _ConfigDataCls | None
+        """  # noqa: RUF002
+        data_type = type(data)
+        if data.__class__ is not data_type:
+            # 代理对象等伪装了__class__的对象不能按具体类型缓存
+            return self._scan(data)
+
+        cache = self._cache
+        token = get_cache_token()
+        if token != self._cache_token:
+            cache.clear()
+            self._cache_token = token
+        try:
+            return cache[data_type]
+        except KeyError:
+            result = cache[data_type] = self._scan(data)
+            return result
+
+    def _scan(self, data: Any) -> _ConfigDataCls | None:
+        """
+        按顺序查找数据对应的配置数据类
+
+        :param data: 数据
+        :type data: Any
+
+        :return: 配置数据类，不支持时为None
+        :rtype: _ConfigDataCls | None
+        """  # noqa: RUF002
+        for types, config_data_cls in self.items():
+            if isinstance(data, types):
+                return config_data_cls
+        return None
+
+    @override
+    def __setitem__(self, key: _Types, value: _ConfigDataCls) -> None:
+        super().__setitem__(key, value)
+        self._cache.clear()
+
+    @override
+    def __delitem__(self, key: _Types) -> None:
+        super().__delitem__(key)
+        self._cache.clear()
+
+    @override
+    def move_to_end(self, key: _Types, last: bool = True) -> None:
+        super().move_to_end(key, last)
+        self._cache.clear()
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._cache.clear()
+
+    @override
+    def pop(self, key: _Types, *args: Any) -> Any:
+        result = super().pop(key, *args)
+        self._cache.clear()
+        return result
+
+    @override
+    def popitem(self, last: bool = True) -> tuple[_Types, _ConfigDataCls]:
+        result = super().popitem(last)
+        self._cache.clear()
+        return result
+
+    @override
+    def setdefault(self, key: _Types, default: Any = None) -> Any:
+        result = super().setdefault(key, default)
+        self._cache.clear()
+        return result
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._cache.clear()
+
+    @override
+    def __ior__(self, other: Any) -> Any:
+        result = super().__ior__(other)
+        self._cache.clear()
+        return result
+
+
 class ConfigDataFactory:
     """
     配置数据工厂类
@@ -33,6 +144,9 @@ class ConfigDataFactory:
     .. versionchanged:: 0.3.0
        不再作为所有 `ConfigData` 的虚拟父类
        重命名 ``ConfigData`` 为 ``ConfigDataFactory``
+
+    .. versionchanged:: 0.3.1
+       按数据的具体类型缓存分派结果
     """
 
     TYPES: ClassVar[OrderedDict[tuple[type, ...], Callable[[Any], ABCConfigData] | type]]
@@ -41,7 +155,11 @@ class ConfigDataFactory:
 
     .. versionchanged:: 0.2.0
        现在使用 ``OrderedDict`` 来保证顺序
-    """
+
+    .. versionchanged:: 0.3.1
+       默认注册表会按数据的具体类型缓存分派结果并在被修改时自动失效，
+       替换为普通的 ``OrderedDict`` 时每次都按顺序检查
+    """  # noqa: RUF001
 
     _TYPES_LAZY_INITIALIZER: ClassVar[Callable[[], None]]
     """
@@ -67,12 +185,90 @@ class ConfigDataFactory:
 
         if not args:
             args = (None,)
-        for types, config_data_cls in cls.TYPES.items():
-            if not isinstance(args[0], types):
-                continue
-            return config_data_cls(*args, **kwargs)
+        registry = cls.TYPES
+        if isinstance(registry, _TypeDispatchTable):
+            config_data_cls = registry.dispatch(args[0])
+            if config_data_cls is not None:
+                return config_data_cls(*args, **kwargs)
+        else:
+            for types, config_data_cls in registry.items():
+                if not isinstance(args[0], types):
+                    continue
+                return config_data_cls(*args, **kwargs)
         msg = f"Unsupported type: {args[0]}"
         raise TypeError(msg)
 
+    @classmethod
+    def register(
+        cls,
+        types: type | tuple[type, ...],
+        config_data_cls: Callable[[Any], ABCConfigData] | type,
+        *,
+        before: type | tuple[type, ...] | None = None,
+    ) -> None:
+        """
+        注册数据类型对应的配置数据类
+
+        :param types: 数据类型
+        :type types: type | tuple[type, ...]
+        :param config_data_cls: 配置数据类
+        :type config_data_cls: Callable[[Any], ABCConfigData] | type
+        :param before: 插入到已注册的该数据类型之前，为None时以最高优先级插入
+        :type before: type | tuple[type, ...] | None
+
+        :raise KeyError: ``before`` 未注册
+
+        例子
+        ----
+
+           >>> from collections import UserString
+           >>> from c41811.config import ConfigDataFactory
+           >>> from c41811.config import StringConfigData
+           >>> ConfigDataFactory.register(UserString, StringConfigData, before=(str, bytes))
+           >>> ConfigDataFactory(UserString("value"))
+           StringConfigData('value')
+           >>> ConfigDataFactory.unregister(UserString)
+           <class 'c41811.config.basic.sequence.StringConfigData'>
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        if not hasattr(cls, "TYPES"):
+            cls._TYPES_LAZY_INITIALIZER()
+        types = types if isinstance(types, tuple) else (types,)
+        registry = cls.TYPES
+        if before is None:
+            registry[types] = config_data_cls
+            registry.move_to_end(types, last=False)
+            return
+
+        before = before if isinstance(before, tuple) else (before,)
+        if before not in registry:
+            raise KeyError(before)
+        registry.pop(types, None)
+        following = list(registry)
+        following = following[following.index(before) :]
+        registry[types] = config_data_cls
+        for key in following:
+            registry.move_to_end(key)
+
+    @classmethod
+    def unregister(cls, types: type | tuple[type, ...]) -> Callable[[Any], ABCConfigData] | type:
+        """
+        移除数据类型的注册
+
+        :param types: 数据类型
+        :type types: type | tuple[type, ...]
+
+        :return: 原先注册的配置数据类
+        :rtype: Callable[[Any], ABCConfigData] | type
+
+        :raise KeyError: 数据类型未注册
+
+        .. versionadded:: 0.3.1
+        """
+        if not hasattr(cls, "TYPES"):
+            cls._TYPES_LAZY_INITIALIZER()
+        return cls.TYPES.pop(types if isinstance(types, tuple) else (types,))
+
 
 __all__ = ("ConfigDataFactory",)
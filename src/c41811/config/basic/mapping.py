@@ -9,14 +9,17 @@
 
 import operator
 from collections import OrderedDict
+from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import ItemsView
+from collections.abc import Iterable
 from collections.abc import KeysView
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import ValuesView
-from copy import deepcopy
+from functools import partial
 from typing import Any
+from typing import ClassVar
 from typing import Self
 from typing import cast
 from typing import override
@@ -24,8 +27,11 @@ from typing import override
 from ._generate_operators import generate
 from ._generate_operators import operate
 from .core import BasicIndexedConfigData
+from .core import _fast_path_compatible
+from .core import _is_subtype
 from .utils import check_read_only
 from .utils import fmt_path
+from ..abc import ABCPath
 from ..abc import PathLike
 from ..errors import CyclicReferenceError
 from ..errors import KeyInfo
@@ -96,17 +102,108 @@ def _keys_recursive(
     seen.remove(id(data))
 
 
+def _index_name(keys: Iterable[str]) -> str:
+    r"""
+    将键转换为 :py:meth:`MappingConfigData.keys` 递归获取时使用的路径字符串
+
+    :param keys: 键
+    :type keys: Iterable[str]
+
+    :return: 路径字符串
+    :rtype: str
+
+    例子
+    ----
+
+       >>> _index_name(["foo", "b\\ar"])
+       'foo\\.b\\\\ar'
+
+    .. versionadded:: 0.3.1
+    """
+    return "\\.".join(k.replace("\\", "\\\\") for k in keys)
+
+
+def _index_walk(
+    index: dict[str, tuple[Any, str]],
+    prefix: str,
+    data: Any,
+    *,
+    remove: bool,
+    ancestors: set[int] | None = None,
+) -> None:
+    r"""
+    递归登记或移除数据中所有路径的索引，静默跳过循环引用与非str键
+
+    :param index: 索引
+    :type index: dict[str, tuple[Any, str]]
+    :param prefix: 数据所在的路径字符串前缀，根数据为空字符串，否则以 ``\.`` 结尾
+    :type prefix: str
+    :param data: 数据
+    :type data: Any
+    :param remove: 是否移除索引
+    :type remove: bool
+    :param ancestors: 祖先容器的id
+    :type ancestors: set[int] | None
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if not _is_subtype(type(data), Mapping):
+        return
+    if ancestors is None:
+        ancestors = set()
+    if id(data) in ancestors:
+        return
+    ancestors.add(id(data))
+    for k, v in data.items():
+        if not isinstance(k, str):
+            continue
+        name = prefix + k.replace("\\", "\\\\")
+        if remove:
+            index.pop(name, None)
+        else:
+            index[name] = (data, k)
+        _index_walk(index, f"{name}\\.", v, remove=remove, ancestors=ancestors)
+    ancestors.remove(id(data))
+
+
+def _attr_keys(path: ABCPath[Any]) -> tuple[list[str], bool]:
+    """
+    获取路径开头连续的 :py:class:`~config.path.AttrKey` 的键
+
+    :param path: 路径
+    :type path: ABCPath[Any]
+
+    :return: 键与路径是否完全由 :py:class:`~config.path.AttrKey` 组成
+    :rtype: tuple[list[str], bool]
+
+    .. versionadded:: 0.3.1
+    """
+    keys: list[str] = []
+    for key in path:
+        if type(key) is not AttrKey:
+            return keys, False
+        keys.append(key._key)  # noqa: SLF001
+    return keys, True
+
+
 @generate
 class MappingConfigData[D: Mapping[Any, Any]](BasicIndexedConfigData[D], MutableMapping[Any, Any]):
     """
     映射配置数据
 
     .. versionadded:: 0.1.5
+
+    .. versionchanged:: 0.3.1
+       支持可选的扁平路径索引 :py:attr:`flat_index`
     """
 
     _data: D
     data: D
 
+    _path_index: dict[str, tuple[Any, str]] | None = None
+
+    _FAST_PATH_METHODS: ClassVar[frozenset[str]] = frozenset({"retrieve", "exists", "modify", "delete"})
+
     def __init__(self, data: D | None = None):
         """
         :param data: 映射数据
@@ -121,6 +218,205 @@ class MappingConfigData[D: Mapping[Any, Any]](BasicIndexedConfigData[D], Mutable
     def data_read_only(self) -> bool:
         return not isinstance(self._data, MutableMapping)
 
+    @property
+    def flat_index(self) -> bool:
+        r"""
+        是否启用扁平路径索引
+
+        索引将 :py:meth:`keys` 递归获取的每个路径映射到其所在的容器与键，
+        启用后 :py:meth:`retrieve` 与 :py:meth:`exists` 对这些路径字符串(可以带有开头的 ``\.`` )
+        只需一次字典查找，与路径深度无关，其余路径回退到逐键查找。
+        :py:meth:`modify` ， :py:meth:`delete` ， :py:meth:`update` ， :py:meth:`clear`
+        等修改方法与原地操作符会增量维护索引
+
+        .. caution::
+           绕过配置数据直接修改原始数据(例如修改 ``return_raw_value=True`` 获取的容器)
+           或在多个路径下共享同一个容器时索引会失效
+
+        .. note::
+           启用索引时 :py:class:`~config.basic.core.PathAccessor` 与批量修改会回退到调用修改方法。
+           存在快照时首次修改会完全脱离共享并重建索引，快照与拷贝不会继承索引
+
+        :raise TypeError: 子类复写了修改方法而不支持索引
+
+        例子
+        ----
+
+           >>> from c41811.config import MappingConfigData
+           >>> data = MappingConfigData({"foo": {"bar": {"baz": "value"}}})
+           >>> data.flat_index = True
+           >>> data.retrieve("foo\\.bar\\.baz")
+           'value'
+           >>> data.modify("foo\\.bar", {"qux": 1}).exists("foo\\.bar\\.baz")
+           False
+           >>> data.retrieve("\\.foo\\.bar\\.qux")
+           1
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return self._path_index is not None
+
+    @flat_index.setter
+    def flat_index(self, value: bool) -> None:
+        if not value:
+            self._path_index = None
+            self._fast_write = True
+            return
+        if not all(_fast_path_compatible(type(self), name) for name in ("modify", "delete")):
+            msg = f"'{type(self).__name__}' does not support flat index"
+            raise TypeError(msg)
+        self._build_index()
+        self._fast_write = False
+
+    def _build_index(self) -> None:
+        """
+        重建扁平路径索引
+
+        .. versionadded:: 0.3.1
+        """
+        index: dict[str, tuple[Any, str]] = {}
+        _index_walk(index, "", self._data, remove=False)
+        self._path_index = index
+
+    def _index_lookup(self, path: PathLike) -> tuple[Any, str] | None:
+        """
+        在扁平路径索引中查找路径
+
+        :param path: 路径
+        :type path: PathLike
+
+        :return: 路径所在的容器与键，未启用索引或未命中时为None
+        :rtype: tuple[Any, str] | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        index = self._path_index
+        if index is None or type(path) is not str:
+            return None
+        entry = index.get(path.removeprefix("\\."))
+        if entry is None or entry[1] not in entry[0]:
+            return None
+        return entry
+
+    def _indexed_write[R](self, paths: Iterable[tuple[list[str], bool]], write: Callable[[], R]) -> R:
+        """
+        执行修改并增量维护扁平路径索引
+
+        :param paths: 会被修改的路径开头连续的键与路径是否完全由这些键组成
+        :type paths: Iterable[tuple[list[str], bool]]
+        :param write: 执行修改的函数
+        :type write: Callable[[], R]
+
+        :return: 修改函数的返回值
+        :rtype: R
+
+        .. versionadded:: 0.3.1
+        """
+        self._unshare()
+        index = cast(dict[str, tuple[Any, str]], self._path_index)
+        paths = tuple(paths)
+        for keys, whole in paths:
+            if not (whole and keys):
+                continue
+            name = _index_name(keys)
+            entry = index.pop(name, None)
+            if entry is not None and entry[1] in entry[0]:
+                _index_walk(index, f"{name}\\.", entry[0][entry[1]], remove=True)
+
+        data = self._data
+        try:
+            return write()
+        finally:
+            if self._data is not data:
+                self._build_index()
+            else:
+                for keys, whole in paths:
+                    self._reindex(keys, subtree=whole)
+
+    def _reindex(self, keys: list[str], *, subtree: bool) -> None:
+        """
+        沿键重新登记扁平路径索引
+
+        :param keys: 键
+        :type keys: list[str]
+        :param subtree: 是否登记最后一个键的值下的所有路径
+        :type subtree: bool
+
+        .. versionadded:: 0.3.1
+        """
+        index = cast(dict[str, tuple[Any, str]], self._path_index)
+        current: Any = self._data
+        prefix = ""
+        for key in keys:
+            if not (_is_subtype(type(current), Mapping) and key in current):
+                return
+            name = prefix + key.replace("\\", "\\\\")
+            index[name] = (current, key)
+            current = current[key]
+            prefix = f"{name}\\."
+        if subtree:
+            _index_walk(index, prefix, current, remove=False)
+
+    @override
+    def _unshare(self) -> None:
+        shared = self._cow is not None
+        super()._unshare()
+        if shared and self._path_index is not None:
+            self._build_index()
+
+    @override
+    def retrieve(self, path: PathLike, *, return_raw_value: bool = False) -> Any:
+        entry = self._index_lookup(path)
+        if entry is None:
+            return super().retrieve(path, return_raw_value=return_raw_value)
+        return self._retrieved(entry[0][entry[1]], return_raw_value=return_raw_value)
+
+    @override
+    def exists(self, path: PathLike, *, ignore_wrong_type: bool = False) -> bool:
+        if self._index_lookup(path) is not None:
+            return True
+        return super().exists(path, ignore_wrong_type=ignore_wrong_type)
+
+    @override
+    @check_read_only
+    def modify(self, path: PathLike, value: Any, *, allow_create: bool = True) -> Self:
+        if self._path_index is None:
+            return super().modify(path, value, allow_create=allow_create)
+        path = fmt_path(path)
+        return self._indexed_write((_attr_keys(path),), partial(super().modify, path, value, allow_create=allow_create))
+
+    @override
+    @check_read_only
+    def delete(self, path: PathLike) -> Self:
+        if self._path_index is None:
+            return super().delete(path)
+        path = fmt_path(path)
+        return self._indexed_write((_attr_keys(path),), partial(super().delete, path))
+
+    @override
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if self._path_index is None or not isinstance(index, str):
+            super().__setitem__(index, value)
+            return
+        self._indexed_write((([index], True),), partial(super().__setitem__, index, value))
+
+    @override
+    def __delitem__(self, index: Any) -> None:
+        if self._path_index is None or not isinstance(index, str):
+            super().__delitem__(index)
+            return
+        self._indexed_write((([index], True),), partial(super().__delitem__, index))
+
+    @override
+    def _apply_inplace(self, inplace_func: Callable[[Any, Any], Any], other: Any) -> Self:
+        if self._path_index is None:
+            return super()._apply_inplace(inplace_func, other)
+        if not isinstance(other, Mapping):
+            other = dict(other)
+        return self._indexed_write(
+            (([k], True) for k in other if isinstance(k, str)), partial(super()._apply_inplace, inplace_func, other)
+        )
+
     @override
     def keys(self, *, recursive: bool = False, strict: bool = True, end_point_only: bool = False) -> KeysView[Any]:
         # noinspection GrazieInspection
@@ -218,10 +514,12 @@ class MappingConfigData[D: Mapping[Any, Any]](BasicIndexedConfigData[D], Mutable
            重命名参数 ``get_raw`` 为 ``return_raw_value``
         """
         if return_raw_value:
+            self._unshare()
             return self._data.values()
 
+        copy = self.copy_policy.copy
         return OrderedDict(
-            (k, self.from_data(v) if isinstance(v, Mapping) else deepcopy(v)) for k, v in self._data.items()
+            (k, self._derive(self.from_data, v) if isinstance(v, Mapping) else copy(v)) for k, v in self._data.items()
         ).values()
 
     @override
@@ -239,15 +537,20 @@ class MappingConfigData[D: Mapping[Any, Any]](BasicIndexedConfigData[D], Mutable
            重命名参数 ``get_raw`` 为 ``return_raw_value``
         """
         if return_raw_value:
+            self._unshare()
             return self._data.items()
+        copy = self.copy_policy.copy
         return OrderedDict(
-            (deepcopy(k), self.from_data(v) if isinstance(v, Mapping) else deepcopy(v)) for k, v in self._data.items()
+            (copy(k), self._derive(self.from_data, v) if isinstance(v, Mapping) else copy(v))
+            for k, v in self._data.items()
         ).items()
 
     @override
     @check_read_only
     def clear(self) -> None:
-        self._data.clear()  # type: ignore[attr-defined]
+        self._mutable_data().clear()  # type: ignore[attr-defined]
+        if self._path_index is not None:
+            self._path_index.clear()
 
     @override
     @check_read_only
@@ -265,15 +568,31 @@ class MappingConfigData[D: Mapping[Any, Any]](BasicIndexedConfigData[D], Mutable
     @override
     @check_read_only
     def popitem(self) -> Any:
-        return self._data.popitem()  # type: ignore[attr-defined]
+        if self._path_index is None:
+            return self._mutable_data().popitem()  # type: ignore[attr-defined]
+        self._unshare()
+        key, value = self._mutable_data().popitem()  # type: ignore[attr-defined]
+        if isinstance(key, str):
+            name = _index_name((key,))
+            self._path_index.pop(name, None)
+            _index_walk(self._path_index, f"{name}\\.", value, remove=True)
+        return key, value
 
     @override
     @check_read_only
     def update(self, m: Any = None, /, **kwargs: Any) -> None:
+        if self._path_index is not None:
+            items = kwargs if m is None else m if isinstance(m, Mapping) else dict(m)
+            self._indexed_write(
+                (([k], True) for k in items if isinstance(k, str)),
+                # 在_unshare之后才取得可变数据, 否则会修改快照共享的数据
+                lambda: self._mutable_data().update(items),  # type: ignore[attr-defined]
+            )
+            return
         if m is not None:
-            self._data.update(m)  # type: ignore[attr-defined]
+            self._mutable_data().update(m)  # type: ignore[attr-defined]
             return
-        self._data.update(**kwargs)  # type: ignore[attr-defined]
+        self._mutable_data().update(**kwargs)  # type: ignore[attr-defined]
 
     def __getattr__(self, item: Any) -> Self | Any:
         try:
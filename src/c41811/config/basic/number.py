@@ -70,6 +70,7 @@ class NumberConfigData[D: int | float | Number](BasicSingleConfigData[D]):
 
     @data.setter
     def data(self, data: D) -> None:
+        self._touch()
         self._data = data
 
     def __int__(self) -> int:
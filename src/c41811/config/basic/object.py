@@ -79,8 +79,19 @@ class ObjectConfigData[D: object](BasicSingleConfigData[D]):
 
     @data.setter
     def data(self, data: D) -> None:
+        self._touch()
         self._data = data
 
+    @property
+    @override
+    def version(self) -> int | None:
+        """
+        原始数据可能在外部被原地修改，不追踪修改
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return None
+
 
 __all__ = (
     "NoneConfigData",
@@ -0,0 +1,437 @@
+# cython: language_level = 3  # noqa: ERA001
+
+
+"""
+持久化(结构共享)配置数据实现
+
+基于 :py:mod:`pyrsistent` 的 :py:class:`~pyrsistent.PMap` 与 :py:class:`~pyrsistent.PVector`
+
+.. versionadded:: 0.3.1
+"""
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
+from typing import Literal
+from typing import Self
+from typing import cast
+from typing import override
+
+from .core import BasicIndexedConfigData
+from .core import BasicSingleConfigData
+from .mapping import MappingConfigData
+from .sequence import SequenceConfigData
+from .utils import check_read_only
+from .utils import fmt_path
+from ..abc import ABCPath
+from ..abc import AnyKey
+from ..abc import PathLike
+from ..errors import ConfigDataTypeError
+from ..errors import ConfigOperate
+from ..errors import DependencyNotFoundError
+from ..errors import KeyInfo
+from ..errors import RequiredPathNotFoundError
+from ..utils import CopyPolicy
+
+try:
+    # noinspection PyPackageRequirements, PyUnresolvedReferences
+    from pyrsistent import PMap
+    from pyrsistent import PVector
+    from pyrsistent import freeze
+    from pyrsistent import pmap
+    from pyrsistent import pvector
+except ImportError:
+    dependency = "pyrsistent"
+    raise DependencyNotFoundError(dependency) from None
+
+
+def _freeze(data: Any) -> Any:
+    """
+    递归将 :py:class:`dict` / :py:class:`list` 等转换为持久化数据，已经是持久化数据的部分原样保留
+
+    :param data: 原始数据
+    :type data: Any
+
+    :return: 持久化数据
+    :rtype: Any
+    """  # noqa: RUF002
+    return freeze(data, strict=False)  # type: ignore[call-overload]
+
+
+def _unwrap(other: Any) -> Any:
+    if isinstance(other, BasicSingleConfigData):
+        return other.data
+    return other
+
+
+def _set_inner(node: Any, key: AnyKey, value: Any) -> Any:
+    """
+    返回设置了键值的新节点，不修改原节点
+
+    :param node: 当前节点
+    :type node: Any
+    :param key: 键
+    :type key: AnyKey
+    :param value: 值
+    :type value: Any
+
+    :return: 新节点
+    :rtype: Any
+    """  # noqa: RUF002
+    if isinstance(node, Mapping):
+        return (node if isinstance(node, PMap) else pmap(node)).set(key.key, value)
+    return (node if isinstance(node, PVector) else pvector(node)).set(key.key, value)
+
+
+def _delete_inner(node: Any, key: AnyKey) -> Any:
+    """
+    返回删除了键的新节点，不修改原节点
+
+    :param node: 当前节点
+    :type node: Any
+    :param key: 键
+    :type key: AnyKey
+
+    :return: 新节点
+    :rtype: Any
+    """  # noqa: RUF002
+    if isinstance(node, Mapping):
+        return (node if isinstance(node, PMap) else pmap(node)).remove(key.key)
+    return (node if isinstance(node, PVector) else pvector(node)).delete(key.key)
+
+
+def _walk(
+    root: Any,
+    path: ABCPath[Any],
+    operate: ConfigOperate,
+    *,
+    allow_create: bool,
+) -> list[Any]:
+    """
+    沿路径检查并收集每个键所在的节点
+
+    :param root: 根节点
+    :type root: Any
+    :param path: 键路径
+    :type path: ABCPath
+    :param operate: 路径不存在时报告的操作类型
+    :type operate: ConfigOperate
+    :param allow_create: 是否允许创建不存在的中间节点
+    :type allow_create: bool
+
+    :return: 与路径中的键一一对应的节点
+    :rtype: list[Any]
+
+    :raise ConfigDataTypeError: 节点不支持对应的键
+    :raise RequiredPathNotFoundError: 路径不存在
+    """
+    nodes: list[Any] = []
+    current = root
+    last_index = len(path) - 1
+    for key_index, key in enumerate(path):
+        missing_protocol = key.__supports__(current)
+        if missing_protocol:
+            raise ConfigDataTypeError(KeyInfo(path, key, key_index), missing_protocol, type(current))
+        nodes.append(current)
+        if key.__contains_inner_element__(current):
+            if key_index != last_index:
+                current = key.__get_inner_element__(current)
+            continue
+        if not allow_create:
+            raise RequiredPathNotFoundError(KeyInfo(path, key, key_index), operate)
+        current = pmap()
+    return nodes
+
+
+def _rebuild(path: ABCPath[Any], nodes: list[Any], value: Any) -> Any:
+    """
+    自底向上复制路径上的节点，其余节点与旧版本共享
+
+    :param path: 键路径
+    :type path: ABCPath
+    :param nodes: 与路径中的键一一对应的节点
+    :type nodes: list[Any]
+    :param value: 路径最后一个键对应的节点
+    :type value: Any
+
+    :return: 新的根节点
+    :rtype: Any
+    """  # noqa: RUF002
+    for key, node in zip(reversed(path), reversed(nodes), strict=True):
+        value = _set_inner(node, key, value)
+    return value
+
+
+class _PersistentMixin[D: PMap[Any, Any] | PVector[Any]](BasicIndexedConfigData[D]):
+    """持久化配置数据的公共实现"""
+
+    copy_policy = CopyPolicy.NONE
+
+    @property
+    @override
+    def data_read_only(self) -> Literal[False]:
+        """
+        配置数据是否为只读
+
+        :return: 配置数据是否为只读
+        :rtype: Literal[False]
+
+        .. note::
+           虽然原始数据本身不可变，但修改操作会替换为新版本的原始数据，所以始终认为配置数据非只读
+        """  # noqa: RUF002
+        return False
+
+    def modified(self, path: PathLike, value: Any, *, allow_create: bool = True) -> Self:
+        """
+        返回修改路径值后的新版本，自身不变
+
+        新版本与自身共享所有未被修改的节点，只复制路径上的O(路径长度)个节点
+
+        :param path: 路径
+        :type path: PathLike
+        :param value: 值
+        :type value: Any
+        :param allow_create: 是否允许创建不存在的路径
+        :type allow_create: bool
+
+        :return: 新版本的配置数据
+        :rtype: Self
+
+        :raise ConfigDataTypeError: 配置数据类型不匹配
+        :raise RequiredPathNotFoundError: 路径不存在且不允许创建
+        """  # noqa: RUF002
+        path = fmt_path(path)
+        nodes = _walk(self._data, path, ConfigOperate.Write, allow_create=allow_create)
+        return self._evolve(_rebuild(path, nodes, _freeze(value)) if nodes else self._data)
+
+    def deleted(self, path: PathLike) -> Self:
+        """
+        返回删除路径后的新版本，自身不变
+
+        :param path: 路径
+        :type path: PathLike
+
+        :return: 新版本的配置数据
+        :rtype: Self
+
+        :raise ConfigDataTypeError: 配置数据类型不匹配
+        :raise RequiredPathNotFoundError: 路径不存在
+        """  # noqa: RUF002
+        path = fmt_path(path)
+        nodes = _walk(self._data, path, ConfigOperate.Delete, allow_create=False)
+        if not nodes:
+            return self._evolve(self._data)
+        return self._evolve(_rebuild(path[:-1], nodes[:-1], _delete_inner(nodes[-1], path[-1])))
+
+    @override
+    @check_read_only
+    def modify(self, path: PathLike, value: Any, *, allow_create: bool = True) -> Self:
+        """
+        修改路径值
+
+        与 :py:meth:`modified` 相同，但会将自身替换为新版本，已有的快照不受影响
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.modify`
+        """  # noqa: RUF002
+        self._data = self.modified(path, value, allow_create=allow_create)._data  # noqa: SLF001
+        return self
+
+    @override
+    @check_read_only
+    def delete(self, path: PathLike) -> Self:
+        """
+        删除路径
+
+        与 :py:meth:`deleted` 相同，但会将自身替换为新版本，已有的快照不受影响
+
+        .. seealso::
+           :py:meth:`~config.abc.ABCIndexedConfigData.delete`
+        """  # noqa: RUF002
+        self._data = self.deleted(path)._data  # noqa: SLF001
+        return self
+
+    @override
+    def snapshot(self) -> Self:
+        """
+        获取配置数据快照
+
+        直接共享原始数据，O(1)
+
+        :return: 配置数据快照
+        :rtype: Self
+        """  # noqa: RUF002
+        return self._evolve(self._data)
+
+    @override
+    def __deepcopy__(self, memo: dict[str, Any]) -> Self:
+        return self.snapshot()
+
+    def _evolve(self, data: D) -> Self:
+        """
+        以新版本的原始数据创建同类型配置数据，保留拷贝策略
+
+        :param data: 新版本的原始数据
+        :type data: D
+
+        :return: 新版本的配置数据
+        :rtype: Self
+        """  # noqa: RUF002
+        result = self.from_data(data)
+        if result.copy_policy is not self.copy_policy:
+            result.copy_policy = self.copy_policy
+        return result
+
+
+class PersistentMappingConfigData(_PersistentMixin[PMap[Any, Any]], MappingConfigData[PMap[Any, Any]]):
+    """
+    持久化映射配置数据
+
+    原始数据为 :py:class:`~pyrsistent.PMap` ，所有修改都会以O(log n)的代价生成共享结构的新版本，
+    因此快照、历史版本与并发读取都无需复制整棵配置树
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self, data: Mapping[Any, Any] | None = None):
+        """
+        :param data: 映射数据，会被递归转换为持久化数据
+        :type data: Mapping[Any, Any] | None
+        """  # noqa: RUF002, D205
+        if data is None:
+            data = pmap()
+        self._data = cast(PMap[Any, Any], _freeze(data if isinstance(data, PMap) else dict(data)))
+
+    @override
+    @check_read_only
+    def clear(self) -> None:
+        self._data = pmap()
+
+    @override
+    @check_read_only
+    def popitem(self) -> Any:
+        if not self._data:
+            msg = "popitem(): mapping is empty"
+            raise KeyError(msg)
+        key = next(iter(self._data))
+        value = self._data[key]
+        self._data = self._data.remove(key)
+        return key, value
+
+    @override
+    @check_read_only
+    def update(self, m: Any = None, /, **kwargs: Any) -> None:
+        self._data = self._data.update(_freeze(dict(m if m is not None else kwargs)))
+
+    @override
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._touch()
+        self._data = self._data.set(index, _freeze(value))
+
+    @override
+    def __delitem__(self, index: Any) -> None:
+        self._touch()
+        self._data = self._data.remove(index)
+
+    @override
+    def __or__(self, other: Any) -> Self:
+        return self._evolve(self._data.update(_freeze(dict(_unwrap(other)))))
+
+    @check_read_only
+    def __ior__(self, other: Any) -> Self:
+        self._data = self._data.update(_freeze(dict(_unwrap(other))))
+        return self
+
+
+class PersistentSequenceConfigData(_PersistentMixin[PVector[Any]], SequenceConfigData[PVector[Any]]):
+    """
+    持久化序列配置数据
+
+    原始数据为 :py:class:`~pyrsistent.PVector` ，所有修改都会以O(log n)的代价生成共享结构的新版本
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self, data: Iterable[Any] | None = None):
+        """
+        :param data: 序列数据，会被递归转换为持久化数据
+        :type data: Iterable[Any] | None
+        """  # noqa: RUF002, D205
+        if data is None:
+            data = pvector()
+        self._data = cast(PVector[Any], _freeze(data if isinstance(data, PVector) else list(data)))
+
+    @override
+    @check_read_only
+    def append(self, value: Any) -> None:
+        self._data = self._data.append(_freeze(value))
+
+    @override
+    @check_read_only
+    def insert(self, index: int, value: Any) -> None:
+        items = self._data.tolist()
+        items.insert(index, value)
+        self._data = _freeze(items)
+
+    @override
+    @check_read_only
+    def extend(self, values: Iterable[Any]) -> None:
+        self._data = self._data.extend(_freeze(list(values)))
+
+    @override
+    @check_read_only
+    def pop(self, index: int = -1) -> Any:
+        value = self._data[index]
+        self._data = self._data.delete(index)
+        return value
+
+    @override
+    @check_read_only
+    def remove(self, value: Any) -> None:
+        self._data = self._data.remove(value)
+
+    @override
+    @check_read_only
+    def clear(self) -> None:
+        self._data = pvector()
+
+    @override
+    @check_read_only
+    def reverse(self) -> None:
+        self._data = self._data[::-1]
+
+    @override
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._touch()
+        if isinstance(index, slice):
+            items = self._data.tolist()
+            items[index] = value
+            self._data = _freeze(items)
+            return
+        self._data = self._data.set(index, _freeze(value))
+
+    @override
+    def __delitem__(self, index: Any) -> None:
+        self._touch()
+        if isinstance(index, slice):
+            items = self._data.tolist()
+            del items[index]
+            self._data = pvector(items)
+            return
+        self._data = self._data.delete(index)
+
+    @override
+    def __add__(self, other: Any) -> Self:
+        return self._evolve(self._data.extend(_freeze(list(_unwrap(other)))))
+
+    @override
+    @check_read_only
+    def __iadd__(self, other: Any) -> Self:
+        self._data = self._data.extend(_freeze(list(_unwrap(other))))
+        return self
+
+
+__all__ = (
+    "PersistentMappingConfigData",
+    "PersistentSequenceConfigData",
+)
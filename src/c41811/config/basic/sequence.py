@@ -53,17 +53,17 @@ class SequenceConfigData[D: Sequence[Any]](BasicIndexedConfigData[D], MutableSeq
     @override
     @check_read_only
     def append(self, value: Any) -> None:
-        self._data.append(value)  # type: ignore[attr-defined]
+        self._mutable_data().append(value)  # type: ignore[attr-defined]
 
     @override
     @check_read_only
     def insert(self, index: int, value: Any) -> None:
-        self._data.insert(index, value)  # type: ignore[attr-defined]
+        self._mutable_data().insert(index, value)  # type: ignore[attr-defined]
 
     @override
     @check_read_only
     def extend(self, values: Iterable[Any]) -> None:
-        self._data.extend(values)  # type: ignore[attr-defined]
+        self._mutable_data().extend(values)  # type: ignore[attr-defined]
 
     @override
     def index(self, *args: Any) -> int:
@@ -76,22 +76,22 @@ class SequenceConfigData[D: Sequence[Any]](BasicIndexedConfigData[D], MutableSeq
     @override
     @check_read_only
     def pop(self, index: int = -1) -> Any:
-        return self._data.pop(index)  # type: ignore[attr-defined]
+        return self._mutable_data().pop(index)  # type: ignore[attr-defined]
 
     @override
     @check_read_only
     def remove(self, value: Any) -> None:
-        self._data.remove(value)  # type: ignore[attr-defined]
+        self._mutable_data().remove(value)  # type: ignore[attr-defined]
 
     @override
     @check_read_only
     def clear(self) -> None:
-        self._data.clear()  # type: ignore[attr-defined]
+        self._mutable_data().clear()  # type: ignore[attr-defined]
 
     @override
     @check_read_only
     def reverse(self) -> None:
-        self._data.reverse()  # type: ignore[attr-defined]
+        self._mutable_data().reverse()  # type: ignore[attr-defined]
 
     @override
     def __reversed__(self) -> Iterator[D]:
@@ -185,11 +185,11 @@ class StringConfigData[D: str | bytes](BasicSingleConfigData[D]):
 
     @check_read_only
     def __setitem__(self, key: Any, value: D) -> None:
-        self._data[key] = value  # type: ignore[index]
+        self._mutable_data()[key] = value  # type: ignore[index]
 
     @check_read_only
     def __delitem__(self, key: Any) -> None:
-        del self._data[key]  # type: ignore[union-attr]
+        del self._mutable_data()[key]  # type: ignore[union-attr]
 
     def __reversed__(self) -> Any:  # 不支持reversed[D]语法
         return reversed(self._data)
@@ -9,6 +9,7 @@
 
 from collections.abc import Callable
 from functools import update_wrapper
+from threading import RLock
 from typing import Any
 from typing import cast
 from typing import overload
@@ -21,6 +22,16 @@ from ..abc import PathLike
 from ..errors import ConfigDataReadOnlyError
 from ..path import Path
 
+_ModifyLock = RLock()
+"""
+修改配置数据与获取写时复制快照之间互斥的锁
+
+写入者从取得可以原地修改的节点到修改完成期间都持有该锁，
+避免快照在此期间共享写入者正在修改的节点
+
+.. versionadded:: 0.3.1
+"""  # noqa: RUF001
+
 
 @overload
 def fmt_path(path: str) -> Path: ...
@@ -56,6 +67,11 @@ def check_read_only[F: Callable[..., Any]](func: F) -> F:
 
     :return: 装饰后方法
     :rtype: F
+
+    .. versionchanged:: 0.3.1
+       调用被装饰的方法前递增 :py:attr:`ABCConfigData.version`
+
+       调用被装饰的方法期间持有 :py:data:`_ModifyLock`
     """  # noqa: RUF002, D205
 
     @wrapt.decorator  # type: ignore[arg-type]
@@ -65,7 +81,12 @@ def check_read_only[F: Callable[..., Any]](func: F) -> F:
             raise TypeError(msg)
         if instance.read_only:
             raise ConfigDataReadOnlyError
-        return wrapped(*args, **kwargs)
+        # 修改前递增版本号, 修改中途失败时也视为已被修改
+        touch = getattr(instance, "_touch", None)
+        with _ModifyLock:
+            if touch is not None:
+                touch()
+            return wrapped(*args, **kwargs)
 
     return cast(F, update_wrapper(wrapper(func), func))
 
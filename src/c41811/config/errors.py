@@ -467,6 +467,28 @@ class ComponentMemberMismatchError(ComponentMetadataException):
         return msg
 
 
+class UnsavedChangesError(RuntimeError):
+    """
+    配置文件在磁盘上被修改，但配置池中缓存的配置文件有未保存的修改
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self, namespace: str, file_name: str):
+        """
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        """  # noqa: D205
+        self.namespace = namespace
+        self.file_name = file_name
+
+    @override
+    def __str__(self) -> str:
+        return f"Config file {self.namespace!r} {self.file_name!r} was modified on disk but has unsaved changes"
+
+
 __all__ = (
     "ComponentMemberMismatchError",
     "ComponentMetadataException",
@@ -483,5 +505,6 @@ __all__ = (
     "UnavailableAttribute",
     "UnknownErrorDuringValidateError",
     "UnknownTokenTypeError",
+    "UnsavedChangesError",
     "UnsupportedConfigFormatError",
 )
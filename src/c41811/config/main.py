@@ -3,8 +3,13 @@
 
 """主要部分"""
 
+import codecs
+import hashlib
+import inspect
+import io
 import os.path
 import re
+import tempfile
 from abc import ABC
 from abc import abstractmethod
 from collections.abc import Callable
@@ -12,6 +17,7 @@ from collections.abc import Generator
 from collections.abc import Iterable
 from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from copy import deepcopy
 from functools import update_wrapper
@@ -36,9 +42,12 @@ from .basic.core import BasicConfigPool
 from .basic.core import ConfigFile
 from .basic.factory import ConfigDataFactory
 from .errors import FailedProcessConfigFileError
+from .safe_writer import Durability
+from .safe_writer import current_batch
 from .safe_writer import safe_open
 from .utils import FrozenArguments
 from .utils import Ref
+from .utils import run_in_executor
 from .validators import ComponentValidatorFactory
 from .validators import DefaultValidatorFactory
 from .validators import ValidatorOptions
@@ -220,6 +229,7 @@ class ConfigRequirementDecorator:
         if filter_kwargs is None:
             filter_kwargs = {}
 
+        self._config_pool = config_pool
         self._config_loader: Callable[[], ABCConfigFile[D]] = lambda: config_pool.load(
             namespace, file_name, config_formats=config_formats, allow_initialize=allow_initialize
         )
@@ -257,6 +267,28 @@ class ConfigRequirementDecorator:
             return result
         return self._wrapped_filter(**kwargs)
 
+    async def acheck(self, *, ignore_cache: bool = False, **filter_kwargs: Any) -> Any:
+        """
+        :py:meth:`check` 的异步版本
+
+        在配置池的 :py:attr:`~config.basic.core.BasicConfigPool.executor` 中加载并检查配置
+
+        :param ignore_cache: 是否忽略缓存
+        :type ignore_cache: bool
+        :param filter_kwargs: RequiredConfig.filter的参数
+
+        :return: 得到的配置数据
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        return await run_in_executor(self._executor, self.check, ignore_cache=ignore_cache, **filter_kwargs)
+
+    @property
+    def _executor(self) -> Executor | None:
+        """异步接口使用的线程池"""
+        return self._config_pool.executor if isinstance(self._config_pool, BasicConfigPool) else None
+
     def __call__(self, func: Callable[[ABCConfigData, Any], Any]) -> Callable[..., Any]:
         """
         通过装饰器提供配置数据注入，配置数据将会注入到 ``self`` (如果为方法而不是函数)后的第一个参数
@@ -266,7 +298,24 @@ class ConfigRequirementDecorator:
 
         :return: 装饰后的函数
         :rtype: Callable[..., Any]
+
+        .. versionchanged:: 0.3.1
+           支持装饰 ``async def`` 函数，配置会在线程池中加载而不阻塞事件循环
         """  # noqa: RUF002
+        if inspect.iscoroutinefunction(func):
+
+            @wrapt.decorator
+            async def async_wrapper(
+                wrapped: Callable[..., Any],
+                _instance: object | None,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                config_data = await run_in_executor(self._executor, self._wrapped_filter, **self._filter_kwargs)
+
+                return await wrapped(config_data, *args, **kwargs)
+
+            return cast(Callable[..., Any], update_wrapper(async_wrapper(func), func))
 
         @wrapt.decorator
         def wrapper(
@@ -327,6 +376,37 @@ class ConfigPool(BasicConfigPool):
             self, namespace, file_name, RequiredPath(validator, validator_factory, static_config), **kwargs
         )
 
+    async def arequire(
+        self,
+        namespace: str,
+        file_name: str,
+        validator: Any,
+        validator_factory: Any = ValidatorTypes.DEFAULT,
+        static_config: Any | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        异步获取并检查配置
+
+        相当于 ``await pool.require(...).acheck()``
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param validator: 详见 :py:class:`RequiredPath`
+        :param validator_factory: 详见 :py:class:`RequiredPath`
+        :param static_config: 详见 :py:class:`RequiredPath`
+
+        :param kwargs: 详见 :py:class:`ConfigRequirementDecorator`
+
+        :return: 得到的配置数据
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        return await self.require(namespace, file_name, validator, validator_factory, static_config, **kwargs).acheck()
+
 
 DefaultConfigPool = ConfigPool()
 """
@@ -366,6 +446,29 @@ class BasicConfigSL(ABCConfigSL, ABC):
        重命名 ``BaseConfigSL`` 为 ``BasicConfigSL``
     """
 
+    durability: Durability | None = None
+    """
+    写入文件时的持久化级别，为None时使用配置池的 :py:attr:`~config.basic.core.BasicConfigPool.durability`
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
+
+    def _resolve_durability(self, processor_pool: ABCSLProcessorPool) -> Durability:
+        """
+        获取写入文件时实际使用的持久化级别
+
+        :param processor_pool: 配置池
+        :type processor_pool: ABCSLProcessorPool
+
+        :return: 持久化级别
+        :rtype: Durability
+
+        .. versionadded:: 0.3.1
+        """
+        if self.durability is not None:
+            return self.durability
+        return cast(Durability, getattr(processor_pool, "durability", Durability.FILE_AND_DIR))
+
     @override
     def register_to(self, config_pool: ABCSLProcessorPool | None = None) -> Self:
         """
@@ -439,6 +542,8 @@ class BasicLocalFileConfigSL(BasicConfigSL, ABC):
         *,
         reg_alias: str | None = None,
         create_dir: bool = True,
+        skip_unchanged: bool = False,
+        durability: Durability | None = None,
     ):
         # noinspection GrazieInspection
         """
@@ -450,10 +555,19 @@ class BasicLocalFileConfigSL(BasicConfigSL, ABC):
         :type reg_alias: Optional[str]
         :param create_dir: 是否允许创建目录
         :type create_dir: bool
+        :param skip_unchanged: 保存时先序列化到内存，内容与磁盘上的文件相同时跳过写入
+        :type skip_unchanged: bool
+        :param durability: 详见 :py:attr:`BasicConfigSL.durability`
+        :type durability: Durability | None
 
         .. versionchanged:: 0.2.0
            将 ``保存加载器参数`` 相关从 :py:class:`BasicConfigSL` 移动到此类
-        """  # noqa: D205
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``skip_unchanged``
+
+           添加参数 ``durability``
+        """  # noqa: RUF002, D205
 
         def _build_arg(value: SLArgumentType) -> FrozenArguments:
             sl_args: tuple[()] | tuple[Sequence[Any] | None, Mapping[str, Any] | None]
@@ -474,6 +588,9 @@ class BasicLocalFileConfigSL(BasicConfigSL, ABC):
         super().__init__(reg_alias=reg_alias)
 
         self.create_dir = create_dir
+        self.skip_unchanged = skip_unchanged
+        self.durability = durability
+        self._digests: dict[str, tuple[tuple[int, int, int], bytes]] = {}
 
     @property
     def saver_args(self) -> FrozenArguments:
@@ -487,6 +604,53 @@ class BasicLocalFileConfigSL(BasicConfigSL, ABC):
 
     raises = staticmethod(raises)
 
+    def head_text(self, head: bytes) -> str | None:
+        """
+        将文件开头的内容按加载时的编码解码为文本，供 :py:meth:`sniff` 使用
+
+        编码与错误处理方式取自 ``_l_open_kwargs`` ，以二进制模式加载时按utf-8解码
+
+        :param head: 文件开头的内容
+        :type head: bytes
+
+        :return: 文本，无法解码或包含空字符时为None
+        :rtype: str | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        open_kwargs = self._l_open_kwargs
+        encoding = "utf-8" if "b" in open_kwargs["mode"] else open_kwargs.get("encoding") or "utf-8"
+        # 文件开头可能在多字节字符中间被截断, 增量解码器会保留不完整的结尾而不报错
+        decoder = codecs.getincrementaldecoder(encoding)(open_kwargs.get("errors") or "strict")
+        try:
+            text = decoder.decode(head)
+        except UnicodeDecodeError:
+            return None
+        if "\0" in text:
+            return None
+        return text.removeprefix("\ufeff")
+
+    @staticmethod
+    def head_line(text: str, comments: tuple[str, ...] = ("#",)) -> str:
+        """
+        获取文本中第一个非空且不是注释的行，供 :py:meth:`sniff` 使用
+
+        :param text: 文本
+        :type text: str
+        :param comments: 注释前缀
+        :type comments: tuple[str, ...]
+
+        :return: 去除首尾空白后的行，没有时为空字符串
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped and not stripped.startswith(comments):
+                return stripped
+        return ""
+
     @override
     def save(
         self,
@@ -520,14 +684,164 @@ class BasicLocalFileConfigSL(BasicConfigSL, ABC):
            现在操作是理论上是多线/进程安全的
 
            添加参数 ``processor_pool``
+
+        .. versionchanged:: 0.3.1
+           启用 ``skip_unchanged`` 时内容未变化则不写入文件
         """
         merged_arguments: FrozenArguments = self._saver_args | (args, kwargs)
 
         file_path = processor_pool.helper.calc_path(root_path, namespace, file_name)
         if self.create_dir:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with safe_open(file_path, **self._s_open_kwargs) as f:
-            self.save_file(config_file, f, *merged_arguments.args, **merged_arguments.kwargs)
+        durability = self._resolve_durability(processor_pool)
+        if not self.skip_unchanged:
+            with safe_open(file_path, **self._s_open_kwargs, durability=durability) as f:
+                self.save_file(config_file, f, *merged_arguments.args, **merged_arguments.kwargs)
+            return
+
+        content = self._serialize(config_file, merged_arguments)
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if self._unchanged(file_path, content, digest):
+            return
+        with safe_open(file_path, "wb", durability=durability) as f:
+            f.write(content)
+        batch = current_batch()
+        if batch is None:
+            self._remember(file_path, digest)
+        else:
+            batch.call_after_commit(lambda: self._remember(file_path, digest))
+
+    def save_bytes(self, config_file: ABCConfigFile[Any], *args: Any, **kwargs: Any) -> bytes:
+        """
+        将配置序列化为字节而不写入文件
+
+        :param config_file: 待保存配置
+        :type config_file: ABCConfigFile
+
+        :return: 与写入磁盘时相同的字节
+        :rtype: bytes
+
+        :raise FailedProcessConfigFileError: 处理配置文件失败
+
+        .. versionadded:: 0.3.1
+        """
+        return self._serialize(config_file, self._saver_args | (args, kwargs))
+
+    def load_bytes(self, content: bytes, *args: Any, **kwargs: Any) -> ABCConfigFile[Any]:
+        """
+        从字节加载配置而不读取文件
+
+        :param content: 文件内容
+        :type content: bytes
+
+        :return: 配置对象
+        :rtype: ABCConfigFile
+
+        :raise FailedProcessConfigFileError: 处理配置文件失败
+
+        .. versionadded:: 0.3.1
+        """
+        merged_arguments: FrozenArguments = self._loader_args | (args, kwargs)
+
+        open_kwargs = self._l_open_kwargs
+        buffer = io.BytesIO(content)
+        source: io.BytesIO | io.TextIOWrapper = buffer
+        if "b" not in open_kwargs["mode"]:
+            # 与文本模式读取时的解码与换行符转换保持一致
+            source = io.TextIOWrapper(
+                buffer,
+                encoding=open_kwargs.get("encoding") or "utf-8",
+                errors=open_kwargs.get("errors"),
+                newline=open_kwargs.get("newline"),
+            )
+        return self.load_file(source, *merged_arguments.args, **merged_arguments.kwargs)
+
+    def _serialize(self, config_file: ABCConfigFile[Any], merged_arguments: FrozenArguments) -> bytes:
+        """
+        将配置序列化为写入磁盘时的字节
+
+        :param config_file: 待保存配置
+        :type config_file: ABCConfigFile
+        :param merged_arguments: 合并后的保存器参数
+        :type merged_arguments: FrozenArguments
+
+        :return: 写入磁盘时的字节
+        :rtype: bytes
+
+        .. versionadded:: 0.3.1
+        """
+        open_kwargs = self._s_open_kwargs
+        if "b" in open_kwargs["mode"]:
+            binary_buffer = io.BytesIO()
+            self.save_file(config_file, binary_buffer, *merged_arguments.args, **merged_arguments.kwargs)
+            return binary_buffer.getvalue()
+
+        text_buffer = io.StringIO(newline="\n")
+        self.save_file(config_file, text_buffer, *merged_arguments.args, **merged_arguments.kwargs)
+        text = text_buffer.getvalue()
+        # 与文本模式写入时的换行符转换保持一致
+        newline = open_kwargs.get("newline")
+        if newline is None:
+            newline = os.linesep
+        if newline not in ("", "\n"):
+            text = text.replace("\n", newline)
+        return text.encode(open_kwargs.get("encoding") or "utf-8", open_kwargs.get("errors") or "strict")
+
+    def _unchanged(self, file_path: str, content: bytes, digest: bytes) -> bool:
+        """
+        判断磁盘上的文件内容是否与待写入的内容相同
+
+        文件状态与上次写入后记录的一致时直接比较摘要，否则读取文件比较
+
+        :param file_path: 文件路径
+        :type file_path: str
+        :param content: 待写入的内容
+        :type content: bytes
+        :param digest: 待写入内容的摘要
+        :type digest: bytes
+
+        :return: 内容是否相同
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        signature = stat.st_mtime_ns, stat.st_size, stat.st_ino
+        if stat.st_size != len(content):
+            return False
+
+        cached = self._digests.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1] == digest
+        try:
+            with open(file_path, "rb") as f:
+                same = f.read() == content
+        except OSError:
+            return False
+        if same:
+            self._digests[file_path] = signature, digest
+        return same
+
+    def _remember(self, file_path: str, digest: bytes) -> None:
+        """
+        记录写入后文件的状态与摘要
+
+        :param file_path: 文件路径
+        :type file_path: str
+        :param digest: 写入内容的摘要
+        :type digest: bytes
+
+        .. versionadded:: 0.3.1
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:  # pragma: no cover
+            self._digests.pop(file_path, None)
+            return
+        self._digests[file_path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino), digest
 
     @override
     def load(
@@ -647,16 +961,22 @@ class BasicChainConfigSL(BasicConfigSL, ABC):
     .. versionadded:: 0.2.0
     """
 
-    def __init__(self, *, reg_alias: str | None = None, create_dir: bool = True):
+    def __init__(self, *, reg_alias: str | None = None, create_dir: bool = True, durability: Durability | None = None):
         """
         :param reg_alias: 处理器别名
         :type reg_alias: Optional[str]
         :param create_dir: 是否创建目录
         :type create_dir: bool
+        :param durability: 详见 :py:attr:`BasicConfigSL.durability`
+        :type durability: Durability | None
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``durability``
         """  # noqa: D205
         super().__init__(reg_alias=reg_alias)
 
         self.create_dir = create_dir
+        self.durability = durability
         self._cleanup_registry: bool = True
         """
         自动清理为了传递SL处理所加入配置池的配置文件
@@ -883,14 +1203,184 @@ class BasicCompressedConfigSL(BasicCachedConfigSL, ABC):
     """
     基础压缩配置文件SL处理器
 
+    压缩文件中的配置文件能由 :py:class:`BasicLocalFileConfigSL` 处理且 :py:attr:`in_memory` 为 ``True`` 时，
+    直接在内存中读写压缩文件的成员，否则解压到临时目录后交给配置池处理
+
     .. versionadded:: 0.2.0
+
+    .. versionchanged:: 0.3.1
+       支持不经过临时目录在内存中读写压缩文件的成员
+    """  # noqa: RUF002
+
+    in_memory: bool = False
     """
+    是否在内存中读写压缩文件的成员，为 ``True`` 时需实现 :py:meth:`read_member` 与 :py:meth:`write_members`
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
 
     @property
     @override
     def namespace_suffix(self) -> str:
         return super().namespace_suffix
 
+    def _member_processors(
+        self, config_pool: ABCConfigPool, member: str, config_format: str | None = None
+    ) -> list[BasicLocalFileConfigSL] | None:
+        """
+        获取能在内存中处理压缩文件成员的SL处理器
+
+        :param config_pool: 配置池
+        :type config_pool: ABCConfigPool
+        :param member: 成员文件名
+        :type member: str
+        :param config_format: 配置文件对象本身的配置格式
+        :type config_format: str | None
+
+        :return: 按尝试顺序排列的SL处理器，存在无法在内存中处理的配置格式时为None
+        :rtype: list[BasicLocalFileConfigSL] | None
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        if not self.in_memory:
+            return None
+        registry = config_pool.FileNameProcessors
+        reg_names = [reg_name for match in registry.match(member) for reg_name in registry[match]]
+        if config_format is not None:
+            reg_names.append(config_format)
+
+        processors: list[BasicLocalFileConfigSL] = []
+        for reg_name in dict.fromkeys(reg_names):
+            sl_processor = config_pool.SLProcessors.get(reg_name)
+            if not isinstance(sl_processor, BasicLocalFileConfigSL):
+                return None
+            processors.append(sl_processor)
+        return processors or None
+
+    @override
+    def save(
+        self,
+        processor_pool: ABCSLProcessorPool,
+        config_file: ABCConfigFile[Any],
+        root_path: str,
+        namespace: str,
+        file_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        config_pool = cast(ABCConfigPool, processor_pool)
+        member = self.filename_formatter(file_name)
+        processors = self._member_processors(config_pool, member, config_file.config_format)
+        # 保存时只读取文件的处理器(如PythonSL)没有可写入的内容
+        if processors is None or any("w" not in sl._s_open_kwargs["mode"] for sl in processors):  # noqa: SLF001
+            super().save(processor_pool, config_file, root_path, namespace, file_name, *args, **kwargs)
+            return
+
+        errors: dict[str, FailedProcessConfigFileError[Any]] = {}
+        for sl_processor in processors:
+            try:
+                content = sl_processor.save_bytes(config_file, *args, **kwargs)
+            except FailedProcessConfigFileError as err:
+                errors[sl_processor.reg_name] = err
+                continue
+            break
+        else:
+            raise FailedProcessConfigFileError(errors)
+
+        file_path = config_pool.helper.calc_path(root_path, namespace, file_name)
+        if self.create_dir:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self.write_members(
+            file_path,
+            {member.replace(os.sep, "/"): content},
+            durability=self._resolve_durability(config_pool),
+        )
+
+    @override
+    def load(
+        self,
+        processor_pool: ABCSLProcessorPool,
+        root_path: str,
+        namespace: str,
+        file_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> ABCConfigFile[Any]:
+        config_pool = cast(ABCConfigPool, processor_pool)
+        member = self.filename_formatter(file_name)
+        processors = self._member_processors(config_pool, member)
+        if processors is None:
+            return super().load(processor_pool, root_path, namespace, file_name, *args, **kwargs)
+
+        file_path = config_pool.helper.calc_path(root_path, namespace, file_name)
+        arcname = member.replace(os.sep, "/")
+        try:
+            content = self.read_member(file_path, arcname)
+        except KeyError:
+            msg = f"member {arcname!r} not found in {file_path!r}"
+            raise FileNotFoundError(msg) from None
+
+        errors: dict[str, FailedProcessConfigFileError[Any]] = {}
+        for sl_processor in processors:
+            try:
+                return sl_processor.load_bytes(content, *args, **kwargs)
+            except FailedProcessConfigFileError as err:
+                errors[sl_processor.reg_name] = err
+        raise FailedProcessConfigFileError(errors)
+
+    def read_member(self, file_path: str, member: str) -> bytes:
+        """
+        读取压缩文件中的成员
+
+        :param file_path: 压缩文件路径
+        :type file_path: str
+        :param member: 成员名，以 ``/`` 分隔
+        :type member: str
+
+        :return: 成员的内容
+        :rtype: bytes
+
+        :raise KeyError: 压缩文件中没有该成员
+
+        默认实现通过 :py:meth:`extract_file` 解压到临时目录后读取，子类应复写为直接读取成员
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        with tempfile.TemporaryDirectory() as extract_dir:
+            self.extract_file(file_path, extract_dir)
+            try:
+                with open(os.path.join(extract_dir, *member.split("/")), "rb") as f:
+                    return f.read()
+            except (FileNotFoundError, IsADirectoryError):
+                raise KeyError(member) from None
+
+    def write_members(
+        self, file_path: str, members: Mapping[str, bytes], *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
+        """
+        将成员写入新的压缩文件并原子地替换原文件，原文件中的其他成员原样保留
+
+        :param file_path: 压缩文件路径
+        :type file_path: str
+        :param members: 成员名(以 ``/`` 分隔)到内容的映射
+        :type members: Mapping[str, bytes]
+        :param durability: 写入压缩文件时的持久化级别
+        :type durability: Durability
+
+        默认实现通过 :py:meth:`extract_file` 与 :py:meth:`compress_file` 在临时目录中完成，子类应复写为直接写入成员
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        with tempfile.TemporaryDirectory() as extract_dir:
+            if os.path.exists(file_path):
+                self.extract_file(file_path, extract_dir)
+            for name, content in members.items():
+                path = os.path.join(extract_dir, *name.split("/"))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(content)
+            self._compress_file(file_path, extract_dir, durability)
+
     @override
     def after_save(
         self,
@@ -902,7 +1392,7 @@ class BasicCompressedConfigSL(BasicCachedConfigSL, ABC):
         file_name: str,
     ) -> None:
         extract_dir = config_pool.helper.calc_path(root_path, namespace)
-        self.compress_file(file_path, extract_dir)
+        self._compress_file(file_path, extract_dir, self._resolve_durability(config_pool))
 
     @override
     def before_load(
@@ -916,8 +1406,30 @@ class BasicCompressedConfigSL(BasicCachedConfigSL, ABC):
         extract_dir = config_pool.helper.calc_path(root_path, namespace)
         self.extract_file(file_path, extract_dir)
 
+    def _compress_file(self, file_path: str, extract_dir: str, durability: Durability) -> None:
+        """
+        调用 :py:meth:`compress_file` ，复写时没有接受参数 ``durability`` 的子类不会收到该参数
+
+        :param file_path: 压缩文件路径
+        :type file_path: str
+        :param extract_dir: 解压目录
+        :type extract_dir: str
+        :param durability: 写入压缩文件时的持久化级别
+        :type durability: Durability
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        parameters = inspect.signature(self.compress_file).parameters.values()
+        if any(param.name == "durability" or param.kind is param.VAR_KEYWORD for param in parameters):
+            self.compress_file(file_path, extract_dir, durability=durability)
+            return
+        # 兼容0.3.0的复写
+        self.compress_file(file_path, extract_dir)
+
     @abstractmethod
-    def compress_file(self, file_path: str, extract_dir: str) -> None:
+    def compress_file(
+        self, file_path: str, extract_dir: str, *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
         """
         压缩文件
 
@@ -926,7 +1438,13 @@ class BasicCompressedConfigSL(BasicCachedConfigSL, ABC):
 
         :param extract_dir: 解压目录
         :type extract_dir: str
-        """
+
+        :param durability: 写入压缩文件时的持久化级别
+        :type durability: Durability
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``durability`` ，复写时可以不接受该参数，此时使用默认的持久化级别
+        """  # noqa: RUF002
 
     @abstractmethod
     def extract_file(self, file_path: str, extract_dir: str) -> None:
@@ -5,13 +5,17 @@
 
 import warnings
 from abc import ABC
+from collections import OrderedDict
 from collections.abc import Iterable
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import MutableSequence
 from collections.abc import Sequence
-from functools import lru_cache
+from itertools import islice
+from threading import Lock
 from typing import Any
+from typing import ClassVar
+from typing import NamedTuple
 from typing import Self
 from typing import cast
 from typing import override
@@ -136,9 +140,125 @@ class IndexKey(IndexMixin[int, Sequence[Any]], ABCKey[int, Sequence[Any]]):
         return f"{meta}\\[{self._key}\\]"
 
 
+class PathCacheInfo(NamedTuple):
+    """
+    路径缓存统计信息
+
+    .. versionadded:: 0.3.1
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PathCache:
+    """
+    已解析路径的有界LRU缓存
+
+    路径对象不可变，所以命中时直接返回同一个对象
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :param maxsize: 最大缓存数量，为0时禁用缓存
+        :type maxsize: int
+
+        :raise ValueError: maxsize小于0
+        """  # noqa: RUF002, D205
+        self._cache: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._maxsize = 0
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """最大缓存数量，缩小时会立即淘汰最久未使用的路径"""  # noqa: RUF002
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            msg = f"maxsize must be non-negative, not {value}"
+            raise ValueError(msg)
+        with self._lock:
+            self._maxsize = value
+            while len(self._cache) > value:
+                self._cache.popitem(last=False)
+
+    def get(self, key: Any) -> Any | None:
+        """
+        获取缓存的路径并将其标记为最近使用
+
+        :param key: 缓存键
+        :type key: Any
+
+        :return: 缓存的路径，未命中时为 :py:const:`None`
+        :rtype: Any | None
+        """  # noqa: RUF002
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        缓存路径，超出容量时淘汰最久未使用的路径
+
+        :param key: 缓存键
+        :type key: Any
+        :param value: 路径
+        :type value: Any
+        """  # noqa: RUF002
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> PathCacheInfo:
+        """
+        获取缓存统计信息
+
+        :return: 缓存统计信息
+        :rtype: PathCacheInfo
+        """
+        with self._lock:
+            return PathCacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """清空缓存与统计信息"""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 class Path(ABCPath[AttrKey | IndexKey]):
     """配置数据路径"""
 
+    cache: ClassVar[PathCache] = PathCache()
+    """
+    :py:meth:`from_str` 使用的已解析路径缓存，可通过 :py:attr:`PathCache.maxsize` 调整容量
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF001
+
     @classmethod
     def from_str(cls, string: str) -> Self:
         """
@@ -149,8 +269,16 @@ class Path(ABCPath[AttrKey | IndexKey]):
 
         :return: 解析后的路径
         :rtype: Self
-        """
-        return cls(PathSyntaxParser.parse(string))
+
+        .. versionchanged:: 0.3.1
+           解析结果会被缓存在 :py:attr:`cache` 中，相同字符串会返回同一个不可变的路径对象
+        """  # noqa: RUF002
+        key = (cls, string)
+        path: Self | None = cls.cache.get(key)
+        if path is None:
+            path = cls(PathSyntaxParser.parse(string))
+            cls.cache.put(key, path)
+        return path
 
     @classmethod
     def from_locate(cls, locate: Iterable[str | int]) -> Self:
@@ -188,21 +316,15 @@ class Path(ABCPath[AttrKey | IndexKey]):
         return "".join(key.unparse() for key in self._keys)
 
 
-def _count_backslash(s: str) -> int:
-    count = 1
-    while s and (s[-1] == "\\"):
-        count += 1
-        s = s[:-1]
-    return count
+_ESCAPABLE_CHARS = frozenset(".\\[]{}")
+_TOKEN_TYPES = frozenset(".[]{}")
 
 
 class PathSyntaxParser:
     """路径语法解析器"""
 
     @staticmethod
-    @lru_cache
-    def tokenize(string: str) -> tuple[str, ...]:
-        # noinspection GrazieInspection
+    def tokenize(string: str) -> tuple[str, ...]:  # noqa: C901 (ignore complexity)
         r"""
         将字符串分词为以\开头的有意义片段
 
@@ -229,40 +351,87 @@ class PathSyntaxParser:
            更改返回值类型为 ``tuple[str, ...]``
 
            添加缓存
+
+        .. versionchanged:: 0.3.1
+           移除无界缓存，改为由 :py:attr:`Path.cache` 缓存完整的解析结果
+
+           只切分一次字符串并以逆序片段拼接token，对任意输入都不再退化为平方复杂度
         """  # noqa: RUF002
         # 开头默认为AttrKey
         if not string.startswith((r"\.", r"\[", r"\{")):
             string = rf"\.{string}"
 
-        tokens: list[str] = [""]
-        while string:
-            string, sep, token = string.rpartition("\\")
+        # 以\切分后pieces[0]必定为空, 每个片段都对应其前面的一个\
+        pieces = string.split("\\")
+
+        # 常见情况下每个\都是token的开头, 不需要合并token
+        simple_tokens: list[str] = []
+        for piece in islice(pieces, 1, None):
+            if (not piece) or (piece[0] not in _TOKEN_TYPES):
+                break
+            if (piece[0] in {"]", "}"}) and piece[1:]:
+                simple_tokens.append(f"\\{piece[0]}")
+                simple_tokens.append(piece[1:])
+                continue
+            simple_tokens.append(f"\\{piece}")
+        else:
+            return tuple(simple_tokens)
 
-            # 处理r"\\"防止转义
-            if not token:
-                token += tokens.pop()
+        # 每个片段前面的\之前紧邻的\数量, 即其左侧紧邻的连续空片段数
+        escaped_by = [0] * len(pieces)
+        for index in range(2, len(pieces)):
+            if not pieces[index - 1]:
+                escaped_by[index] = escaped_by[index - 1] + 1
 
-            # 对不存在的转义进行警告                                             # 检查这个转义符号是否已经被转义
-            elif sep and (token[0] not in {".", "\\", "[", "]", "{", "}"}) and _count_backslash(string) % 2:
-                warnings.warn(rf"invalid escape sequence '\{token[0]}'", SyntaxWarning, stacklevel=2)
+        # 从右往左处理, 每个token都是逆序存储的非空片段列表, 向左扩展token只需要append
+        tokens: list[list[str]] = [[]]
+        for index in range(len(pieces) - 1, 0, -1):
+            piece = pieces[index]
+
+            # 处理r"\\"防止转义
+            if not piece:
+                token = tokens.pop()
+            else:
+                token = [piece]
+                # 对不存在的转义进行警告, 前面紧邻偶数个\时这个\才没有被转义
+                if (piece[0] not in _ESCAPABLE_CHARS) and not escaped_by[index] % 2:
+                    warnings.warn(rf"invalid escape sequence '\{piece[0]}'", SyntaxWarning, stacklevel=2)
 
             # 连接不应单独存在的token
-            index_safe = (len(tokens) > 0) and (len(tokens[-1]) > 1)
-            if index_safe and (tokens[-1][1] not in {".", "[", "]", "{", "}"}):
-                token += tokens.pop()
+            if tokens and (top := tokens[-1]):
+                first = top[-1]
+                if len(first) > 1:
+                    next_type: str | None = first[1]
+                else:
+                    next_type = top[-2][0] if len(top) > 1 else None
+                if (next_type is not None) and (next_type not in _TOKEN_TYPES):
+                    top = tokens.pop()
+                    # 总是将较短的一方移动到较长的一方中
+                    if len(token) <= len(top):
+                        top.extend(token)
+                        token = top
+                    else:
+                        token[:0] = top
 
             # 将 r"\]" 和 r"\}" 后面紧随的字符单独切割出来
-            if token.startswith(("]", "}")) and token[1:]:
-                tokens.append(token[1:])
-                token = token[:1]
-
-            tokens.append(sep + token)
+            if token:
+                first = token[-1]
+                if (first[0] in {"]", "}"}) and (len(first) > 1 or len(token) > 1):
+                    if len(first) > 1:
+                        token[-1] = first[1:]
+                    else:
+                        token.pop()
+                    tokens.append(token)
+                    token = [first[0]]
+
+            token.append("\\")
+            tokens.append(token)
 
         tokens.reverse()
-        if tokens[-1] == "":
+        if not tokens[-1]:
             tokens.pop()
 
-        return tuple(tokens)
+        return tuple("".join(reversed(token)) for token in tokens)
 
     @classmethod
     def parse(cls, string: str) -> list[AttrKey | IndexKey]:  # noqa: C901 (ignore complexity)
@@ -281,6 +450,20 @@ class PathSyntaxParser:
         token_stack: list[str] = []
 
         tokenized_path = cls.tokenize(string)
+
+        def _token_closed(tk_typ: str, tk_close: str, tk: str, i: int) -> None:
+            try:
+                top = token_stack.pop()
+            except IndexError:
+                raise ConfigDataPathSyntaxException(
+                    TokenInfo(tokenized_path, tk, i), f"unmatched '{tk_close}'"
+                ) from None
+            if top != tk_typ:
+                raise ConfigDataPathSyntaxException(
+                    TokenInfo(tokenized_path, tk, i),
+                    f"closing parenthesis '{tk_close}' does not match opening parenthesis '{top}'",
+                )
+
         for index, token in enumerate(tokenized_path):
             if not token.startswith("\\"):
                 raise UnknownTokenTypeError(TokenInfo(tokenized_path, token, index))
@@ -288,19 +471,6 @@ class PathSyntaxParser:
             token_type = token[1]
             content = token[2:].replace("\\\\", "\\")
 
-            def _token_closed(tk_typ: str, tk_close: str, tk: str, i: int) -> None:
-                try:
-                    top = token_stack.pop()
-                except IndexError:
-                    raise ConfigDataPathSyntaxException(
-                        TokenInfo(tokenized_path, tk, i), f"unmatched '{tk_close}'"
-                    ) from None
-                if top != tk_typ:
-                    raise ConfigDataPathSyntaxException(
-                        TokenInfo(tokenized_path, tk, i),
-                        f"closing parenthesis '{tk_close}' does not match opening parenthesis '{top}'",
-                    )
-
             if token_type == "}":  # noqa: S105
                 _token_closed("{", "}", token, index)
                 continue
@@ -349,5 +519,7 @@ __all__ = (
     "AttrKey",
     "IndexKey",
     "Path",
+    "PathCache",
+    "PathCacheInfo",
     "PathSyntaxParser",
 )
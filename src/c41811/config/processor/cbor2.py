@@ -41,6 +41,16 @@ class CBOR2SL(BasicLocalFileConfigSL):
     _s_open_kwargs = {"mode": "wb"}  # noqa: RUF012
     _l_open_kwargs = {"mode": "rb"}  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        # 自描述标签55799
+        if head.startswith(b"\xd9\xd9\xf7"):
+            return 1.0
+        # 主类型4(数组)与5(映射)
+        if head and 0x80 <= head[0] <= 0xBF:
+            return 0.6
+        return 0.0
+
     @override
     def save_file(
         self, config_file: ABCConfigFile[Any], target_file: IO[bytes], *merged_args: Any, **merged_kwargs: Any
@@ -30,6 +30,7 @@ from ..basic.sequence import SequenceConfigData
 from ..errors import ComponentMetadataException
 from ..main import BasicChainConfigSL
 from ..main import RequiredPath
+from ..safe_writer import batch_commit
 from ..utils import Ref
 from ..validators import ValidatorOptions
 
@@ -230,18 +231,22 @@ class ComponentSL(BasicChainConfigSL):
 
         meta_config = self.meta_parser.convert_meta2config(config_data.meta)
         file_name, file_ext = os.path.splitext(file_name)
-        super().save_file(config_pool, ConfigFile(meta_config), namespace, self.meta_file + file_ext, *args, **kwargs)
-
-        for member in config_data.meta.members:
+        # 元配置与所有成员一起提交, 每个目录只同步一次
+        with batch_commit():
             super().save_file(
-                config_pool,
-                ConfigFile(config_data[member.filename], config_format=member.config_format),
-                namespace,
-                member.filename,
-                *args,
-                **kwargs,
+                config_pool, ConfigFile(meta_config), namespace, self.meta_file + file_ext, *args, **kwargs
             )
 
+            for member in config_data.meta.members:
+                super().save_file(
+                    config_pool,
+                    ConfigFile(config_data[member.filename], config_format=member.config_format),
+                    namespace,
+                    member.filename,
+                    *args,
+                    **kwargs,
+                )
+
     @override
     def load_file(
         self, config_pool: ABCConfigPool, namespace: str, file_name: str, *args: Any, **kwargs: Any
@@ -40,6 +40,13 @@ class HJsonSL(BasicLocalFileConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        text = self.head_text(head)
+        if text is not None and self.head_line(text, ("#", "//"))[:1] in ("{", "["):
+            return 0.5
+        return 0.0
+
     @override
     def save_file(
         self, config_file: ABCConfigFile[Any], target_file: SupportsWrite[str], *merged_args: Any, **merged_kwargs: Any
@@ -7,6 +7,7 @@ Properties格式配置文件处理器
 .. versionadded:: 0.3.0
 """
 
+import re
 from typing import Any
 from typing import override
 
@@ -26,6 +27,9 @@ except ImportError:
     raise DependencyNotFoundError(dependency) from None
 
 
+_PROPERTY_LINE = re.compile(r"[^\s=:]+\s*[=:]")
+
+
 class JPropertiesSL(BasicLocalFileConfigSL):
     """Properties格式处理器"""
 
@@ -43,6 +47,13 @@ class JPropertiesSL(BasicLocalFileConfigSL):
     _s_open_kwargs = {"mode": "wb"}  # noqa: RUF012
     _l_open_kwargs = {"mode": "rb"}  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        text = self.head_text(head)
+        if text is not None and _PROPERTY_LINE.match(self.head_line(text, ("#", "!"))):
+            return 0.4
+        return 0.0
+
     @override
     def save_file(
         self,
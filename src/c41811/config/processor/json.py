@@ -4,6 +4,7 @@
 """Json配置文件处理器"""
 
 import json
+import re
 from typing import Any
 from typing import override
 
@@ -13,6 +14,9 @@ from ..abc import ABCConfigFile
 from ..basic.core import ConfigFile
 from ..main import BasicLocalFileConfigSL
 
+# 区分以 "[" 开头的数组与TOML等格式的 "[section]"
+_JSON_START = re.compile(r"\{|\[\s*([\[{\"\-\d\]]|true|false|null|$)")
+
 
 class JsonSL(BasicLocalFileConfigSL):
     """json格式处理器"""
@@ -29,6 +33,13 @@ class JsonSL(BasicLocalFileConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        text = self.head_text(head)
+        if text is not None and _JSON_START.match(text.lstrip()):
+            return 0.9
+        return 0.0
+
     @override
     def save_file(
         self, config_file: ABCConfigFile[Any], target_file: SupportsWrite[str], *merged_args: Any, **merged_kwargs: Any
@@ -36,6 +36,13 @@ class PickleSL(BasicLocalFileConfigSL):
     _s_open_kwargs = {"mode": "wb"}  # noqa: RUF012
     _l_open_kwargs = {"mode": "rb"}  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        # 协议2及以上以PROTO操作码开头
+        if len(head) >= 2 and head[0] == 0x80 and 2 <= head[1] <= pickle.HIGHEST_PROTOCOL:
+            return 1.0
+        return 0.0
+
     @override
     def save_file(
         self,
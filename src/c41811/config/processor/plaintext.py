@@ -36,6 +36,11 @@ class PlainTextSL(BasicLocalFileConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        # 任何文本都能作为纯文本加载, 只作为最后的选择
+        return 0.1 if self.head_text(head) is not None else 0.0
+
     @override
     def save_file(
         self,
@@ -3,6 +3,7 @@
 
 """基于PyYAML的YAML格式处理器"""
 
+import re
 from typing import Any
 from typing import override
 
@@ -21,6 +22,9 @@ except ImportError:
     raise DependencyNotFoundError(dependency) from None
 
 
+_YAML_LINE = re.compile(r"- |[\w.\-\"' ]+:(\s|$)")
+
+
 class PyYamlSL(BasicLocalFileConfigSL):
     """基于PyYAML的YAML格式处理器"""
 
@@ -36,6 +40,18 @@ class PyYamlSL(BasicLocalFileConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        text = self.head_text(head)
+        if text is None:
+            return 0.0
+        line = self.head_line(text)
+        if line.startswith("---"):
+            return 0.8
+        if _YAML_LINE.match(line):
+            return 0.6
+        return 0.0
+
     @override
     def save_file(
         self, config_file: ABCConfigFile[Any], target_file: SupportsWrite[str], *merged_args: Any, **merged_kwargs: Any
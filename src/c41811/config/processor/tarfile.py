@@ -7,10 +7,13 @@ Tar压缩配置文件处理器
 .. versionadded:: 0.2.0
 """
 
+import io
 import itertools
 import os
 import tarfile
+import time
 from collections.abc import Callable
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import ReprEnum
 from typing import Any
@@ -20,6 +23,7 @@ from typing import override
 
 from ..basic.core import ConfigFile
 from ..main import BasicCompressedConfigSL
+from ..safe_writer import Durability
 from ..safe_writer import safe_open
 
 
@@ -41,19 +45,31 @@ class TarCompressionTypes(TarCompressionType, ReprEnum):
     LZMA = ("lzma", "xz")
 
 
+_COMPRESSION_MAGICS: dict[str, bytes] = {
+    "gz": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
 type ExtractionFilter = (
     Literal["fully_trusted", "tar", "data"] | Callable[[tarfile.TarInfo, str], tarfile.TarInfo | None]
 )
 
 
 class TarFileSL(BasicCompressedConfigSL):
-    """tar格式处理器"""
+    """
+    tar格式处理器
+
+    .. versionchanged:: 0.3.1
+       在内存中读写压缩文件的成员，``extraction_filter`` 只在需要解压到临时目录时生效
+    """  # noqa: RUF002
 
     def __init__(
         self,
         *,
         reg_alias: str | None = None,
         create_dir: bool = True,
+        durability: Durability | None = None,
         compression: TarCompressionTypes | str | None = TarCompressionTypes.ONLY_STORAGE,
         compress_level: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9] | int | None = None,
         extraction_filter: ExtractionFilter | None = "data",
@@ -63,14 +79,19 @@ class TarFileSL(BasicCompressedConfigSL):
         :type reg_alias: str | None
         :param create_dir: 是否创建目录
         :type create_dir: bool
+        :param durability: 详见 :py:attr:`~config.main.BasicConfigSL.durability`
+        :type durability: Durability | None
         :param compression: 压缩类型
         :type compression: TarCompressionTypes | str | None
         :param compress_level: 压缩等级
         :type compress_level: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9] | int | None
         :param extraction_filter: 解压过滤器
         :type extraction_filter: ExtractionFilter | None
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``durability``
         """  # noqa: D205
-        super().__init__(reg_alias=reg_alias, create_dir=create_dir)
+        super().__init__(reg_alias=reg_alias, create_dir=create_dir, durability=durability)
 
         if compression is None:
             compression = TarCompressionTypes.ONLY_STORAGE
@@ -105,18 +126,93 @@ class TarFileSL(BasicCompressedConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    in_memory = True
+
     @override
-    def compress_file(self, file_path: str, extract_dir: str) -> None:
+    def sniff(self, head: bytes) -> float:
+        if not self._short_name:
+            return 1.0 if head[257:262] == b"ustar" else 0.0
+        # 压缩后的内容不一定是tar
+        return 0.9 if head.startswith(_COMPRESSION_MAGICS[self._short_name]) else 0.0
+
+    def _open_kwargs(self) -> dict[str, Any]:
+        """
+        获取写入时传递给 :py:func:`tarfile.open` 的额外参数
+
+        :return: 额外参数
+        :rtype: dict[str, Any]
+
+        .. versionadded:: 0.3.1
+        """
         kwargs: dict[str, Any] = {}
         if self._compress_level is not None:
             # noinspection SpellCheckingInspection
             kwargs["compresslevel"] = self._compress_level
+        return kwargs
+
+    @override
+    def read_member(self, file_path: str, member: str) -> bytes:
+        with (
+            safe_open(file_path, "rb") as file,
+            tarfile.open(
+                mode=cast(Literal["r:", "r:gz", "r:bz2", "r:xz"], f"r:{self._short_name}"),
+                fileobj=file,
+            ) as tar,
+        ):
+            info = tar.getmember(member)
+            # 不跟随链接等特殊成员
+            extracted = tar.extractfile(info) if info.isfile() else None
+            if extracted is None:
+                raise KeyError(member)
+            return extracted.read()
+
+    @override
+    def write_members(
+        self, file_path: str, members: Mapping[str, bytes], *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
+        kept: list[tuple[tarfile.TarInfo, bytes | None]] = []
+        try:
+            with (
+                safe_open(file_path, "rb") as file,
+                tarfile.open(
+                    mode=cast(Literal["r:", "r:gz", "r:bz2", "r:xz"], f"r:{self._short_name}"),
+                    fileobj=file,
+                ) as tar,
+            ):
+                for info in tar:
+                    if info.name in members:
+                        continue
+                    extracted = tar.extractfile(info) if info.isfile() else None
+                    kept.append((info, None if extracted is None else extracted.read()))
+        except FileNotFoundError:
+            pass
+
+        mtime = time.time()
+        with (
+            safe_open(file_path, "wb", durability=durability) as file,
+            tarfile.open(
+                mode=cast(Literal["w:", "w:gz", "w:bz2", "w:xz"], f"w:{self._short_name}"),
+                fileobj=file,
+                **self._open_kwargs(),
+            ) as tar,
+        ):
+            for info, kept_content in kept:
+                tar.addfile(info, None if kept_content is None else io.BytesIO(kept_content))
+            for name, content in members.items():
+                info = tarfile.TarInfo(name)
+                info.size, info.mtime, info.mode = len(content), mtime, 0o644
+                tar.addfile(info, io.BytesIO(content))
+
+    @override
+    def compress_file(
+        self, file_path: str, extract_dir: str, *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
         with (
-            safe_open(file_path, "wb") as file,
+            safe_open(file_path, "wb", durability=durability) as file,
             tarfile.open(
                 mode=cast(Literal["w:", "w:gz", "w:bz2", "w:xz"], f"w:{self._short_name}"),
                 fileobj=file,
-                **kwargs,
+                **self._open_kwargs(),
             ) as tar,
         ):
             for root, dirs, files in os.walk(extract_dir):
@@ -7,6 +7,7 @@
 .. versionadded:: 0.3.0
 """
 
+import re
 from collections.abc import Mapping
 from collections.abc import MutableMapping
 from typing import IO
@@ -28,6 +29,9 @@ except ImportError:
     raise DependencyNotFoundError(dependency) from None
 
 
+_TOML_LINE = re.compile(r"\[\[?[\w.\-\" ]+\]\]?|[\w.\-\"]+\s*=\s*([\"'\[{+\-\d]|true|false|inf|nan).*")
+
+
 class TomlKitSL(BasicLocalFileConfigSL):
     """基于tomlkit的TOML格式处理器"""
 
@@ -43,6 +47,13 @@ class TomlKitSL(BasicLocalFileConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    @override
+    def sniff(self, head: bytes) -> float:
+        text = self.head_text(head)
+        if text is not None and _TOML_LINE.fullmatch(self.head_line(text)):
+            return 0.7
+        return 0.0
+
     @override
     def save_file(
         self,
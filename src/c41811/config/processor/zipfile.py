@@ -10,6 +10,7 @@ Zip压缩配置文件处理器
 import itertools
 import os
 import zipfile
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import ReprEnum
 from typing import Literal
@@ -18,6 +19,7 @@ from typing import override
 
 from ..basic.core import ConfigFile
 from ..main import BasicCompressedConfigSL
+from ..safe_writer import Durability
 from ..safe_writer import safe_open
 
 
@@ -41,13 +43,19 @@ class ZipCompressionTypes(ZipCompressionType, ReprEnum):
 
 
 class ZipFileSL(BasicCompressedConfigSL):
-    """zip格式处理器"""
+    """
+    zip格式处理器
+
+    .. versionchanged:: 0.3.1
+       在内存中读写压缩文件的成员
+    """
 
     def __init__(
         self,
         *,
         reg_alias: str | None = None,
         create_dir: bool = True,
+        durability: Durability | None = None,
         compression: ZipCompressionTypes | str | int | None = ZipCompressionTypes.ONLY_STORAGE,
         compress_level: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9] | int | None = None,
     ):
@@ -56,12 +64,17 @@ class ZipFileSL(BasicCompressedConfigSL):
         :type reg_alias: str | None
         :param create_dir: 是否创建目录
         :type create_dir: bool
+        :param durability: 详见 :py:attr:`~config.main.BasicConfigSL.durability`
+        :type durability: Durability | None
         :param compression: 压缩类型
         :type compression: ZipCompressionTypes | str | int | None
         :param compress_level: 压缩等级
         :type compress_level: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9] | int | None
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``durability``
         """  # noqa: D205
-        super().__init__(reg_alias=reg_alias, create_dir=create_dir)
+        super().__init__(reg_alias=reg_alias, create_dir=create_dir, durability=durability)
 
         if compression is None:
             compression = ZipCompressionTypes.ONLY_STORAGE
@@ -104,10 +117,21 @@ class ZipFileSL(BasicCompressedConfigSL):
 
     supported_file_classes = [ConfigFile]  # noqa: RUF012
 
+    in_memory = True
+
+    @override
+    def sniff(self, head: bytes) -> float:
+        # 本地文件头或空压缩包的中央目录结束记录
+        if head.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+            return 1.0
+        return 0.0
+
     @override
-    def compress_file(self, file_path: str, extract_dir: str) -> None:
+    def compress_file(
+        self, file_path: str, extract_dir: str, *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
         with (
-            safe_open(file_path, "wb") as file,
+            safe_open(file_path, "wb", durability=durability) as file,
             zipfile.ZipFile(
                 file, mode="w", compression=self._compression.zipfile_constant, compresslevel=self._compress_level
             ) as zip_file,
@@ -117,6 +141,33 @@ class ZipFileSL(BasicCompressedConfigSL):
                     path = os.path.normpath(os.path.join(root, item))
                     zip_file.write(path, arcname=os.path.relpath(path, extract_dir))
 
+    @override
+    def read_member(self, file_path: str, member: str) -> bytes:
+        with safe_open(file_path, "rb") as file, zipfile.ZipFile(file) as zip_file:
+            return zip_file.read(member)
+
+    @override
+    def write_members(
+        self, file_path: str, members: Mapping[str, bytes], *, durability: Durability = Durability.FILE_AND_DIR
+    ) -> None:
+        kept: list[tuple[zipfile.ZipInfo, bytes]] = []
+        try:
+            with safe_open(file_path, "rb") as file, zipfile.ZipFile(file) as zip_file:
+                kept = [(info, zip_file.read(info)) for info in zip_file.infolist() if info.filename not in members]
+        except FileNotFoundError:
+            pass
+
+        with (
+            safe_open(file_path, "wb", durability=durability) as file,
+            zipfile.ZipFile(
+                file, mode="w", compression=self._compression.zipfile_constant, compresslevel=self._compress_level
+            ) as zip_file,
+        ):
+            for info, content in kept:
+                zip_file.writestr(info, content)
+            for name, content in members.items():
+                zip_file.writestr(name, content)
+
     @override
     def extract_file(self, file_path: str, extract_dir: str) -> None:
         with safe_open(file_path, "rb") as file, zipfile.ZipFile(file) as zip_file:
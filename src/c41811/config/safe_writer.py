@@ -37,11 +37,16 @@ import sys
 import time
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
 from collections.abc import Generator
 from contextlib import AbstractContextManager
 from contextlib import contextmanager
 from contextlib import suppress
+from contextvars import ContextVar
+from enum import Enum
 from enum import IntEnum
+from io import BytesIO
+from io import StringIO
 from numbers import Real
 from pathlib import Path
 from threading import Lock
@@ -104,9 +109,10 @@ if sys.platform != "win32":  # pragma: no cover
         finally:
             os.close(fd)
 
-    def _replace_atomic(src: PathLike, dst: PathLike) -> None:
+    def _replace_atomic(src: PathLike, dst: PathLike, *, sync_directory: bool = True) -> None:
         os.rename(src, dst)
-        _sync_directory(os.path.normpath(os.path.dirname(dst)))
+        if sync_directory:
+            _sync_directory(os.path.normpath(os.path.dirname(dst)))
 
     def _move_atomic(src: PathLike, dst: PathLike) -> None:
         os.link(src, dst)
@@ -129,18 +135,17 @@ else:  # pragma: no cover
         if not rv:
             raise WinError()
 
-    def _replace_atomic(src: PathLike, dst: PathLike) -> None:
-        _handle_errors(
-            windll.kernel32.MoveFileExW(
-                _path2str(src), _path2str(dst), _windows_default_flags | _MOVEFILE_REPLACE_EXISTING
-            )
-        )
+    def _replace_atomic(src: PathLike, dst: PathLike, *, sync_directory: bool = True) -> None:
+        flags = _MOVEFILE_REPLACE_EXISTING
+        if sync_directory:
+            flags |= _windows_default_flags
+        _handle_errors(windll.kernel32.MoveFileExW(_path2str(src), _path2str(dst), flags))
 
     def _move_atomic(src: PathLike, dst: PathLike) -> None:
         _handle_errors(windll.kernel32.MoveFileExW(_path2str(src), _path2str(dst), _windows_default_flags))
 
 
-def replace_atomic(src: PathLike, dst: PathLike) -> None:
+def replace_atomic(src: PathLike, dst: PathLike, *, sync_directory: bool = True) -> None:
     """
     移动 ``src`` 到 ``dst``
 
@@ -152,8 +157,13 @@ def replace_atomic(src: PathLike, dst: PathLike) -> None:
     :type src: PathLike
     :param dst: 目标
     :type dst: PathLike
+    :param sync_directory: 是否在移动后同步目标所在目录以确保文件名落盘
+    :type sync_directory: bool
+
+    .. versionchanged:: 0.3.1
+       添加参数 ``sync_directory``
     """  # noqa: RUF002
-    _replace_atomic(src, dst)
+    _replace_atomic(src, dst, sync_directory=sync_directory)
 
 
 def move_atomic(src: PathLike, dst: PathLike) -> None:  # pragma: no cover
@@ -175,6 +185,29 @@ def move_atomic(src: PathLike, dst: PathLike) -> None:  # pragma: no cover
     _move_atomic(src, dst)
 
 
+class Durability(Enum):
+    """
+    提交写入时的持久化级别
+
+    无论哪个级别写入都通过临时文件原子替换目标文件，级别只影响断电或系统崩溃后的持久性
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    NONE = "none"
+    """
+    不调用fsync，适用于临时缓存与测试等可以丢失的数据
+    """  # noqa: RUF001
+    FILE = "file"
+    """
+    替换前同步文件内容，不同步所在目录
+    """  # noqa: RUF001
+    FILE_AND_DIR = "file_and_dir"
+    """
+    替换前同步文件内容，替换后同步所在目录，默认级别
+    """  # noqa: RUF001
+
+
 class ABCTempIOManager[F: AIO](ABC):
     """管理临时文件"""
 
@@ -204,6 +237,24 @@ class ABCTempIOManager[F: AIO](ABC):
         :rtype: F
         """
 
+    def open_path(self, path: Path | str, mode: str) -> F:
+        """
+        直接打开给定的路径而不创建临时文件
+
+        用于只读模式，读取不会修改文件，因此无需拷贝
+
+        :param path: 文件路径
+        :type path: Path | str
+        :param mode: 打开模式
+        :type mode: str
+
+        :return: 文件对象
+        :rtype: F
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        return cast(F, open(path, mode=mode))
+
     @staticmethod
     @abstractmethod
     def sync(file: F) -> None:
@@ -238,7 +289,7 @@ class ABCTempIOManager[F: AIO](ABC):
 
     @staticmethod
     @abstractmethod
-    def commit_by_path(temp_file: F, path: PathLike, mode: str) -> None:
+    def commit_by_path(temp_file: F, path: PathLike, mode: str, *, sync_directory: bool = True) -> None:
         """
         将临时文件移动到目标位置
 
@@ -248,6 +299,11 @@ class ABCTempIOManager[F: AIO](ABC):
         :type path: PathLike
         :param mode: 打开模式
         :type mode: str
+        :param sync_directory: 是否在移动后同步目标所在目录
+        :type sync_directory: bool
+
+        .. versionchanged:: 0.3.1
+           添加参数 ``sync_directory``
         """
 
 
@@ -277,11 +333,17 @@ class TempTextIOManager[F: TextIO](ABCTempIOManager[F]):
 
     @override
     def from_path(self, path: Path | str, mode: str) -> F:
+        # 写入期间持有路径锁, 批量提交中同一路径再次写入前会先提交, 所以固定的临时文件名不会被覆盖,
+        # 异常退出遗留的临时文件也会在下次写入时被复用
         f_path = f"{path}{self._suffix}"
         if "r" in mode or os.path.exists(path):
             shutil.copyfile(path, f_path)
         return cast(F, open(f_path, mode=mode, **self._open_kwargs))
 
+    @override
+    def open_path(self, path: Path | str, mode: str) -> F:
+        return cast(F, open(path, mode=mode, **self._open_kwargs))
+
     @staticmethod
     @override
     def sync(file: F) -> None:
@@ -304,9 +366,8 @@ class TempTextIOManager[F: TextIO](ABCTempIOManager[F]):
 
     @classmethod
     @override
-    def commit_by_path(cls, temp_file: F, path: PathLike, mode: str) -> None:
-        writeable = any(x in mode for x in "wax+")
-        if not writeable:
+    def commit_by_path(cls, temp_file: F, path: PathLike, mode: str, *, sync_directory: bool = True) -> None:
+        if not _is_writable_mode(mode):
             cls.rollback(temp_file)
             return
 
@@ -317,7 +378,7 @@ class TempTextIOManager[F: TextIO](ABCTempIOManager[F]):
             overwrite = False
 
         if overwrite:
-            replace_atomic(cast(TextIO, temp_file).name, path)
+            replace_atomic(cast(TextIO, temp_file).name, path, sync_directory=sync_directory)
         else:  # pragma: no cover
             move_atomic(cast(TextIO, temp_file).name, path)
 
@@ -339,23 +400,269 @@ GlobalModifyLock = Lock()
 """
 
 
+def _is_writable_mode(mode: str) -> bool:
+    """
+    检查打开模式是否会写入文件
+
+    :param mode: 打开模式
+    :type mode: str
+
+    :return: 是否会写入文件
+    :rtype: bool
+    """
+    return any(x in mode for x in "wax+")
+
+
+# Windows通过MoveFileExW的写穿透标志同步目录, 无法推迟到批量提交结束
+_DEFER_DIRECTORY_SYNC = sys.platform != "win32"
+
+# 待提交的临时文件: IO管理器, 临时文件, 目标路径, 打开模式与是否同步目录
+type _PendingCommit = tuple[ABCTempIOManager[Any], AIO, PathLike, str, bool]
+
+
+class CommitBatch:
+    """
+    批量提交
+
+    在 :py:func:`batch_commit` 上下文中通过 :py:class:`SafeOpen` 写入的文件仍会各自同步文件内容，
+    但替换目标文件推迟到退出上下文时依次进行，最后每个受影响的目录只同步一次
+
+    每个文件的替换仍是原子的，上下文中发生异常时所有尚未替换的临时文件都会被清理
+
+    写入的目标路径在提交或回滚前保持锁定，其他线程对同一路径的写入会等待批量提交结束
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(self) -> None:
+        """创建空的批量提交"""
+        self._lock = Lock()
+        self._pending: dict[str, _PendingCommit] = {}
+        self._locks: dict[str, Lock] = {}
+        self._directories: set[str] = set()
+        self._callbacks: list[Callable[[], Any]] = []
+
+    def __len__(self) -> int:
+        """尚未提交的文件数"""
+        return len(self._pending)
+
+    def holds(self, path: PathLike) -> bool:
+        """
+        是否持有目标路径的 :py:data:`FileLocks`
+
+        :param path: 目标路径
+        :type path: PathLike
+
+        :return: 是否持有
+        :rtype: bool
+        """
+        with self._lock:
+            return os.path.abspath(path) in self._locks
+
+    def add(
+        self,
+        manager: ABCTempIOManager[Any],
+        temp_file: AIO,
+        path: PathLike,
+        mode: str,
+        *,
+        sync_directory: bool,
+        lock: "Lock | None" = None,
+    ) -> None:
+        """
+        添加待提交的临时文件
+
+        目标路径的锁交由批量提交持有，直到提交或回滚后才释放，期间其他写入者会等待
+
+        :param manager: 临时文件所属的IO管理器
+        :type manager: ABCTempIOManager
+        :param temp_file: 临时文件对象
+        :type temp_file: AIO
+        :param path: 目标路径
+        :type path: PathLike
+        :param mode: 打开模式
+        :type mode: str
+        :param sync_directory: 提交后是否同步目标所在目录
+        :type sync_directory: bool
+        :param lock: 已获取的目标路径的 :py:data:`FileLocks` ，为None时表示已经由批量提交持有
+        :type lock: Lock | None
+        """  # noqa: RUF002
+        key = os.path.abspath(path)
+        with self._lock:
+            self._pending[key] = manager, temp_file, path, mode, sync_directory
+            if lock is not None:
+                self._locks[key] = lock
+
+    def call_after_commit(self, callback: Callable[[], Any]) -> None:
+        """
+        添加在所有文件提交后调用的回调，回滚时不会调用
+
+        :param callback: 回调
+        :type callback: Callable[[], Any]
+        """  # noqa: RUF002
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def flush(self, path: PathLike) -> None:
+        """
+        立即提交目标路径上待提交的临时文件
+
+        同一路径在批量提交中被再次写入前调用，避免临时文件被覆盖
+
+        :param path: 目标路径
+        :type path: PathLike
+        """  # noqa: RUF002
+        with self._lock:
+            entry = self._pending.pop(os.path.abspath(path), None)
+        if entry is not None:
+            self._commit_one(entry)
+
+    def _commit_one(self, entry: _PendingCommit) -> None:
+        """
+        提交单个临时文件并记录需要同步的目录
+
+        :param entry: 待提交的临时文件
+        :type entry: _PendingCommit
+        """
+        manager, temp_file, path, mode, sync_directory = entry
+        manager.commit_by_path(temp_file, path, mode, sync_directory=sync_directory and not _DEFER_DIRECTORY_SYNC)
+        if sync_directory and _DEFER_DIRECTORY_SYNC:
+            with self._lock:
+                self._directories.add(os.path.dirname(os.path.abspath(path)))
+
+    def commit(self) -> None:
+        """
+        依次替换所有目标文件，然后同步每个受影响的目录并调用回调
+
+        某个文件替换失败时清理其余尚未替换的临时文件并抛出异常
+        """  # noqa: RUF002
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        try:
+            for i, entry in enumerate(pending):
+                try:
+                    self._commit_one(entry)
+                except BaseException:
+                    for manager, temp_file, *_ in pending[i:]:
+                        with suppress(Exception):
+                            manager.rollback(temp_file)
+                    raise
+        finally:
+            self._release_locks()
+
+        with self._lock:
+            directories = sorted(self._directories)
+            self._directories.clear()
+            callbacks = self._callbacks.copy()
+            self._callbacks.clear()
+        for directory in directories:
+            _sync_directory(directory)
+        for callback in callbacks:
+            callback()
+
+    def rollback(self) -> None:
+        """清理所有尚未替换的临时文件"""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._callbacks.clear()
+            self._directories.clear()
+        for manager, temp_file, *_ in pending:
+            with suppress(Exception):
+                manager.rollback(temp_file)
+        self._release_locks()
+
+    def _release_locks(self) -> None:
+        """释放持有的所有目标路径的锁"""
+        with self._lock:
+            locks = list(self._locks.values())
+            self._locks.clear()
+        for lock in locks:
+            lock.release()
+
+
+_active_batch: ContextVar[CommitBatch | None] = ContextVar("_active_batch", default=None)
+
+
+def current_batch() -> CommitBatch | None:
+    """
+    获取当前上下文中的批量提交
+
+    :return: 批量提交，不在 :py:func:`batch_commit` 上下文中时为None
+    :rtype: CommitBatch | None
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    return _active_batch.get()
+
+
+@contextmanager
+def batch_commit() -> Generator[CommitBatch, Any, None]:
+    """
+    批量提交写入 (上下文管理器)
+
+    详见 :py:class:`CommitBatch` ，嵌套使用时加入外层的批量提交
+
+    基于 :py:mod:`contextvars` ，只对当前线程与复制了当前上下文的任务生效
+
+    :return: 批量提交
+    :rtype: Generator[CommitBatch, Any, None]
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    outer = _active_batch.get()
+    if outer is not None:
+        yield outer
+        return
+
+    batch = CommitBatch()
+    token = _active_batch.set(batch)
+    try:
+        yield batch
+    except BaseException:
+        batch.rollback()
+        raise
+    finally:
+        _active_batch.reset(token)
+    batch.commit()
+
+
 class SafeOpen[F: AIO]:
-    """安全的打开文件"""
+    """
+    安全的打开文件
+
+    .. versionchanged:: 0.3.1
+       只读模式直接以共享锁打开目标文件，不再创建临时文件拷贝
+    """  # noqa: RUF002
 
     def __init__(
-        self, io_manager: ABCTempIOManager[Any], timeout: float | None = 1, flag: LockFlags = LockFlags.EXCLUSIVE
+        self,
+        io_manager: ABCTempIOManager[Any],
+        timeout: float | None = 1,
+        flag: LockFlags | None = None,
+        durability: Durability = Durability.FILE_AND_DIR,
     ) -> None:
         """
         :param io_manager: IO管理器
         :type io_manager: ABCTempIOManager
         :param timeout: 超时时间
         :type timeout: float | None
-        :param flag: 锁标志
-        :type flag: LockFlags
-        """  # noqa: D205
+        :param flag: 锁标志，为 :py:const:`None` 时只读模式使用 :py:attr:`LockFlags.SHARED` ，
+            其余模式使用 :py:attr:`LockFlags.EXCLUSIVE`
+        :type flag: LockFlags | None
+        :param durability: 提交写入时的持久化级别
+        :type durability: Durability
+
+        .. versionchanged:: 0.3.1
+           参数 ``flag`` 默认值改为 :py:const:`None` 以根据打开模式自动选择锁类型
+
+           添加参数 ``durability``
+        """  # noqa: RUF002, D205
         self._manager = io_manager
         self._timeout = timeout
         self._flag = flag
+        self._durability = durability
 
     @contextmanager
     def open_path(self, path: str | Path, mode: str) -> Generator[F | None, Any, None]:
@@ -370,23 +677,40 @@ class SafeOpen[F: AIO]:
 
         :return: 上下文管理器
         :rtype: Generator[F | None, Any, None]
+
+        .. versionchanged:: 0.3.1
+           只读模式直接读取目标文件而不创建临时文件
+
+           在 :py:func:`batch_commit` 上下文中推迟替换目标文件
         """
-        with GlobalModifyLock:
-            lock = FileLocks.setdefault(_path2str(path), Lock())
+        if not _is_writable_mode(mode):
+            yield from self._open_path_shared(path, mode)
+            return
 
-        if not lock.acquire(timeout=-1 if self._timeout is None else self._timeout):  # pragma: no cover
-            msg = "Timeout waiting for file lock"
-            raise TimeoutError(msg)
+        batch = _active_batch.get()
+        lock = self._acquire_path_lock(path, batch)
 
         f: F | None = None
         try:
+            if batch is not None:
+                batch.flush(path)
             f = self._manager.from_path(path, mode)
-            acquire_lock(cast(AIO, f), self._flag, timeout=cast(Real | None, self._timeout))
+            acquire_lock(
+                cast(AIO, f),
+                LockFlags.EXCLUSIVE if self._flag is None else self._flag,
+                timeout=cast(Real | None, self._timeout),
+            )
             with cast(AIO, f):
                 yield f
-                self._manager.sync(cast(AIO, f))
+                if self._durability is not Durability.NONE:
+                    self._manager.sync(cast(AIO, f))
                 release_lock(cast(AIO, f))
-            self._manager.commit_by_path(cast(AIO, f), path, mode)
+            sync_directory = self._durability is Durability.FILE_AND_DIR
+            if batch is None:
+                self._manager.commit_by_path(cast(AIO, f), path, mode, sync_directory=sync_directory)
+            else:
+                batch.add(self._manager, cast(AIO, f), path, mode, sync_directory=sync_directory, lock=lock)
+                lock = None
         except BaseException as err:
             if f is not None:
                 try:
@@ -395,10 +719,73 @@ class SafeOpen[F: AIO]:
                     raise err from None
             raise
         finally:
-            lock.release()
+            if lock is not None:
+                lock.release()
             with suppress(Exception):
                 release_lock(f)  # type: ignore[arg-type]
 
+    def _acquire_path_lock(self, path: str | Path, batch: CommitBatch | None) -> "Lock | None":
+        """
+        获取路径对应的 :py:data:`FileLocks`
+
+        :param path: 文件路径
+        :type path: str | pathlib.Path
+        :param batch: 当前上下文中的批量提交
+        :type batch: CommitBatch | None
+
+        :return: 获取到的锁，批量提交已经持有该路径的锁时为None
+        :rtype: Lock | None
+
+        :raise TimeoutError: 等待锁超时
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        # 批量提交持有锁时同一路径之前的写入尚未提交, 无需也不能再次获取
+        if batch is not None and batch.holds(path):
+            return None
+        with GlobalModifyLock:
+            lock = FileLocks.setdefault(_path2str(path), Lock())
+        if not lock.acquire(timeout=-1 if self._timeout is None else self._timeout):  # pragma: no cover
+            msg = "Timeout waiting for file lock"
+            raise TimeoutError(msg)
+        return lock
+
+    def _open_path_shared(self, path: str | Path, mode: str) -> Generator[F, Any, None]:
+        """
+        持有路径对应的 :py:data:`FileLocks` 与共享锁读取目标文件的全部内容并在关闭后返回内存中的副本
+
+        写入总是通过临时文件原子替换目标文件，所以读取者不会观察到写了一半的文件，也无需创建临时文件，
+        读取完成后立即关闭文件，解析期间不再持有锁与文件，避免同进程的写入在替换目标文件时因文件被打开而失败
+
+        :param path: 文件路径
+        :type path: str | pathlib.Path
+        :param mode: 打开模式
+        :type mode: str
+
+        :return: 生成IO对象的生成器
+        :rtype: Generator[F, Any, None]
+
+        .. versionadded:: 0.3.1
+        """  # noqa: RUF002
+        lock = self._acquire_path_lock(path, _active_batch.get())
+        try:
+            f = self._manager.open_path(path, mode)
+            with cast(AIO, f):
+                acquire_lock(
+                    cast(AIO, f),
+                    LockFlags.SHARED if self._flag is None else self._flag,
+                    timeout=cast(Real | None, self._timeout),
+                )
+                try:
+                    content = cast(AIO, f).read()
+                finally:
+                    with suppress(Exception):
+                        release_lock(cast(AIO, f))
+        finally:
+            if lock is not None:
+                lock.release()
+        yield cast(F, BytesIO(content) if isinstance(content, bytes) else StringIO(content))
+
     @contextmanager
     def open_file(self, file: F) -> Generator[F | None, Any, None]:  # pragma: no cover # 用不上 暂不维护
         """
@@ -417,11 +804,12 @@ class SafeOpen[F: AIO]:
             msg = "Timeout waiting for file lock"
             raise TimeoutError(msg)
 
-        acquire_lock(file, self._flag, timeout=cast(Real | None, self._timeout), immediately_release=True)
+        flag = LockFlags.EXCLUSIVE if self._flag is None else self._flag
+        acquire_lock(file, flag, timeout=cast(Real | None, self._timeout), immediately_release=True)
         f: F | None = None
         try:
             f = self._manager.from_file(file)
-            acquire_lock(file, self._flag, timeout=cast(Real | None, self._timeout))
+            acquire_lock(file, flag, timeout=cast(Real | None, self._timeout))
             with cast(AIO, f):
                 yield f
                 self._manager.sync(cast(AIO, f))
@@ -548,8 +936,9 @@ def safe_open(
     mode: OpenBinaryMode,
     *,
     timeout: float | None = 1,
-    flag: LockFlags = LockFlags.EXCLUSIVE,
+    flag: LockFlags | None = None,
     io_manager: ABCTempIOManager[Any] | None = None,
+    durability: Durability = Durability.FILE_AND_DIR,
     **manager_kwargs: Any,
 ) -> AbstractContextManager[IO[bytes]]: ...
 
@@ -560,8 +949,9 @@ def safe_open(
     mode: OpenTextMode,
     *,
     timeout: float | None = 1,
-    flag: LockFlags = LockFlags.EXCLUSIVE,
+    flag: LockFlags | None = None,
     io_manager: ABCTempIOManager[Any] | None = None,
+    durability: Durability = Durability.FILE_AND_DIR,
     **manager_kwargs: Any,
 ) -> AbstractContextManager[IO[str]]: ...
 
@@ -571,8 +961,9 @@ def safe_open(
     mode: str,
     *,
     timeout: float | None = 1,
-    flag: LockFlags = LockFlags.EXCLUSIVE,
+    flag: LockFlags | None = None,
     io_manager: ABCTempIOManager[Any] | None = None,
+    durability: Durability = Durability.FILE_AND_DIR,
     **manager_kwargs: Any,
 ) -> AbstractContextManager[AIO | TextIO]:
     """
@@ -584,27 +975,40 @@ def safe_open(
     :type mode: str
     :param timeout: 超时时间
     :type timeout: float | None
-    :param flag: 锁类型
-    :type flag: LockFlags
+    :param flag: 锁类型，为 :py:const:`None` 时根据打开模式自动选择
+    :type flag: LockFlags | None
     :param io_manager: 临时文件管理器
     :type io_manager: ABCTempIOManager | None
+    :param durability: 提交写入时的持久化级别
+    :type durability: Durability
     :param manager_kwargs: 临时文件管理器参数
     :type manager_kwargs: dict
 
     :return: 返回IO对象的上下文管理器
     :rtype: ContextManager[IO | TextIO]
-    """
+
+    .. versionchanged:: 0.3.1
+       只读模式直接以共享锁打开目标文件，不再创建临时文件拷贝
+
+       添加参数 ``durability``
+    """  # noqa: RUF002
     if io_manager is None:
         io_manager = TempTextIOManager(**manager_kwargs)
-    return cast(AbstractContextManager[AIO | TextIO], SafeOpen(io_manager, timeout, flag).open_path(path, mode))
+    return cast(
+        AbstractContextManager[AIO | TextIO], SafeOpen(io_manager, timeout, flag, durability).open_path(path, mode)
+    )
 
 
 __all__ = (
+    "CommitBatch",
+    "Durability",
     "FileLocks",
     "GlobalModifyLock",
     "LockFlags",
     "SafeOpen",
     "acquire_lock",
+    "batch_commit",
+    "current_batch",
     "release_lock",
     "safe_open",
 )
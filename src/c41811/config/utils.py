@@ -6,12 +6,26 @@
 .. versionadded:: 0.2.0
 """
 
+import asyncio
+import contextvars
+import threading
+import weakref
 from collections import OrderedDict
+from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from enum import Enum
+from functools import partial
 from functools import wraps
+from types import BuiltinFunctionType
+from types import CodeType
+from types import EllipsisType
+from types import FunctionType
+from types import NoneType
 from types import NotImplementedType
 from typing import Any
 from typing import Self
@@ -153,10 +167,217 @@ class FrozenArguments:
         return hash(self._args) ^ hash(self._kwargs)
 
 
+_ATOMIC_TYPES: frozenset[type] = frozenset(
+    {
+        NoneType,
+        EllipsisType,
+        NotImplementedType,
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        range,
+        type,
+        CodeType,
+        FunctionType,
+        BuiltinFunctionType,
+        property,
+        weakref.ref,
+    }
+)
+"""
+与 :py:func:`copy.deepcopy` 一致，拷贝时原样返回的不可变类型
+"""  # noqa: RUF001
+
+
+def _fast_deepcopy_dict(obj: dict[Any, Any], memo: dict[int, Any]) -> dict[Any, Any]:
+    result: dict[Any, Any] = {}
+    memo[id(obj)] = result
+    for k, v in obj.items():
+        if type(k) not in _ATOMIC_TYPES:
+            k = _fast_deepcopy(k, memo)  # noqa: PLW2901
+        result[k] = v if type(v) in _ATOMIC_TYPES else _fast_deepcopy(v, memo)
+    return result
+
+
+def _fast_deepcopy_ordered_dict(obj: OrderedDict[Any, Any], memo: dict[int, Any]) -> OrderedDict[Any, Any]:
+    result: OrderedDict[Any, Any] = OrderedDict()
+    memo[id(obj)] = result
+    for k, v in obj.items():
+        if type(k) not in _ATOMIC_TYPES:
+            k = _fast_deepcopy(k, memo)  # noqa: PLW2901
+        result[k] = v if type(v) in _ATOMIC_TYPES else _fast_deepcopy(v, memo)
+    return result
+
+
+def _fast_deepcopy_list(obj: list[Any], memo: dict[int, Any]) -> list[Any]:
+    result: list[Any] = []
+    memo[id(obj)] = result
+    result.extend(item if type(item) in _ATOMIC_TYPES else _fast_deepcopy(item, memo) for item in obj)
+    return result
+
+
+def _fast_deepcopy_tuple(obj: tuple[Any, ...], memo: dict[int, Any]) -> tuple[Any, ...]:
+    copied = [item if type(item) in _ATOMIC_TYPES else _fast_deepcopy(item, memo) for item in obj]
+    # 元素中存在对自身的循环引用时元组已在递归中被拷贝
+    result = memo.get(id(obj), _MISSING)
+    if result is not _MISSING:
+        return cast(tuple[Any, ...], result)
+    if all(x is y for x, y in zip(obj, copied, strict=True)):
+        return obj
+    copied_tuple = tuple(copied)
+    memo[id(obj)] = copied_tuple
+    return copied_tuple
+
+
+def _fast_deepcopy_set(obj: set[Any], memo: dict[int, Any]) -> set[Any]:
+    result: set[Any] = set()
+    memo[id(obj)] = result
+    for item in obj:
+        result.add(item if type(item) in _ATOMIC_TYPES else _fast_deepcopy(item, memo))
+    return result
+
+
+_FAST_DEEPCOPY_DISPATCH: dict[type, Callable[[Any, dict[int, Any]], Any]] = {
+    dict: _fast_deepcopy_dict,
+    OrderedDict: _fast_deepcopy_ordered_dict,
+    list: _fast_deepcopy_list,
+    tuple: _fast_deepcopy_tuple,
+    set: _fast_deepcopy_set,
+}
+
+_MISSING = object()
+
+
+def _fast_deepcopy(obj: Any, memo: dict[int, Any]) -> Any:
+    result = memo.get(id(obj), _MISSING)
+    if result is not _MISSING:
+        return result
+    copier = _FAST_DEEPCOPY_DISPATCH.get(type(obj))
+    if copier is None:
+        # 与copy.deepcopy共用memo以保持引用关系
+        return deepcopy(obj, memo)
+    return copier(obj, memo)
+
+
+def fast_deepcopy[T](obj: T) -> T:
+    """
+    语义与 :py:func:`copy.deepcopy` 相同的快速深拷贝
+
+    不可变的叶子原样返回，内置容器( :py:class:`dict` :py:class:`~collections.OrderedDict` :py:class:`list`
+    :py:class:`tuple` :py:class:`set` )按精确类型分派到专用拷贝函数，其余对象回退到 :py:func:`copy.deepcopy`
+
+    循环引用与共享引用的处理方式与 :py:func:`copy.deepcopy` 一致
+
+    :param obj: 要拷贝的对象
+    :type obj: T
+
+    :return: 拷贝结果
+    :rtype: T
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if type(obj) in _ATOMIC_TYPES:
+        return obj
+    return cast(T, _fast_deepcopy(obj, {}))
+
+
+class CopyPolicy(Enum):
+    """
+    配置数据向外返回内部数据时的拷贝策略
+
+    .. versionadded:: 0.3.1
+    """
+
+    DEEPCOPY = "deepcopy"
+    """
+    总是使用 :py:func:`copy.deepcopy`
+    """
+    FAST = "fast"
+    """
+    使用 :py:func:`fast_deepcopy` ，结果与 :py:attr:`DEEPCOPY` 相同但更快
+    """  # noqa: RUF001
+    NONE = "none"
+    """
+    不进行拷贝直接返回内部数据的引用
+
+    .. caution::
+       调用方必须保证不会修改返回值，否则会直接修改配置数据，仅应在可信的热点路径上使用
+    """  # noqa: RUF001
+
+    def copy[T](self, obj: T) -> T:
+        """
+        按照策略拷贝对象
+
+        :param obj: 要拷贝的对象
+        :type obj: T
+
+        :return: 拷贝结果
+        :rtype: T
+        """
+        if self is CopyPolicy.NONE:
+            return obj
+        if self is CopyPolicy.FAST:
+            return fast_deepcopy(obj)
+        return deepcopy(obj)
+
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """
+    获取异步接口默认使用的线程池
+
+    首次调用时创建，线程数上限与 :py:class:`~concurrent.futures.ThreadPoolExecutor` 的默认值相同，
+    由所有未指定线程池的配置池与SL处理器共享
+
+    :return: 线程池
+    :rtype: ThreadPoolExecutor
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    global _default_executor  # noqa: PLW0603
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(thread_name_prefix="C41811.Config")
+    return _default_executor
+
+
+async def run_in_executor[R](executor: Executor | None, func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+    """
+    在线程池中运行阻塞函数并等待结果
+
+    与 :py:func:`asyncio.to_thread` 一样会传递当前上下文
+
+    :param executor: 线程池，为None时使用 :py:func:`default_executor`
+    :type executor: Executor | None
+    :param func: 阻塞函数
+    :type func: Callable[..., R]
+
+    :return: 函数返回值
+    :rtype: R
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+    if executor is None:
+        executor = default_executor()
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
 __all__ = (
+    "CopyPolicy",
     "FrozenArguments",
     "Ref",
     "Unset",
     "UnsetType",
+    "default_executor",
+    "fast_deepcopy",
+    "run_in_executor",
     "singleton",
 )
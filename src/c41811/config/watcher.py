@@ -0,0 +1,374 @@
+# cython: language_level = 3  # noqa: ERA001
+
+
+"""
+配置文件监视器
+
+.. versionadded:: 0.3.1
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+import warnings
+from collections.abc import Callable
+from threading import Event
+from threading import Thread
+from types import TracebackType
+from typing import Any
+from typing import Literal
+from typing import Self
+
+from .abc import ABCConfigFile
+from .basic.core import BasicConfigPool
+
+type Backend = Literal["inotify", "poll"]
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+_EVENT = struct.Struct("iIII")
+
+
+def _load_libc() -> Any | None:
+    """
+    加载提供inotify的libc
+
+    :return: libc，不支持inotify时为None
+    :rtype: Any | None
+    """  # noqa: RUF002
+    if not sys.platform.startswith("linux"):  # pragma: no cover
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        init, add_watch, rm_watch = libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError):  # pragma: no cover
+        return None
+    init.argtypes, init.restype = [ctypes.c_int], ctypes.c_int
+    add_watch.argtypes, add_watch.restype = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32], ctypes.c_int
+    rm_watch.argtypes, rm_watch.restype = [ctypes.c_int, ctypes.c_int], ctypes.c_int
+    return libc
+
+
+_libc: Any = _load_libc()
+
+
+class _Inotify:
+    """基于inotify的目录监视"""
+
+    def __init__(self) -> None:
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:  # pragma: no cover
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.fd: int = fd
+        self._watches: dict[str, int] = {}
+        self._directories: dict[int, str] = {}
+
+    def update(self, directories: set[str]) -> None:
+        """
+        同步监视的目录
+
+        :param directories: 需要监视的目录
+        :type directories: set[str]
+        """
+        for directory in self._watches.keys() - directories:
+            wd = self._watches.pop(directory)
+            self._directories.pop(wd, None)
+            _libc.inotify_rm_watch(self.fd, wd)
+        for directory in directories - self._watches.keys():
+            wd = _libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                # 目录不存在等情况下次同步时重试
+                continue
+            self._watches[directory] = wd
+            self._directories[wd] = directory
+
+    def read(self) -> set[str] | None:
+        """
+        读取发生变化的文件
+
+        :return: 发生变化的文件路径，事件队列溢出时为None
+        :rtype: set[str] | None
+        """  # noqa: RUF002
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:  # pragma: no cover
+            return set()
+
+        changed: set[str] = set()
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buffer, offset)
+            name = buffer[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:  # pragma: no cover
+                return None
+            if mask & _IN_IGNORED:
+                directory = self._directories.pop(wd, None)
+                if directory is not None:
+                    self._watches.pop(directory, None)
+                continue
+            directory = self._directories.get(wd)
+            if directory is not None and name:
+                changed.add(os.path.normpath(os.path.join(directory, os.fsdecode(name))))
+        return changed
+
+    def close(self) -> None:
+        """关闭inotify"""
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """
+    配置文件监视器
+
+    在后台线程中监视配置池中已加载的配置文件(即 :py:meth:`~config.basic.core.BasicConfigPool.tracked_files` )
+    所在的位于配置池根目录下的目录，文件变化且在 ``debounce`` 秒内没有新的变化后调用
+    :py:meth:`~config.basic.core.BasicConfigPool.refresh` 在后台线程重新加载，加载完成后原子地替换配置池中的配置文件
+
+    有未保存修改的配置文件不会被重新加载，而是以 :py:class:`~config.errors.UnsavedChangesError` 报告给 ``on_error``
+
+    在Linux上通过 ``ctypes`` 调用inotify，否则每隔 ``interval`` 秒轮询检查所有配置文件的状态
+
+    例子
+    ----
+
+    .. code-block:: python
+
+       pool = ConfigPool()
+       JsonSL().register_to(pool)
+       pool.load("", "config.json")
+
+       with ConfigWatcher(pool):
+           ...  # 修改config.json后pool.load("", "config.json")会返回新的配置文件
+
+    .. versionadded:: 0.3.1
+    """  # noqa: RUF002
+
+    def __init__(
+        self,
+        pool: BasicConfigPool,
+        *,
+        debounce: float = 0.1,
+        interval: float = 1.0,
+        backend: Backend | Literal["auto"] = "auto",
+        on_reload: Callable[[str, str, ABCConfigFile[Any]], Any] | None = None,
+        on_error: Callable[[str, str, Exception], Any] | None = None,
+    ):
+        """
+        :param pool: 配置池
+        :type pool: BasicConfigPool
+        :param debounce: 合并连续变化的等待秒数
+        :type debounce: float
+        :param interval: 轮询间隔秒数，使用inotify时为同步监视目录的间隔
+        :type interval: float
+        :param backend: 监视方式，为 ``"auto"`` 时支持inotify则使用inotify，否则轮询
+        :type backend: Literal["inotify", "poll", "auto"]
+        :param on_reload:
+            重新加载配置文件后的回调，参数为[命名空间, 文件名, 新的配置文件]，
+            抛出的错误与重新加载失败一样报告
+        :type on_reload: Callable[[str, str, ABCConfigFile[Any]], Any] | None
+        :param on_error:
+            重新加载失败时的回调，参数为[命名空间, 文件名, 错误]，
+            为None或回调本身抛出错误时发出 :py:class:`RuntimeWarning`
+        :type on_error: Callable[[str, str, Exception], Any] | None
+
+        :raise OSError: 指定了inotify但当前平台不支持
+        """  # noqa: RUF002, D205
+        if backend == "auto":
+            backend = "poll" if _libc is None else "inotify"
+        if backend == "inotify" and _libc is None:  # pragma: no cover
+            msg = "inotify is not supported on this platform"
+            raise OSError(msg)
+
+        self._pool = pool
+        self._debounce = debounce
+        self._interval = interval
+        self._backend: Backend = backend
+        self._on_reload = on_reload
+        self._on_error = on_error
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._wake: tuple[int, int] | None = None
+
+    @property
+    def pool(self) -> BasicConfigPool:
+        """监视的配置池"""
+        return self._pool
+
+    @property
+    def backend(self) -> Backend:
+        """监视方式"""
+        return self._backend
+
+    @property
+    def running(self) -> bool:
+        """是否正在监视"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> Self:
+        """
+        在后台线程开始监视
+
+        :return: 返回当前实例便于链式调用
+        :rtype: Self
+
+        :raise RuntimeError: 已经在监视
+        """
+        if self.running:
+            msg = "watcher is already running"
+            raise RuntimeError(msg)
+        self._stop.clear()
+        inotify = _Inotify() if self._backend == "inotify" else None
+        wake = os.pipe() if inotify is not None else None
+        self._thread = Thread(target=self._run, args=(inotify, wake), name="ConfigWatcher", daemon=True)
+        self._wake = wake
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        停止监视并等待后台线程退出
+
+        :param timeout: 等待秒数
+        :type timeout: float | None
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        wake = self._wake
+        if wake is not None:
+            os.write(wake[1], b"\0")
+        thread.join(timeout)
+        if thread.is_alive():  # pragma: no cover
+            return
+        if wake is not None:
+            os.close(wake[0])
+            os.close(wake[1])
+        self._thread = self._wake = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        self.stop()
+
+    def _watched(self) -> dict[tuple[str, str], str]:
+        """
+        获取需要监视的配置文件
+
+        :return: ``(命名空间, 文件名)`` 到文件路径的映射
+        :rtype: dict[tuple[str, str], str]
+        """
+        root = os.path.abspath(self._pool.root_path)
+        result = {}
+        for key, path in self._pool.tracked_files().items():
+            absolute = os.path.abspath(path)
+            if os.path.commonpath((root, absolute)) == root:
+                result[key] = absolute
+        return result
+
+    def _run(self, inotify: _Inotify | None, wake: tuple[int, int] | None) -> None:
+        """
+        后台线程入口
+
+        :param inotify: inotify监视，轮询时为None
+        :type inotify: _Inotify | None
+        :param wake: 用于唤醒select的管道，轮询时为None
+        :type wake: tuple[int, int] | None
+        """  # noqa: RUF002
+        if inotify is None or wake is None:
+            while not self._stop.wait(self._interval):
+                self._reload(self._watched(), None)
+            return
+        try:
+            self._run_inotify(inotify, wake[0])
+        finally:
+            inotify.close()
+
+    def _run_inotify(self, inotify: _Inotify, wake_fd: int) -> None:
+        """
+        基于inotify的主循环
+
+        :param inotify: inotify监视
+        :type inotify: _Inotify
+        :param wake_fd: 用于唤醒select的管道读端
+        :type wake_fd: int
+        """
+        pending: set[str] | None = set()
+        deadline: float | None = None
+        while not self._stop.is_set():
+            inotify.update({os.path.dirname(path) for path in self._watched().values()})
+            timeout = self._interval if deadline is None else max(0.0, deadline - time.monotonic())
+            readable = select.select([inotify.fd, wake_fd], [], [], timeout)[0]
+            if inotify.fd in readable:
+                changed = inotify.read()
+                pending = None if changed is None or pending is None else pending | changed
+                deadline = time.monotonic() + self._debounce
+            if deadline is not None and time.monotonic() >= deadline:
+                self._reload(self._watched(), pending)
+                pending, deadline = set(), None
+
+    def _reload(self, watched: dict[tuple[str, str], str], changed: set[str] | None) -> None:
+        """
+        重新加载发生变化的配置文件
+
+        :param watched: 监视的配置文件
+        :type watched: dict[tuple[str, str], str]
+        :param changed: 发生变化的文件路径，为None时检查所有配置文件
+        :type changed: set[str] | None
+        """  # noqa: RUF002
+        for (namespace, file_name), path in watched.items():
+            if changed is not None and path not in changed:
+                continue
+            try:
+                if not self._pool.refresh(namespace, file_name):
+                    continue
+                if self._on_reload is not None:
+                    config = self._pool.get(namespace, file_name)
+                    if config is not None:
+                        self._on_reload(namespace, file_name, config)
+            except Exception as err:  # noqa: BLE001
+                self._report(namespace, file_name, err)
+
+    def _report(self, namespace: str, file_name: str, err: Exception) -> None:
+        """
+        报告重新加载或回调中的错误，回调抛出的错误不会终止监视线程
+
+        :param namespace: 命名空间
+        :type namespace: str
+        :param file_name: 文件名
+        :type file_name: str
+        :param err: 错误
+        :type err: Exception
+        """  # noqa: RUF002
+        if self._on_error is not None:
+            try:
+                self._on_error(namespace, file_name, err)
+            except Exception as callback_err:  # noqa: BLE001
+                err = callback_err
+            else:
+                return
+        warnings.warn(
+            f"failed to reload config file {namespace!r} {file_name!r}: {err!r}",
+            RuntimeWarning,
+            stacklevel=1,
+        )
+
+
+__all__ = ("ConfigWatcher",)
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from typing import Any
+from typing import cast
 
 from pyrsistent import pmap
 from pytest import fixture
@@ -12,6 +13,7 @@ from c41811.config import ComponentConfigData
 from c41811.config import ComponentMember
 from c41811.config import ComponentMeta
 from c41811.config import ComponentMetaParser
+from c41811.config import ConfigFile
 from c41811.config import MappingConfigData
 from c41811.config import NoneConfigData
 from c41811.config import SequenceConfigData
@@ -117,6 +119,34 @@ class TestComponentConfigData:
             with raises(AttributeError):
                 setattr(empty_data, attr, None)
 
+    @staticmethod
+    def test_version(data: CCD) -> None:
+        version = cast(int, data.version)
+        data.members["foo.json"].modify("key\\.value", "changed")
+        assert cast(int, data.version) > version
+        version = cast(int, data.version)
+        data.modify("\\{f\\}\\.key\\.value", "again")
+        assert cast(int, data.version) > version
+
+        # 替换为版本号更小的成员时版本号仍然递增
+        version = cast(int, data.version)
+        data["foo.json"] = MappingConfigData({"key": {"value": "replaced"}})
+        assert cast(int, data.version) > version
+        version = cast(int, data.version)
+        assert data.version == version
+
+    @staticmethod
+    def test_replace_member_dirty() -> None:
+        data = _ccd_from_meta({"members": ["x.json"]}, {"x.json": MappingConfigData()})
+        data["x.json"]["a"] = 2
+        file = ConfigFile(data).mark_clean()
+        assert not file.dirty
+        data["x.json"] = MappingConfigData({"a": 999})
+        assert file.dirty
+        file.mark_clean()
+        del data.members["x.json"]  # type: ignore[attr-defined]
+        assert file.dirty
+
     RetrieveTests: tuple[str, tuple[tuple[CCD, str, Any, EE, dict[str, Any]], ...]] = (
         "data, path, value, ignore_excs, kwargs",
         (
@@ -331,6 +361,12 @@ class TestComponentConfigData:
         with safe_raises(ignore_excs):
             assert data.retrieve(path, **kwargs) == value
 
+    @staticmethod
+    @mark.parametrize(*RetrieveTests)
+    def test_accessor_get(data: CCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        with safe_raises(ignore_excs):
+            assert data.accessor(path).get(**kwargs) == value
+
     ModifyTests: tuple[str, tuple[tuple[CCD, str, Any, EE, dict[str, Any]], ...]] = (
         "data, path, value, ignore_excs, kwargs",
         (
@@ -532,6 +568,68 @@ class TestComponentConfigData:
             return
         assert data.retrieve(path, return_raw_value=True) == value
 
+    @staticmethod
+    @mark.parametrize(*ModifyTests)
+    def test_modify_many(data: CCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        expected = deepcopy(data)
+        with safe_raises(ignore_excs):
+            expected.modify(path, value, **kwargs)
+
+        data = deepcopy(data)
+        with safe_raises(ignore_excs):
+            data.modify_many({path: value}, **kwargs)
+        assert data == expected
+
+    BatchTests: tuple[str, tuple[tuple[list[str], EE], ...]] = (
+        "paths, ignore_excs",
+        (
+            (["key\\.value", "key\\.extra", "first\\.second", "\\{b\\}\\.key\\.value", "\\{f\\}\\.key"], ()),
+            (["key\\.value", "first\\.second\\.third", "missing"], (ConfigDataTypeError,)),
+            (["key\\.value", "missing", "first\\.second\\.third"], (RequiredPathNotFoundError,)),
+            (["\\{unknown\\}\\.key", "key"], (RequiredPathNotFoundError,)),
+        ),
+    )
+
+    @staticmethod
+    @fixture
+    def ordered_data(members: M) -> CCD:
+        return _ccd_from_meta(
+            {"members": [{"filename": "foo.json", "alias": "f"}, {"filename": "bar.json", "alias": "b"}]},
+            members,
+        )
+
+    @staticmethod
+    @mark.parametrize(*BatchTests)
+    def test_retrieve_many(ordered_data: CCD, paths: list[str], ignore_excs: EE) -> None:
+        data = ordered_data
+        expected: list[Any] = []
+        with safe_raises(ignore_excs) as expected_info:
+            expected.extend(data.retrieve(path) for path in paths)
+        with safe_raises(ignore_excs) as info:
+            assert data.retrieve_many(paths) == expected
+        if info:
+            assert expected_info is not None
+            assert str(info.value) == str(expected_info.value)
+
+    @staticmethod
+    @mark.parametrize("paths", [paths for paths, _ in BatchTests[1]])
+    def test_modify_many_batch(ordered_data: CCD, paths: list[str]) -> None:
+        data = ordered_data
+        values = {path: index for index, path in enumerate((*paths, "new\\.key", "\\{b\\}\\.new"))}
+        expected = deepcopy(data)
+        expected_exc: Exception | None = None
+        try:
+            for path, value in values.items():
+                expected.modify(path, value)
+        except (RequiredPathNotFoundError, ConfigDataTypeError) as err:
+            expected_exc = err
+
+        with safe_raises(type(expected_exc) if expected_exc else None) as info:
+            assert data.modify_many(values) is data
+        if info:
+            assert str(info.value) == str(expected_exc)
+        assert data == expected
+
     DeleteTests: tuple[str, tuple[tuple[CCD, str, Any, EE, dict[str, Any]], ...]] = (
         "data, path, value, ignore_excs, kwargs",
         (
@@ -912,6 +1010,18 @@ class TestComponentConfigData:
         with safe_raises(ignore_excs):
             assert data.exists(path, **kwargs) is is_exists
 
+    @staticmethod
+    @mark.parametrize(*ExistsTests)
+    def test_accessor_exists(
+        data: CCD,
+        path: str,
+        is_exists: bool,  # noqa: FBT001
+        ignore_excs: EE,
+        kwargs: dict[str, Any],
+    ) -> None:
+        with safe_raises(ignore_excs):
+            assert data.accessor(path).exists(**kwargs) is is_exists
+
     GetTests: tuple[str, tuple[tuple[CCD, str, Any, EE, dict[str, Any]], ...]] = (
         "data, path, value, ignore_excs, kwargs",
         (
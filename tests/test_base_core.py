@@ -1,21 +1,32 @@
 import functools
 import itertools
 import operator
+from abc import ABC
 from collections import OrderedDict
 from collections.abc import Callable
+from copy import deepcopy
 from pathlib import Path as FPath
 from typing import Any
 from typing import ClassVar
 from typing import cast
+from typing import override
 
+from pytest import MonkeyPatch
 from pytest import fixture
 from pytest import mark
 from pytest import raises
 
+from c41811.config import BoolConfigData
 from c41811.config import ConfigDataFactory
 from c41811.config import ConfigFile
 from c41811.config import ConfigPool
 from c41811.config import MappingConfigData
+from c41811.config import NumberConfigData
+from c41811.config import ObjectConfigData
+from c41811.config import Path
+from c41811.config.abc import ABCPath
+from c41811.config.abc import AnyKey
+from c41811.config.basic.factory import _TypeDispatchTable
 from c41811.config.errors import UnsupportedConfigFormatError
 
 type D_MCD = MappingConfigData[dict[Any, Any]]
@@ -29,6 +40,101 @@ def test_wrong_type_config_data() -> None:
         EmptyTypesConfigDataFactory(type)
 
 
+def test_factory_register() -> None:
+    class Marker(ABC):  # noqa: B024
+        pass
+
+    class Plain:
+        pass
+
+    def wrap_marker(data: Any) -> Any:
+        return ("marker", data)
+
+    assert isinstance(ConfigDataFactory(1), NumberConfigData)
+    ConfigDataFactory.register(int, wrap_marker)
+    try:
+        assert next(iter(ConfigDataFactory.TYPES)) == (int,)
+        assert ConfigDataFactory(1) == ("marker", 1)
+        assert ConfigDataFactory(True) == ("marker", True)  # noqa: FBT003
+    finally:
+        assert ConfigDataFactory.unregister(int) is wrap_marker
+    assert isinstance(ConfigDataFactory(1), NumberConfigData)
+    assert isinstance(ConfigDataFactory(True), BoolConfigData)  # noqa: FBT003
+
+    ConfigDataFactory.register((Marker,), wrap_marker, before=object)
+    try:
+        keys = list(ConfigDataFactory.TYPES)
+        assert keys.index((Marker,)) == keys.index((object,)) - 1
+        plain = Plain()
+        assert isinstance(ConfigDataFactory(plain), ObjectConfigData)
+        Marker.register(Plain)
+        assert ConfigDataFactory(plain) == ("marker", plain)
+    finally:
+        ConfigDataFactory.unregister(Marker)
+
+    with raises(KeyError):
+        ConfigDataFactory.register(Plain, wrap_marker, before=Plain)
+    with raises(KeyError):
+        ConfigDataFactory.unregister(Plain)
+
+
+def test_factory_dispatch_cache() -> None:
+    ConfigDataFactory()
+
+    class Marker(ABC):  # noqa: B024
+        pass
+
+    class Plain:
+        pass
+
+    class Proxy:
+        @property  # type: ignore[misc]
+        @override
+        def __class__(self) -> type:
+            return int
+
+    def wrap_marker(data: Any) -> Any:
+        return ("marker", data)
+
+    scanned: list[type] = []
+
+    class CountingTable(_TypeDispatchTable):
+        @override
+        def _scan(self, data: Any) -> Any:
+            scanned.append(type(data))
+            return super()._scan(data)
+
+    table = CountingTable(ConfigDataFactory.TYPES)
+    values = ({"key": "value"}, [1, 2], 114, "str") * 3
+    linear = OrderedDict(ConfigDataFactory.TYPES)
+    assert [table.dispatch(v) for v in values] == [
+        next(cls for types, cls in linear.items() if isinstance(v, types)) for v in values
+    ]
+    assert scanned == [dict, list, int, str]
+
+    # 修改表后缓存失效
+    scanned.clear()
+    table[(Marker,)] = wrap_marker
+    table.move_to_end((Marker,), last=False)
+    assert table.dispatch(114) is table.dispatch(514) is NumberConfigData
+    assert scanned == [int]
+
+    # 注册虚拟子类后缓存失效
+    scanned.clear()
+    plain = Plain()
+    assert table.dispatch(plain) is table.dispatch(plain) is ObjectConfigData
+    Marker.register(Plain)
+    assert table.dispatch(plain) is table.dispatch(plain) is wrap_marker
+    assert scanned == [Plain, Plain]
+
+    # 伪装了__class__的对象不会被缓存
+    scanned.clear()
+    proxy = Proxy()
+    table.dispatch(proxy)
+    table.dispatch(proxy)
+    assert scanned == [Proxy, Proxy]
+
+
 type P = ConfigPool
 
 
@@ -137,3 +243,50 @@ class TestConfigFile:
     def test_repr(file: ConfigFile[D_MCD], data: D_MCD) -> None:
         assert repr(file.config) in repr(file)
         assert repr(data) in repr(ConfigFile(data))
+
+
+@mark.parametrize("depth", (24, 48))
+def test_deep_path_remaining(monkeypatch: MonkeyPatch, depth: int) -> None:
+    raw: dict[str, Any] = {"value": 0}
+    for i in reversed(range(depth)):
+        raw = {f"k{i}": raw}
+    path = Path.from_str("".join(rf"\.k{i}" for i in range(depth)) + r"\.value")
+
+    remaining: list[int] = []
+
+    class RecordingConfigData(MappingConfigData[dict[Any, Any]]):
+        @override
+        def _process_path[X, Y](
+            self,
+            path: ABCPath[Any],
+            path_checker: Callable[[Any, AnyKey, int, int], X],
+            process_return: Callable[[Any], Y],
+            *,
+            mutable: bool = False,
+        ) -> X | Y:
+            def _checker(current_data: Any, current_key: AnyKey, last: int, key_index: int) -> X:
+                remaining.append(last)
+                return path_checker(current_data, current_key, last, key_index)
+
+            return super()._process_path(path, _checker, process_return, mutable=mutable)
+
+    slices: list[slice] = []
+    getitem = ABCPath.__getitem__
+
+    def _getitem(self: ABCPath[Any], item: Any) -> Any:
+        if isinstance(item, slice):
+            slices.append(item)
+        return getitem(self, item)
+
+    monkeypatch.setattr(ABCPath, "__getitem__", _getitem)
+
+    data = RecordingConfigData(deepcopy(raw))
+    assert data.retrieve(path) == 0
+    assert remaining == list(reversed(range(depth + 1)))
+
+    remaining.clear()
+    data.modify(path, 1)
+    assert data.exists(path)
+    assert data.retrieve(path) == 1
+    assert remaining == list(reversed(range(depth + 1))) * 3
+    assert not slices
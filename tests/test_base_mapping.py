@@ -1,13 +1,17 @@
 from collections import OrderedDict
+from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import Iterable
 from collections.abc import Mapping
+from contextlib import suppress
 from copy import deepcopy
+from threading import Thread
 from typing import Any
 from typing import cast
 
 from pyrsistent import PMap
 from pyrsistent import pmap
+from pytest import MonkeyPatch
 from pytest import fixture
 from pytest import mark
 from pytest import raises
@@ -17,11 +21,16 @@ from utils import safe_raises
 from c41811.config import IndexKey
 from c41811.config import MappingConfigData
 from c41811.config import Path as DPath
+from c41811.config import PersistentMappingConfigData
 from c41811.config import SequenceConfigData
+from c41811.config.abc import ABCPath
+from c41811.config.abc import AnyKey
+from c41811.config.basic import core
 from c41811.config.errors import ConfigDataReadOnlyError
 from c41811.config.errors import ConfigDataTypeError
 from c41811.config.errors import CyclicReferenceError
 from c41811.config.errors import RequiredPathNotFoundError
+from c41811.config.utils import CopyPolicy
 from c41811.config.utils import Unset
 
 type OD = OrderedDict[str, Any]
@@ -202,6 +211,380 @@ class TestMappingConfigData:
         with safe_raises(ignore_excs):
             assert data.exists(path, **kwargs) is is_exist
 
+    @staticmethod
+    @mark.parametrize(*RetrieveTests)
+    def test_accessor_get(data: M_MCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        with safe_raises(ignore_excs):
+            assert data.accessor(path).get(**kwargs) == value
+
+    @staticmethod
+    @mark.parametrize(*ModifyTests)
+    def test_accessor_set(data: M_MCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        with safe_raises(ignore_excs) as info:
+            data.accessor(path).set(value, **kwargs)
+        if info:
+            return
+        assert data.retrieve(path, return_raw_value=True) == value
+
+    @staticmethod
+    @mark.parametrize(*DeleteTests)
+    def test_accessor_delete(data: M_MCD, path: str, ignore_excs: EE) -> None:
+        expected = deepcopy(data)
+        with suppress(Exception):
+            expected.delete(path)
+        with safe_raises(ignore_excs):
+            data.accessor(path).delete()
+        assert data == expected
+
+    @staticmethod
+    @mark.parametrize(*ExistsTests)
+    def test_accessor_exists(
+        data: M_MCD,
+        path: str,
+        is_exist: bool,  # noqa: FBT001
+        ignore_excs: EE,
+        kwargs: dict[str, Any],
+    ) -> None:
+        with safe_raises(ignore_excs):
+            assert data.accessor(path).exists(**kwargs) is is_exist
+
+    @staticmethod
+    def test_accessor(data: M_MCD, readonly_data: R_MCD) -> None:
+        accessor = data.accessor(r"a\.c\.e\.f")
+        assert accessor.config is data
+        assert accessor.path == DPath.from_str(r"\.a\.c\.e\.f")
+        assert repr(accessor) == r"<PathAccessor('\\.a\\.c\\.e\\.f')>"
+        assert isinstance(data.accessor(r"a\.c").get(), MappingConfigData)
+        assert data.accessor(r"a\.c").get(return_raw_value=True) == {"d": 2, "e": {"f": 3}}
+
+        snapshot = data.snapshot()
+        accessor.set(4)
+        assert accessor.get() == 4
+        assert snapshot.retrieve(r"a\.c\.e\.f") == 3
+        accessor.delete()
+        assert not accessor.exists()
+        assert snapshot.accessor(r"a\.c\.e\.f").exists()
+
+        with raises(ConfigDataReadOnlyError):
+            readonly_data.accessor("foo1").set(0)
+        with raises(ConfigDataReadOnlyError):
+            readonly_data.accessor("foo1").delete()
+        assert readonly_data.accessor("foo1").get() == 114
+
+    @staticmethod
+    def test_accessor_fast_path(monkeypatch: MonkeyPatch) -> None:
+        data = MappingConfigData({f"key{i}": {"inner": [{"leaf": i}]} for i in range(200)})
+        accessors = tuple(data.accessor(rf"key{i}\.inner\[0\]\.leaf") for i in range(200))
+        missing = data.accessor(r"key0\.inner\[1\]\.leaf")
+
+        calls: list[str] = []
+
+        def _record(name: str) -> None:
+            method = getattr(MappingConfigData, name)
+
+            def _wrapper(self: M_MCD, *args: Any, **kwargs: Any) -> Any:
+                calls.append(name)
+                return method(self, *args, **kwargs)
+
+            monkeypatch.setattr(MappingConfigData, name, _wrapper)
+
+        for name in ("retrieve", "exists", "modify", "delete"):
+            _record(name)
+
+        assert [accessor.get() for accessor in accessors] == list(range(200))
+        assert all(accessor.exists() for accessor in accessors)
+        accessors[0].set(-1)
+        assert accessors[0].get() == -1
+        assert not missing.exists()
+        assert calls == []
+
+        with raises(RequiredPathNotFoundError):
+            missing.get()
+        assert calls == ["retrieve"]
+
+    @classmethod
+    def test_retrieve_many(cls, data: M_MCD) -> None:
+        paths = [path for path, _, ignore_excs, kwargs in cls.RetrieveTests[1] if not ignore_excs and not kwargs]
+        assert data.retrieve_many(paths) == [data.retrieve(path) for path in paths]
+        assert data.retrieve_many(paths, return_raw_value=True) == [
+            data.retrieve(path, return_raw_value=True) for path in paths
+        ]
+        assert data.retrieve_many([]) == []
+
+        raw = data.retrieve_many(["foo", "foo"], return_raw_value=True)
+        raw[0]["bar"] = 0
+        assert raw[1]["bar"] == 123
+        assert data.retrieve(r"foo\.bar") == 123
+
+    RetrieveManyErrorTests: tuple[str, tuple[tuple[list[str], EE], ...]] = (
+        "paths, ignore_excs",
+        (
+            (["foo", "foo3", r"foo2\.bar"], (RequiredPathNotFoundError,)),
+            (["foo", r"foo2\.bar", "foo3"], (ConfigDataTypeError,)),
+            ([r"a\.c\.x", r"a\.c\.d\.x"], (RequiredPathNotFoundError,)),
+            ([r"a\.c\.d\.x", r"a\.c\.x"], (ConfigDataTypeError,)),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*RetrieveManyErrorTests)
+    def test_retrieve_many_error(data: M_MCD, paths: list[str], ignore_excs: EE) -> None:
+        with raises(Exception) as expected:
+            for path in paths:
+                data.retrieve(path)
+        with safe_raises(ignore_excs) as info:
+            data.retrieve_many(paths)
+        assert info is not None
+        assert str(info.value) == str(expected.value)
+
+    ModifyManyTests: tuple[str, tuple[tuple[dict[str, Any], dict[str, Any]], ...]] = (
+        "values, kwargs",
+        (
+            ({r"foo\.bar": 1, "foo1": 2, r"foo2\[0\]": 3, r"a\.c\.e\.f": 4, r"a\.b": 5}, {}),
+            ({r"new\.a\.b": 1, r"new\.a\.c": 2, r"new\.d": 3}, {}),
+            ({r"foo2\[0\]": 1, r"foo2\[-1\]": 2}, {}),
+            ({"foo": {"baz": 1}, r"foo\.bar": 2}, {}),
+            ({r"foo\.bar": 2, "foo": {"baz": 1}}, {}),
+            ({r"foo\.bar": 1, r"foo2\[1\]": 2, r"a\.b": 3}, {}),
+            ({r"foo\.bar": 1, r"foo1\.bar": 2, r"a\.b": 3}, {}),
+            ({r"foo\.bar": 1, r"new\.x": 2, r"a\.b": 3}, {"allow_create": False}),
+            ({r"foo\.bar": 1, r"foo2\[0\]": 2}, {"allow_create": False}),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*ModifyManyTests)
+    def test_modify_many(data: M_MCD, values: dict[str, Any], kwargs: dict[str, Any]) -> None:
+        expected = deepcopy(data)
+        expected_exc: Exception | None = None
+        try:
+            for path, value in values.items():
+                expected.modify(path, value, **kwargs)
+        except (RequiredPathNotFoundError, ConfigDataTypeError, IndexError) as err:
+            expected_exc = err
+
+        snapshot = data.snapshot()
+        with safe_raises(type(expected_exc) if expected_exc else None) as info:
+            assert data.modify_many(values, **kwargs) is data
+        if info:
+            assert str(info.value) == str(expected_exc)
+        assert data == expected
+        assert snapshot.data == deepcopy(snapshot).data
+        assert snapshot.retrieve(r"foo\.bar") == 123
+
+    @staticmethod
+    def test_modify_many_readonly(readonly_data: R_MCD) -> None:
+        with raises(ConfigDataReadOnlyError):
+            readonly_data.modify_many({"foo1": 0})
+
+    @staticmethod
+    def test_many_shared_prefix(monkeypatch: MonkeyPatch) -> None:
+        data = MappingConfigData(
+            {"app": {"services": {f"svc{i}": {"options": {f"key{j}": j for j in range(30)}} for i in range(10)}}}
+        )
+        paths = tuple(rf"app\.services\.svc{i}\.options\.key{j}" for i in range(10) for j in range(30))
+
+        visited: list[AnyKey] = []
+        inner_element = core._inner_element  # noqa: SLF001
+
+        def _inner_element(current_data: Any, key: AnyKey) -> Any:
+            visited.append(key)
+            return inner_element(current_data, key)
+
+        monkeypatch.setattr(core, "_inner_element", _inner_element)
+
+        # 公共前缀app, services, svc{i}, options各只遍历一次
+        assert data.retrieve_many(paths) == [j for _ in range(10) for j in range(30)]
+        assert len(visited) == 1 + 1 + 10 + 10 + 300
+
+        modified: list[Any] = []
+        modify = MappingConfigData.modify
+
+        def _modify(self: M_MCD, *args: Any, **kwargs: Any) -> Any:
+            modified.append(args)
+            return modify(self, *args, **kwargs)
+
+        monkeypatch.setattr(MappingConfigData, "modify", _modify)
+        data.modify_many(dict.fromkeys(paths, -1))
+        assert not modified
+        assert data.retrieve_many(paths) == [-1] * 300
+
+    @staticmethod
+    def _assert_index(data: M_MCD) -> None:
+        def _ids() -> dict[str, tuple[int, str]]:
+            return {k: (id(parent), key) for k, (parent, key) in data._path_index.items()}  # type: ignore[union-attr]  # noqa: SLF001
+
+        index = _ids()
+        data._build_index()  # noqa: SLF001
+        assert index == _ids()
+        assert set(index) == set(data.keys(recursive=True, strict=False))
+
+    @classmethod
+    @mark.parametrize(*RetrieveTests)
+    def test_flat_index_retrieve(
+        cls, data: M_MCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]
+    ) -> None:
+        data.flat_index = True
+        assert data.flat_index
+        with safe_raises(ignore_excs):
+            assert data.retrieve(path, **kwargs) == value
+            assert data.retrieve(rf"\.{path}", **kwargs) == value
+        cls._assert_index(data)
+
+    @classmethod
+    @mark.parametrize(*ExistsTests)
+    def test_flat_index_exists(
+        cls,
+        data: M_MCD,
+        path: str,
+        is_exist: bool,  # noqa: FBT001
+        ignore_excs: EE,
+        kwargs: dict[str, Any],
+    ) -> None:
+        data.flat_index = True
+        with safe_raises(ignore_excs):
+            assert data.exists(path, **kwargs) is is_exist
+
+    @classmethod
+    @mark.parametrize(*ModifyTests)
+    def test_flat_index_modify(
+        cls, data: M_MCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]
+    ) -> None:
+        expected = deepcopy(data)
+        data.flat_index = True
+        with safe_raises(ignore_excs):
+            expected.modify(path, value, **kwargs)
+        with safe_raises(ignore_excs):
+            data.modify(path, value, **kwargs)
+        assert data == expected
+        cls._assert_index(data)
+
+    @classmethod
+    @mark.parametrize(*DeleteTests)
+    def test_flat_index_delete(cls, data: M_MCD, path: str, ignore_excs: EE) -> None:
+        data.flat_index = True
+        with safe_raises(ignore_excs):
+            data.delete(path)
+        assert not data.exists(path, ignore_wrong_type=True)
+        cls._assert_index(data)
+
+    @classmethod
+    def test_flat_index_mutations(cls, data: M_MCD) -> None:
+        data.flat_index = True
+        operations: tuple[Callable[[M_MCD], Any], ...] = (
+            lambda d: d.__setitem__("foo", {"x": {"y": 1}}),
+            lambda d: d.__setitem__("new", 1),
+            lambda d: d.__delitem__("a"),
+            lambda d: d.update({"foo1": {"z": 2}, "b": {"c": 3}}),
+            lambda d: d.update([("b", {"d": 4})]),
+            lambda d: d.update(kw={"e": 5}),
+            lambda d: d.__ior__({"foo": {"ior": 1}, "c": 1}),
+            lambda d: d.__ior__(MappingConfigData({"ior": {"x": 1}})),
+            lambda d: d.pop(r"ior\.x"),
+            lambda d: d.setdefault(r"deep\.er\.key", 1),
+            lambda d: d.modify_many({r"deep\.er\.key": {"k": 1}, r"foo\.ior": 2}),
+            lambda d: d.accessor(r"deep\.er").set({"v": 1}),
+            lambda d: d.accessor(r"deep\.er\.v").delete(),
+            lambda d: d.unset("foo1"),
+            lambda d: d.popitem(),
+            lambda d: d.clear(),
+        )
+        expected = deepcopy(data)
+        expected.flat_index = False
+        for operation in operations:
+            result, expected_result = operation(data), operation(expected)
+            if not isinstance(result, MappingConfigData):
+                assert result == expected_result
+            assert data == expected
+            cls._assert_index(data)
+
+    @classmethod
+    def test_flat_index_snapshot(cls, data: M_MCD) -> None:
+        data.flat_index = True
+        snapshot = data.snapshot()
+        assert not snapshot.flat_index
+        assert data.retrieve(r"a\.c\.e\.f") == 3
+
+        data.modify(r"a\.c\.e\.f", 4)
+        assert snapshot.retrieve(r"a\.c\.e\.f") == 3
+        assert data.retrieve(r"a\.c\.e\.f") == 4
+        cls._assert_index(data)
+
+        data.snapshot()
+        data.values(return_raw_value=True)
+        cls._assert_index(data)
+
+        snapshot = data.snapshot()
+        data.update({"x": {"y": 2}})
+        assert data.retrieve(r"x\.y") == 2
+        assert not snapshot.exists("x")
+        cls._assert_index(data)
+
+    @staticmethod
+    def test_flat_index_toggle(data: M_MCD, readonly_data: R_MCD) -> None:
+        accessor = data.accessor(r"a\.b")
+        data.flat_index = True
+        accessor.set(0)
+        assert data.retrieve(r"a\.b") == 0
+        data.flat_index = False
+        assert not data.flat_index
+        data.modify(r"a\.b", 1)
+        assert data.retrieve(r"a\.b") == 1
+
+        readonly_data.flat_index = True
+        with raises(ConfigDataReadOnlyError):
+            readonly_data.modify(r"a\.b", 0)
+        with raises(TypeError):
+            readonly_data["a"] = 0
+        assert readonly_data.retrieve(r"a\.b") == 1
+        assert readonly_data.exists(r"a\.c\.e\.f")
+
+        with raises(TypeError, match="does not support flat index"):
+            PersistentMappingConfigData(data.data).flat_index = True
+
+    @staticmethod
+    def test_flat_index_cyclic() -> None:
+        cyclic: dict[str, Any] = {"key": "value"}
+        cyclic["cyclic"] = cyclic
+        data = MappingConfigData(cyclic)
+        data.flat_index = True
+        assert set(data._path_index) == set(data.keys(recursive=True, strict=False))  # type: ignore[arg-type]  # noqa: SLF001
+        assert data.retrieve(r"cyclic\.key") == "value"
+
+    @classmethod
+    def test_flat_index_lookup(cls, monkeypatch: MonkeyPatch) -> None:
+        def _tree(depth: int) -> dict[str, Any]:
+            if not depth:
+                return {f"leaf{i}": i for i in range(5)}
+            return {f"node{i}": _tree(depth - 1) for i in range(3)}
+
+        data = MappingConfigData(_tree(6))
+        indexed = MappingConfigData(deepcopy(data.data))
+        indexed.flat_index = True
+        paths = tuple(data.keys(recursive=True, end_point_only=True))[:500]
+
+        walked: list[ABCPath[Any]] = []
+        process_path = core.BasicIndexedConfigData._process_path  # noqa: SLF001
+
+        def _process_path(self: M_MCD, path: ABCPath[Any], *args: Any, **kwargs: Any) -> Any:
+            walked.append(path)
+            return process_path(self, path, *args, **kwargs)
+
+        monkeypatch.setattr(core.BasicIndexedConfigData, "_process_path", _process_path)
+
+        assert [indexed.retrieve(path) for path in paths] == [data.retrieve(path) for path in paths]
+        assert len(walked) == len(paths)
+
+        # 索引中的路径无论深度都直接查表, 修改后的子树同样
+        indexed.modify(paths[0], {"x": {"y": 1}})
+        indexed.delete(paths[1])
+        walked.clear()
+        assert indexed.retrieve(rf"{paths[0]}\.x\.y") == 1
+        assert all(indexed.exists(path) for path in paths[2:])
+        assert not indexed.exists(paths[1])
+        assert all(path == DPath.from_str(paths[1]) for path in walked)
+        cls._assert_index(indexed)
+
     GetTests: tuple[str, tuple[tuple[str, Any, EE, dict[str, Any]], ...]] = (
         RetrieveTests[0],
         (
@@ -456,6 +839,161 @@ class TestMappingConfigData:
         data["foo.bar"] = 456
         assert last_data != data
 
+        container = deepcopy({"a": data, "b": [data]})
+        assert container["a"] is container["b"][0]
+        assert container["a"] is not data
+        container["a"]["foo.bar"] = 789
+        assert data["foo.bar"] == 456
+
+        # 直接调用时同样遵循memo, 供其他对象的__deepcopy__转发
+        memo: dict[Any, Any] = {}
+        copied = data.__deepcopy__(memo)
+        assert memo[id(data)] is copied
+        assert data.__deepcopy__(memo) is copied
+        assert deepcopy([data], memo)[0] is copied
+
+    VersionTests: tuple[str, tuple[Callable[[M_MCD], Any], ...]] = (
+        "operation",
+        (
+            lambda d: d.modify("foo\\.bar", 1),
+            lambda d: d.delete("foo\\.bar"),
+            lambda d: d.unset("missing"),
+            lambda d: d.setdefault("new", 1),
+            lambda d: d.modify_many({"foo\\.bar": 1, "foo1": 2}),
+            lambda d: d.accessor("foo\\.bar").set(1),
+            lambda d: d.accessor("foo\\.bar").delete(),
+            lambda d: d.__setitem__("foo1", 1),
+            lambda d: d.__delitem__("foo1"),
+            lambda d: d.__ior__({"foo1": 1}),
+            lambda d: d.update(foo1=1),
+            lambda d: d.pop("foo1"),
+            lambda d: d.popitem(),
+            lambda d: d.clear(),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*VersionTests)
+    def test_version(odict: OD, operation: Callable[[M_MCD], Any]) -> None:
+        for flat_index in (False, True):
+            data: M_MCD = MappingConfigData(deepcopy(odict))
+            data.flat_index = flat_index
+            version = data.version
+            assert version is not None
+            data.retrieve("foo\\.bar")
+            data.exists("foo\\.bar")
+            data.get("foo1")
+            _ = data.data, data["foo"], data | {"new": 1}
+            assert data.version == version
+
+            operation(data)
+            assert cast(int, data.version) > version
+
+    @staticmethod
+    def test_snapshot(data: M_MCD) -> None:
+        raw = deepcopy(data.data)
+        snapshot = data.snapshot()
+        assert snapshot == data
+        assert snapshot.data is not data.data
+
+        data.modify(r"a\.c\.e\.f", 1)
+        data.delete(r"a\.b")
+        data["foo1"] = 0
+        data |= {"new": {}}
+        assert snapshot.data == raw
+
+        snapshot.modify(r"foo\.bar", 0)
+        snapshot.clear()
+        assert data.retrieve(r"foo\.bar") == 123
+        assert data.retrieve(r"a\.c\.e\.f") == 1
+        assert not snapshot
+
+    @staticmethod
+    def test_snapshot_shares_untouched(data: M_MCD) -> None:
+        snapshot = deepcopy(data)
+        data.modify(r"a\.b", 0)
+        assert data.retrieve("foo") == snapshot.retrieve("foo")
+        # noinspection PyProtectedMember
+        assert data._data["foo"] is snapshot._data["foo"]  # noqa: SLF001
+        # noinspection PyProtectedMember
+        assert data._data["a"] is not snapshot._data["a"]  # noqa: SLF001
+
+    @staticmethod
+    def test_snapshot_raw_view(data: M_MCD) -> None:
+        snapshot = data.snapshot()
+        dict(data.items(return_raw_value=True))["foo"]["bar"] = 456
+        next(iter(data.values(return_raw_value=True)))["bar"] = 789
+        assert snapshot.retrieve(r"foo\.bar") == 123
+
+    @staticmethod
+    def test_snapshot_owned_bounded(data: M_MCD) -> None:
+        data.snapshot()
+        for i in range(1000):
+            data.modify("a", {"b": {"c": i}})
+            data.modify(r"a\.b\.c", -i)
+        # noinspection PyProtectedMember
+        assert len(data._cow.owned) < 200  # type: ignore[union-attr]  # noqa: SLF001
+        assert data.retrieve(r"a\.b\.c") == -999
+
+    @staticmethod
+    def test_snapshot_concurrent_modify(monkeypatch: MonkeyPatch) -> None:
+        data = MappingConfigData({"a": {"b": 0}})
+        data.snapshot()
+        snapshots: list[tuple[MappingConfigData[Any], Any]] = []
+
+        def _snapshot() -> None:
+            snapshot = data.snapshot()
+            snapshots.append((snapshot, snapshot.data))
+
+        own = core._CopyOnWrite.own  # noqa: SLF001
+        threads: list[Thread] = []
+
+        def _own(self: Any, node: Any, root: Any) -> Any:
+            # 写入者已经取得独占的根节点时在其他线程获取快照
+            if not threads and node is not root:
+                threads.append(Thread(target=_snapshot))
+                threads[0].start()
+                threads[0].join(0.1)
+            return own(self, node, root)
+
+        monkeypatch.setattr(core._CopyOnWrite, "own", _own)  # noqa: SLF001
+        data.modify(r"a\.b", 1)
+        threads[0].join()
+
+        snapshot, raw = snapshots[0]
+        assert snapshot.data == raw
+        assert data.retrieve(r"a\.b") == 1
+
+    @staticmethod
+    @mark.parametrize("policy", [CopyPolicy.DEEPCOPY, CopyPolicy.FAST])
+    def test_copy_policy(data: M_MCD, policy: CopyPolicy) -> None:
+        data.copy_policy = policy
+        raw = data.retrieve("foo", return_raw_value=True)
+        assert raw == data.data["foo"]
+        raw["bar"] = 456
+        assert data.retrieve(r"foo\.bar") == 123
+
+        child = data.retrieve("foo")
+        assert child.copy_policy is policy
+        child["bar"] = 456
+        assert data.retrieve(r"foo\.bar") == 123
+
+        assert data.data is not data.data
+        assert data.data == data.data
+
+    @staticmethod
+    def test_copy_policy_none(data: M_MCD) -> None:
+        data.copy_policy = CopyPolicy.NONE
+        assert data.retrieve("foo", return_raw_value=True) is data.data["foo"]
+        assert next(iter(data.values())).data is data.data["foo"]
+        assert data.retrieve("a", return_raw_value=True) is data.retrieve("a").data
+
+        child = data.retrieve("foo")
+        assert child.copy_policy is CopyPolicy.NONE
+        child["bar"] = 456
+        assert data.retrieve(r"foo\.bar") == 456
+        assert dict(data.items())["foo"].data is data.data["foo"]
+
     KeysTests: tuple[str, tuple[tuple[dict[Any, Any], set[str]], ...]] = (
         "kwargs, keys",
         (
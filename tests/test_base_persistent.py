@@ -0,0 +1,252 @@
+from copy import deepcopy
+from typing import Any
+
+from pyrsistent import PMap
+from pyrsistent import PVector
+from pyrsistent import pmap
+from pyrsistent import pvector
+from pytest import fixture
+from pytest import mark
+from utils import EE
+from utils import safe_raises
+
+from c41811.config import ConfigDataFactory
+from c41811.config import MappingConfigData
+from c41811.config import PersistentMappingConfigData
+from c41811.config import PersistentSequenceConfigData
+from c41811.config.errors import ConfigDataReadOnlyError
+from c41811.config.errors import ConfigDataTypeError
+from c41811.config.errors import RequiredPathNotFoundError
+
+type PMCD = PersistentMappingConfigData
+type PSCD = PersistentSequenceConfigData
+
+
+class TestPersistentMappingConfigData:
+    @staticmethod
+    @fixture
+    def raw() -> dict[str, Any]:
+        return {
+            "foo": {
+                "bar": 123,
+                "baz": [1, {"qux": 2}],
+            },
+            "foo1": 114,
+            "other": {"deep": {"deeper": "value"}},
+        }
+
+    @staticmethod
+    @fixture
+    def data(raw: dict[str, Any]) -> PMCD:
+        return PersistentMappingConfigData(raw)
+
+    @staticmethod
+    def test_init(raw: dict[str, Any], data: PMCD) -> None:
+        assert isinstance(data.data, PMap)
+        assert isinstance(data.data["foo"], PMap)
+        assert isinstance(data.data["foo"]["baz"], PVector)
+        assert data.data == pmap(raw)
+        assert PersistentMappingConfigData().data == pmap()
+        assert not data.data_read_only
+        assert not data.read_only
+
+        frozen = pmap({"key": "value"})
+        assert PersistentMappingConfigData(frozen).data is frozen
+
+    @staticmethod
+    def test_factory() -> None:
+        assert isinstance(ConfigDataFactory(pmap()), PersistentMappingConfigData)
+        assert isinstance(ConfigDataFactory(pvector()), PersistentSequenceConfigData)
+        assert type(ConfigDataFactory({})) is MappingConfigData
+
+    @staticmethod
+    def test_retrieve(data: PMCD) -> None:
+        assert isinstance(data.retrieve("foo"), PersistentMappingConfigData)
+        assert isinstance(data.retrieve("foo\\.baz"), PersistentSequenceConfigData)
+        assert data.retrieve("foo\\.baz\\[1\\]\\.qux") == 2
+        assert data.retrieve("other", return_raw_value=True) is data.data["other"]
+
+    ModifyTests: tuple[str, tuple[tuple[str, Any, EE, dict[str, Any]], ...]] = (
+        "path, value, ignore_excs, kwargs",
+        (
+            ("foo\\.bar", 456, (), {}),
+            ("foo\\.new", {"a": [1]}, (), {}),
+            ("foo\\.baz\\[0\\]", 9, (), {}),
+            ("foo\\.baz\\[1\\]\\.qux", 3, (), {}),
+            ("a\\.b\\.c", 1, (), {}),
+            ("a\\.b\\.c", 1, (RequiredPathNotFoundError,), {"allow_create": False}),
+            ("foo1\\.bar", 1, (ConfigDataTypeError,), {}),
+            ("foo\\[0\\]", 1, (ConfigDataTypeError,), {}),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*ModifyTests)
+    def test_modified(data: PMCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        before = data.data
+        with safe_raises(ignore_excs):
+            new = data.modified(path, value, **kwargs)
+            assert new.retrieve(path, return_raw_value=True) == value
+        assert data.data is before
+
+    @staticmethod
+    @mark.parametrize(*ModifyTests)
+    def test_modify(data: PMCD, path: str, value: Any, ignore_excs: EE, kwargs: dict[str, Any]) -> None:
+        snapshot = data.snapshot()
+        with safe_raises(ignore_excs):
+            assert data.modify(path, value, **kwargs) is data
+            assert data.retrieve(path, return_raw_value=True) == value
+            assert snapshot != data
+
+    DeleteTests: tuple[str, tuple[tuple[str, EE], ...]] = (
+        "path, ignore_excs",
+        (
+            ("foo", ()),
+            ("foo\\.bar", ()),
+            ("foo\\.baz\\[1\\]", ()),
+            ("foo\\.baz\\[1\\]\\.qux", ()),
+            ("foo\\.missing", (RequiredPathNotFoundError,)),
+            ("foo\\.baz\\[9\\]", (RequiredPathNotFoundError,)),
+            ("foo1\\.bar", (ConfigDataTypeError,)),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*DeleteTests)
+    def test_deleted(data: PMCD, path: str, ignore_excs: EE) -> None:
+        before = data.data
+        with safe_raises(ignore_excs):
+            new = data.deleted(path)
+            assert not new.exists(path)
+            assert data.exists(path)
+        assert data.data is before
+
+    @staticmethod
+    def test_structural_sharing(data: PMCD) -> None:
+        new = data.modified("foo\\.bar", 0)
+        assert new.data["other"] is data.data["other"]
+        assert new.data["foo"]["baz"] is data.data["foo"]["baz"]
+        assert new.data["foo"] is not data.data["foo"]
+
+        removed = data.deleted("foo\\.baz\\[1\\]")
+        assert removed.data["other"] is data.data["other"]
+
+    @staticmethod
+    def test_history(data: PMCD) -> None:
+        history = [data.snapshot()]
+        for i in range(5):
+            data["foo1"] = i
+            history.append(deepcopy(data))
+        assert [version["foo1"] for version in history] == [114, 0, 1, 2, 3, 4]
+        assert all(version.data["other"] is data.data["other"] for version in history)
+
+    @staticmethod
+    def test_read_only(data: PMCD) -> None:
+        data.read_only = True
+        with safe_raises(ConfigDataReadOnlyError):
+            data.modify("foo1", 1)
+        with safe_raises(ConfigDataReadOnlyError):
+            data.delete("foo1")
+        assert data.modified("foo1", 1).retrieve("foo1") == 1
+
+    @staticmethod
+    def test_mapping_methods(raw: dict[str, Any], data: PMCD) -> None:
+        data["new"] = {"a": [1]}
+        assert isinstance(data.data["new"]["a"], PVector)
+        del data["new"]
+        assert data.data == pmap(raw)
+
+        data.update({"x": {"y": 1}})
+        assert isinstance(data.data["x"], PMap)
+        data.update(z=2)
+        assert data["z"] == 2
+
+        data |= {"w": [3]}
+        assert isinstance(data.data["w"], PVector)
+        merged = data | MappingConfigData({"v": 4})
+        assert isinstance(merged, PersistentMappingConfigData)
+        assert merged["v"] == 4
+        assert "v" not in data
+
+        assert data.pop("w") == PersistentSequenceConfigData([3])
+        key, _ = data.popitem()
+        assert key not in data
+        data.setdefault("a\\.b", 1)
+        assert data.retrieve("a\\.b") == 1
+        data.unset("a\\.b")
+        assert not data.exists("a\\.b")
+
+        data.clear()
+        assert data.data == pmap()
+        with safe_raises(KeyError):
+            data.popitem()
+
+
+class TestPersistentSequenceConfigData:
+    @staticmethod
+    @fixture
+    def raw() -> list[Any]:
+        return [1, 2, {"a": [3, 4]}, [5, 6]]
+
+    @staticmethod
+    @fixture
+    def data(raw: list[Any]) -> PSCD:
+        return PersistentSequenceConfigData(raw)
+
+    @staticmethod
+    def test_init(raw: list[Any], data: PSCD) -> None:
+        assert isinstance(data.data, PVector)
+        assert isinstance(data.data[2], PMap)
+        assert data.data == pvector(raw)
+        assert PersistentSequenceConfigData().data == pvector()
+
+    @staticmethod
+    def test_modified(data: PSCD) -> None:
+        new = data.modified("\\[2\\]\\.a\\[0\\]", 9)
+        assert new.retrieve("\\[2\\]\\.a\\[0\\]") == 9
+        assert data.retrieve("\\[2\\]\\.a\\[0\\]") == 3
+        assert new.data[3] is data.data[3]
+
+        removed = data.deleted("\\[3\\]\\[0\\]")
+        assert removed.retrieve("\\[3\\]", return_raw_value=True) == [6]
+        assert removed.data[2] is data.data[2]
+
+    SequenceMethodTests: tuple[str, tuple[tuple[str, tuple[Any, ...]], ...]] = (
+        "method, args",
+        (
+            ("append", ([7],)),
+            ("insert", (1, 0)),
+            ("insert", (-1, 0)),
+            ("insert", (99, 0)),
+            ("extend", ([7, 8],)),
+            ("pop", ()),
+            ("pop", (0,)),
+            ("remove", (2,)),
+            ("clear", ()),
+            ("reverse", ()),
+            ("__setitem__", (0, {"b": 1})),
+            ("__setitem__", (slice(1, 3), [0])),
+            ("__delitem__", (1,)),
+            ("__delitem__", (slice(None, None, 2),)),
+        ),
+    )
+
+    @staticmethod
+    @mark.parametrize(*SequenceMethodTests)
+    def test_methods(raw: list[Any], data: PSCD, method: str, args: tuple[Any, ...]) -> None:
+        before = data.data
+        assert getattr(data, method)(*args) == getattr(raw, method)(*deepcopy(args))
+        assert data.data == pvector(raw)
+        assert before is not data.data
+
+    @staticmethod
+    def test_operators(data: PSCD) -> None:
+        added = data + [[7]]  # noqa: RUF005
+        assert isinstance(added, PersistentSequenceConfigData)
+        assert isinstance(added.data[-1], PVector)
+        assert len(data) == 4
+
+        data += [{"b": 1}]
+        assert isinstance(data.data[-1], PMap)
+        data *= 2
+        assert len(data) == 10
@@ -493,6 +493,23 @@ class TestSequenceConfigData:
         data[0] = 456
         assert last_data != data
 
+    @staticmethod
+    def test_snapshot(data: SCD, sequence: list[Any]) -> None:
+        raw = deepcopy(sequence)
+        snapshot = data.snapshot()
+
+        data.append(9)
+        data.modify(r"\[2\]\.a\[0\]", 0)
+        data.delete(r"\[3\]\[1\]")
+        data.reverse()
+        data *= 2
+        assert snapshot.data == raw
+
+        snapshot.extend([10])
+        snapshot.modify(r"\[2\]\.b\.c", 0)
+        assert data.retrieve(r"\[2\]\.b\.c") == 5
+        assert data.retrieve(r"\[2\]\.a\[0\]") == 0
+
     @staticmethod
     def test_repr(data: SCD) -> None:
         assert repr(data.data) in repr(data)
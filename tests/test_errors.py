@@ -26,6 +26,7 @@ from c41811.config.errors import TokenInfo
 from c41811.config.errors import UnavailableAttribute
 from c41811.config.errors import UnknownErrorDuringValidateError
 from c41811.config.errors import UnknownTokenTypeError
+from c41811.config.errors import UnsavedChangesError
 from c41811.config.errors import UnsupportedConfigFormatError
 
 
@@ -209,3 +210,10 @@ def test_component_member_mismatch_error() -> None:
 
     with raises(cls, match=re.compile(r"Missing .+ Redundant")):
         raise cls(missing={"foo", "bar"}, redundant={"foo"})
+
+
+# noinspection PyUnreachableCode
+def test_unsaved_changes_error() -> None:
+    cls = UnsavedChangesError
+    with raises(cls, match=r"'namespace' 'file\.json' was modified on disk but has unsaved changes"):
+        raise cls("namespace", "file.json")  # noqa: EM101
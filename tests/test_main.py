@@ -1,13 +1,23 @@
+import asyncio
+import inspect
+import json
+import os
+import re
 import statistics
+import sys
+import threading
 import time
+import warnings
 from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from decimal import Decimal
 from pathlib import Path as FPath
 from typing import Any
 from typing import cast
+from typing import override
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -17,6 +27,7 @@ from pydantic.fields import FieldInfo
 from pytest import fixture
 from pytest import mark
 from pytest import raises
+from pytest import warns
 from utils import EE
 from utils import EW
 from utils import safe_raises
@@ -34,14 +45,21 @@ from c41811.config import FieldDefinition
 from c41811.config import JsonSL
 from c41811.config import MappingConfigData
 from c41811.config import NoneConfigData
+from c41811.config import ObjectConfigData
 from c41811.config import Path as DPath
+from c41811.config import PickleSL
 from c41811.config import RequiredPath
+from c41811.config import TarFileSL
 from c41811.config import ValidatorOptions
+from c41811.config import ZipFileSL
 from c41811.config.abc import ABCConfigFile
+from c41811.config.abc import ABCSLProcessorPool
 from c41811.config.errors import ComponentMemberMismatchError
 from c41811.config.errors import ComponentMetadataException
 from c41811.config.errors import ConfigDataTypeError
+from c41811.config.errors import FailedProcessConfigFileError
 from c41811.config.errors import RequiredPathNotFoundError
+from c41811.config.errors import UnsavedChangesError
 from c41811.config.errors import UnsupportedConfigFormatError
 
 type MCD = MappingConfigData[Mapping[Any, Any]]
@@ -123,6 +141,224 @@ class TestConfigPool:
         pool.save("", "test1", config_formats="json", config=deepcopy(file))
         assert pool.load("", "test1", config_formats="json") == file
 
+    @staticmethod
+    def test_revalidate(tmpdir: FPath) -> None:
+        pool = ConfigPool(root_path=str(tmpdir), revalidate_interval=0)
+        JsonSL().register_to(pool)
+        path = os.path.join(str(tmpdir), "test.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 1}, f)
+
+        file = pool.load("", "test.json")
+        assert pool.load("", "test.json") is file
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 22}, f)
+        reloaded = pool.load("", "test.json")
+        assert reloaded is not file
+        assert reloaded.config.retrieve("foo") == 22
+        assert pool.load("", "test.json") is reloaded
+
+        reloaded.config.modify("foo", 333)
+        pool.save("", "test.json")
+        assert pool.load("", "test.json") is reloaded
+
+        pool.revalidate_interval = 3600
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 4444}, f)
+        assert pool.load("", "test.json") is reloaded
+        pool.revalidate_interval = 0
+        assert pool.load("", "test.json").config.retrieve("foo") == 4444
+
+        os.remove(path)
+        cached = pool.load("", "test.json")
+        assert pool.load("", "test.json") is cached
+
+        pool.set("", "test.json", ConfigFile(MappingConfigData({"foo": 0})))
+        assert pool.load("", "test.json").config.retrieve("foo") == 0
+
+        pool.remove("")
+        with raises(FileNotFoundError):
+            pool.load("", "test.json")
+
+    @staticmethod
+    def test_revalidate_dirty(tmpdir: FPath) -> None:
+        pool = ConfigPool(root_path=str(tmpdir), revalidate_interval=0)
+        JsonSL().register_to(pool)
+        path = os.path.join(str(tmpdir), "test.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 1}, f)
+
+        file = pool.load("", "test.json")
+        file.config.modify("foo", 2)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 3, "bar": 3}, f)
+        with warns(RuntimeWarning, match="unsaved changes"):
+            assert pool.load("", "test.json") is file
+        # 同一次修改只警告一次
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert pool.load("", "test.json") is file
+        assert file.config.retrieve("foo") == 2
+
+        pool.save("", "test.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 4}, f)
+        assert asyncio.run(pool.aload("", "test.json")).config.retrieve("foo") == 4
+
+    @staticmethod
+    def test_single_flight_load(tmpdir: FPath) -> None:
+        class SlowJsonSL(JsonSL):
+            calls = 0
+
+            @override
+            def load_file(self, *args: Any, **kwargs: Any) -> ConfigFile[Any]:
+                type(self).calls += 1
+                time.sleep(0.05)
+                return super().load_file(*args, **kwargs)
+
+        pool = ConfigPool(root_path=str(tmpdir))
+        SlowJsonSL().register_to(pool)
+        with open(os.path.join(pool.root_path, "test.json"), "w", encoding="utf-8") as f:
+            json.dump({"foo": 1}, f)
+
+        threads = 8
+        barrier = threading.Barrier(threads)
+
+        def load(file_name: str) -> ABCConfigFile[Any]:
+            barrier.wait()
+            return pool.load("", file_name)
+
+        with ThreadPoolExecutor(threads) as executor:
+            results = list(executor.map(load, ["test.json"] * threads))
+        assert SlowJsonSL.calls == 1
+        assert all(result is results[0] for result in results)
+        assert pool.get("", "test.json") is results[0]
+        assert not pool._loading  # noqa: SLF001
+
+        with ThreadPoolExecutor(threads) as executor:
+            futures = [executor.submit(load, "missing.json") for _ in range(threads)]
+        for future in futures:
+            with raises(FileNotFoundError):
+                future.result()
+        assert SlowJsonSL.calls == 1
+        assert not pool._loading  # noqa: SLF001
+
+        # 参数不同的线程不共享结果
+        started = threading.Event()
+        release = threading.Event()
+
+        class BlockingPool(ConfigPool):
+            @override
+            def _load(self, *args: Any) -> ABCConfigFile[Any]:
+                started.set()
+                release.wait()
+                return super()._load(*args)
+
+        pool = BlockingPool(root_path=str(tmpdir))
+        SlowJsonSL().register_to(pool)
+        with ThreadPoolExecutor(2) as executor:
+            failed = executor.submit(pool.load, "", "init.json")
+            assert started.wait(1)
+            initialized = executor.submit(pool.load, "", "init.json", allow_initialize=True)
+            time.sleep(0.05)
+            release.set()
+        with raises(FileNotFoundError):
+            failed.result()
+        assert initialized.result() is pool.get("", "init.json")
+        assert not pool._loading  # noqa: SLF001
+
+    @staticmethod
+    def test_thread_safety(pool: ConfigPool, data: MCD) -> None:
+        threads = 8
+        rounds = 200
+        barrier = threading.Barrier(threads)
+
+        def worker(index: int) -> None:
+            barrier.wait()
+            namespace = f"ns{index % 2}"
+            for i in range(rounds):
+                file_name = f"{index}-{i % 4}.json"
+                pool.set(namespace, file_name, ConfigFile(data, config_format="json"))
+                assert pool.get(namespace, file_name) is not None
+                assert (namespace, file_name) in pool
+                assert len(pool) > 0
+                pool.configs  # noqa: B018
+                if i % 20 == 0:
+                    pool.save_all()
+                pool.remove(namespace, file_name)
+                pool.discard(namespace, file_name)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(threads) as executor:
+                for future in [executor.submit(worker, i) for i in range(threads)]:
+                    future.result()
+        finally:
+            sys.setswitchinterval(interval)
+        assert pool.configs == {}
+        assert len(pool) == 0
+
+    @staticmethod
+    def test_refresh(pool: ConfigPool, file: ConfigFile[MCD]) -> None:
+        path = os.path.join(pool.root_path, "test.json")
+        assert not pool.refresh("", "test.json")
+        pool.save("", "test.json", config=deepcopy(file))
+        assert pool.tracked_files() == {("", "test.json"): path}
+
+        loaded = pool.load("", "test.json")
+        assert not pool.refresh("", "test.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 4567}, f)
+        assert pool.refresh("", "test.json")
+        assert pool.load("", "test.json") is not loaded
+        assert pool.load("", "test.json").config.retrieve("foo") == 4567
+        assert not pool.refresh("", "test.json")
+
+        os.remove(path)
+        assert not pool.refresh("", "test.json")
+        pool.discard("", "test.json")
+        assert pool.tracked_files() == {}
+
+    @staticmethod
+    def test_refresh_concurrent_edit(tmpdir: FPath) -> None:
+        during_load: list[Callable[[], Any]] = []
+
+        class HookedJsonSL(JsonSL):
+            @override
+            def load_file(self, *args: Any, **kwargs: Any) -> ConfigFile[Any]:
+                for hook in during_load:
+                    hook()
+                return super().load_file(*args, **kwargs)
+
+        pool = ConfigPool(root_path=str(tmpdir))
+        HookedJsonSL().register_to(pool)
+        path = os.path.join(pool.root_path, "test.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 1}, f)
+        file = pool.load("", "test.json")
+
+        # 重新加载期间被修改
+        during_load.append(lambda: file.config.modify("foo", 2))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 3}, f)
+        with raises(UnsavedChangesError):
+            pool.refresh("", "test.json")
+        assert pool.get("", "test.json") is file
+        assert file.config.retrieve("foo") == 2
+        assert not pool.refresh("", "test.json")
+
+        # 重新加载期间被替换
+        pool.save("", "test.json")
+        replaced = ConfigFile(ConfigDataFactory({"foo": 4}), config_format="json")
+        during_load[:] = [lambda: pool.set("", "test.json", replaced)]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"foo": 5}, f)
+        with raises(UnsavedChangesError):
+            pool.refresh("", "test.json")
+        assert pool.get("", "test.json") is replaced
+
     @staticmethod
     def test_file_not_found_load(pool: ConfigPool) -> None:
         with raises(FileNotFoundError, match="No such file or directory"):
@@ -178,6 +414,246 @@ class TestConfigPool:
             pool.save_all()
         assert pool.save_all(ignore_err=True) == {"": {"test": (file, UnsupportedConfigFormatError("pickle"))}}
 
+    @staticmethod
+    def test_save_all_parallel(pool: ConfigPool, data: MCD) -> None:
+        lock = threading.Lock()
+        active: set[str] = set()
+        overlapped: list[str] = []
+        threads: set[int] = set()
+
+        class TrackingJsonSL(JsonSL):
+            @override
+            def save(
+                self,
+                processor_pool: ABCSLProcessorPool,
+                config_file: ABCConfigFile[Any],
+                root_path: str,
+                namespace: str,
+                file_name: str,
+                *args: Any,
+                **kwargs: Any,
+            ) -> None:
+                target = os.path.abspath(processor_pool.helper.calc_path(root_path, namespace, file_name))
+                with lock:
+                    if target in active:
+                        overlapped.append(target)
+                    active.add(target)
+                    threads.add(threading.get_ident())
+                time.sleep(0.01)
+                try:
+                    super().save(processor_pool, config_file, root_path, namespace, file_name, *args, **kwargs)
+                finally:
+                    with lock:
+                        active.discard(target)
+
+        pool.SLProcessors.clear()
+        TrackingJsonSL().register_to(pool)
+        for i in range(20):
+            pool.set(f"ns{i % 4}", f"{i}.json", ConfigFile(MappingConfigData({"index": i}), config_format="json"))
+        # 不同的命名空间与文件名指向同一个文件
+        pool.set("shared", "same.json", ConfigFile(data, config_format="json"))
+        pool.set("", os.path.join("shared", "same.json"), ConfigFile(data, config_format="json"))
+
+        assert pool.save_all(parallel=8) is None
+        assert not overlapped
+        assert len(threads) > 1
+        for i in range(20):
+            pool.remove(f"ns{i % 4}", f"{i}.json")
+            assert pool.load(f"ns{i % 4}", f"{i}.json").config.retrieve("index") == i
+
+        pool.set("", "broken", ConfigFile(data, config_format="pickle"))
+        pool.set("ns1", "broken", ConfigFile(data, config_format="pickle"))
+        serial = pool.save_all(ignore_err=True)
+        parallel = pool.save_all(ignore_err=True, parallel=4)
+        assert serial is not None
+        assert parallel is not None
+        assert list(parallel) == list(serial) == ["ns1", ""]
+        assert {ns: {fn: (cfg, type(err)) for fn, (cfg, err) in files.items()} for ns, files in parallel.items()} == {
+            ns: {fn: (cfg, type(err)) for fn, (cfg, err) in files.items()} for ns, files in serial.items()
+        }
+        with raises(UnsupportedConfigFormatError, match="Unsupported config format: pickle"):
+            pool.save_all(parallel=4)
+        with raises(ValueError, match="parallel must be at least 1"):
+            pool.save_all(parallel=0)
+
+    @staticmethod
+    def test_save_all_only_dirty(pool: ConfigPool, data: MCD) -> None:
+        saved: list[str] = []
+
+        class CountingJsonSL(JsonSL):
+            @override
+            def save(
+                self,
+                processor_pool: ABCSLProcessorPool,
+                config_file: ABCConfigFile[Any],
+                root_path: str,
+                namespace: str,
+                file_name: str,
+                *args: Any,
+                **kwargs: Any,
+            ) -> None:
+                saved.append(file_name)
+                super().save(processor_pool, config_file, root_path, namespace, file_name, *args, **kwargs)
+
+        pool.SLProcessors.clear()
+        CountingJsonSL().register_to(pool)
+        for i in range(10):
+            pool.set("", f"{i}.json", ConfigFile(deepcopy(data), config_format="json"))
+        assert all(file.dirty for file in cast(dict[str, ABCConfigFile[Any]], pool.get("")).values())
+
+        pool.save_all(only_dirty=True)
+        assert len(saved) == 10
+        saved.clear()
+        pool.save_all(only_dirty=True)
+        assert saved == []
+
+        cast(ConfigFile[MCD], pool.get("", "3.json")).config.modify("foo", 1)
+        cast(ConfigFile[MCD], pool.get("", "5.json")).config["bar"] = 2
+        pool.save_all(only_dirty=True, parallel=2)
+        assert sorted(saved) == ["3.json", "5.json"]
+        saved.clear()
+
+        pool.remove("", "7.json")
+        loaded = pool.load("", "7.json")
+        assert not loaded.dirty
+        config = loaded.config
+        config |= {"baz": 3}
+        assert loaded.dirty
+        pool.save_all(only_dirty=True)
+        assert saved == ["7.json"]
+        saved.clear()
+
+        pool.set("", "0.json", ConfigFile(deepcopy(data), config_format="json"))
+        pool.set("", "object.json", ConfigFile(ObjectConfigData({"list": []}), config_format="json"))
+        pool.save_all(only_dirty=True)
+        assert saved == ["0.json", "object.json"]
+        saved.clear()
+        pool.save_all(only_dirty=True)
+        assert saved == ["object.json"]
+        saved.clear()
+
+        pool.save_all()
+        assert len(saved) == 11
+
+    @staticmethod
+    def test_batch_commit(pool: ConfigPool, data: MCD) -> None:
+        for i in range(4):
+            pool.set("ns", f"{i}.json", ConfigFile(data, config_format="json"))
+
+        with pool.batch_commit() as batch:
+            pool.save_all(parallel=2)
+            assert len(batch) == 4
+            assert not os.path.exists(pool.helper.calc_path(pool.root_path, "ns", "0.json"))
+        for i in range(4):
+            file_name = f"{i}.json"
+            with open(pool.helper.calc_path(pool.root_path, "ns", file_name)) as f:
+                assert json.load(f) == data.data
+            assert pool._file_stats["ns", file_name][0] == pool._stat("ns", file_name)  # noqa: SLF001
+
+        with raises(RuntimeError), pool.batch_commit():
+            pool.save("ns", "new.json", config=ConfigFile(data, config_format="json"))
+            raise RuntimeError
+        assert not os.path.exists(pool.helper.calc_path(pool.root_path, "ns", "new.json"))
+        assert sorted(os.listdir(os.path.join(pool.root_path, "ns"))) == [f"{i}.json" for i in range(4)]
+
+    @staticmethod
+    def test_get_formats(pool: ConfigPool) -> None:
+        def _reference(file_name: str) -> list[str]:
+            result: list[str] = []
+            for match, formats in pool.FileNameProcessors.items():
+                if match.fullmatch(file_name) if isinstance(match, re.Pattern) else file_name.endswith(match):
+                    result.extend(formats)
+            return list(dict.fromkeys(result))
+
+        for sl in (PickleSL(), ZipFileSL(), ZipFileSL(compression="lzma"), TarFileSL(compression="gz")):
+            sl.register_to(pool)
+        pool.FileNameProcessors[re.compile(r"config\..*")] = ["pickle"]
+        pool.FileNameProcessors[re.compile(r".*\.ini", re.IGNORECASE)] = ["json"]
+        names = ["a.json", "a.json.zip", "a.pickle.xz", "a.tar.gz", "config.json", "A.INI", ".json.lzma"]
+        for name in names:
+            assert list(pool._get_formats(name, None)) == _reference(name)  # noqa: SLF001
+
+        assert list(pool._get_formats("a.json", "pickle", "zip")) == ["pickle", "json", "zip"]  # noqa: SLF001
+        with raises(UnsupportedConfigFormatError):
+            pool._get_formats("a", None)  # noqa: SLF001
+
+        pool.FileNameProcessors.move_to_end(".json", last=False)
+        pool.FileNameProcessors[".json"].append("pickle")
+        pool.FileNameProcessors[""] = ["fallback"]
+        del pool.FileNameProcessors[re.compile(r"config\..*")]
+        for name in [*names, "a", ""]:
+            assert list(pool._get_formats(name, None)) == _reference(name)  # noqa: SLF001
+
+        # 带有分组、内联标志与反向引用的正则不能互相影响
+        for patterns in (
+            (r"(?P<name>\w+)\.json", r"(?P<name>\w+)\.pickle"),
+            (r"(?i)\w+\.JSONC", r"(?i)\w+\.INI"),
+            (r"(a)\1\.json", r"(b)\1\.ya?ml"),
+        ):
+            pool.FileNameProcessors.clear()
+            for pattern in patterns:
+                pool.FileNameProcessors[re.compile(pattern)] = ["json"]
+            for name in ["a.json", "a.pickle", "a.jsonc", "A.ini", "aa.json", "bb.yml", "ab.yml"]:
+                assert pool.FileNameProcessors.match(name) == tuple(
+                    match for match in pool.FileNameProcessors if cast(re.Pattern[str], match).fullmatch(name)
+                )
+        assert pool.FileNameProcessors.match("bb.yml") == (re.compile(r"(b)\1\.ya?ml"),)
+
+    @staticmethod
+    def test_learn_formats(tmpdir: FPath, data: MCD) -> None:
+        attempts: list[str] = []
+
+        class FailingSL(JsonSL):
+            @property
+            @override
+            def processor_reg_name(self) -> str:
+                return "failing"
+
+            @override
+            def save_file(self, *args: Any, **kwargs: Any) -> None:
+                attempts.append("save")
+                with self.raises():
+                    raise ValueError
+
+            @override
+            def load_file(self, *args: Any, **kwargs: Any) -> ConfigFile[Any]:
+                attempts.append("load")
+                with self.raises():
+                    raise ValueError
+
+        pool = ConfigPool(root_path=str(tmpdir))
+        FailingSL().register_to(pool)
+        JsonSL().register_to(pool)
+        assert pool.FileNameProcessors[".json"] == ["failing", "json"]
+
+        pool.save("", "a.json", config=ConfigFile(data))
+        assert attempts == ["save"]
+        pool.remove("", "a.json")
+        assert pool.load("", "a.json").config == data
+        pool.save("", "a.json")
+        assert attempts == ["save"]
+
+        with open(os.path.join(pool.root_path, "b.json"), "w", encoding="utf-8") as f:
+            json.dump(data.data, f)
+        assert pool.load("", "b.json").config == data
+        assert attempts == ["save", "load"]
+        pool.remove("", "b.json")
+        pool.load("", "b.json")
+        assert attempts == ["save", "load"]
+
+        # 显式指定的配置格式不受影响
+        pool.remove("", "b.json")
+        pool.load("", "b.json", config_formats=["failing", "json"])
+        assert attempts == ["save", "load", "load"]
+
+        # 记住的配置格式失败后仍会尝试其余配置格式
+        pool.FileNameProcessors[".json"].reverse()
+        pool.SLProcessors["json"] = FailingSL()
+        pool.remove("", "b.json")
+        with raises(FailedProcessConfigFileError):
+            pool.load("", "b.json")
+        assert attempts == ["save", "load", "load", "load", "load"]
+
     @staticmethod
     def test_require(pool: ConfigPool) -> None:
         cfg_data: MCD = pool.require("", "test.json", {"foo\\.bar": "test", "foo\\.baz": "test"}).check()
@@ -193,6 +669,91 @@ class TestConfigPool:
 
         func()
 
+    @staticmethod
+    def test_async(pool: ConfigPool, data: MCD) -> None:
+        loop_thread = threading.get_ident()
+        sl_threads: set[int] = set()
+
+        class ThreadRecordingJsonSL(JsonSL):
+            @override
+            def load_file(self, *args: Any, **kwargs: Any) -> ConfigFile[Any]:
+                sl_threads.add(threading.get_ident())
+                return super().load_file(*args, **kwargs)
+
+        pool.SLProcessors.clear()
+        ThreadRecordingJsonSL().register_to(pool)
+        expected = MappingConfigData({"foo": {"bar": "test", "baz": "test"}})
+
+        async def main() -> None:
+            await pool.asave("", "test.json", config=ConfigFile(data))
+            pool.remove("", "test.json")
+            file = await pool.aload("", "test.json")
+            assert file.config == data
+            assert await pool.aload("", "test.json") is file
+
+            await pool.asave("", "new.json", config=ConfigFile(data))
+            assert await pool.asave_all() is None
+            pool.set("", "broken", ConfigFile(data, config_format="pickle"))
+            errors = await pool.asave_all(ignore_err=True)
+            assert errors is not None
+            assert list(errors[""]) == ["broken"]
+            pool.remove("", "broken")
+
+            required = {"foo\\.bar": "test", "foo\\.baz": "test"}
+            assert await pool.arequire("", "required.json", required) == expected
+            assert await pool.require("", "required.json", required).acheck(ignore_cache=True) == expected
+
+            @pool.require("", "required.json", required)  # type: ignore[arg-type]
+            async def func(cfg: MCD, value: int) -> int:
+                assert cfg == expected
+                return value
+
+            assert inspect.iscoroutinefunction(func)
+            assert await func(1) == 1
+
+            sl = pool.SLProcessors["json"]
+            await sl.asave(pool, ConfigFile(data), pool.root_path, "", "sl.json")
+            assert (await sl.aload(pool, pool.root_path, "", "sl.json")).config == data
+
+        asyncio.run(main())
+        assert sl_threads
+        assert loop_thread not in sl_threads
+
+    @staticmethod
+    def test_async_executor(tmpdir: FPath) -> None:
+        lock = threading.Lock()
+        active: list[int] = []
+        peak = 0
+
+        class CountingJsonSL(JsonSL):
+            @override
+            def load_file(self, *args: Any, **kwargs: Any) -> ConfigFile[Any]:
+                nonlocal peak
+                with lock:
+                    active.append(threading.get_ident())
+                    peak = max(peak, len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.remove(threading.get_ident())
+                return super().load_file(*args, **kwargs)
+
+        files = 8
+        for i in range(files):
+            with open(os.path.join(str(tmpdir), f"{i}.json"), "w", encoding="utf-8") as f:
+                json.dump({"index": i}, f)
+
+        # 独立的线程池限制了该配置池同时执行的阻塞操作数
+        with ThreadPoolExecutor(2) as executor:
+            pool = ConfigPool(root_path=str(tmpdir), executor=executor)
+            CountingJsonSL().register_to(pool)
+
+            async def main() -> list[ABCConfigFile[Any]]:
+                return await asyncio.gather(*(pool.aload("", f"{i}.json") for i in range(files)))
+
+            results = asyncio.run(main())
+        assert [result.config.retrieve("index") for result in results] == list(range(files))
+        assert 0 < peak <= 2
+
     @staticmethod
     def test_require_result_reference(pool: ConfigPool) -> None:
         cfg_data: MCD = pool.require("", "a.json", {"foo": {"bar": "test", "baz": "test"}}, validate_only=False).check(
@@ -250,6 +811,18 @@ class TestConfigPool:
         pool.set("", "test", deepcopy(file))
         assert pool.configs == {"": {"test": file}}
 
+    @staticmethod
+    def test_getitem_snapshot(pool: ConfigPool, file: ConfigFile[MCD]) -> None:
+        pool.set("", "test", deepcopy(file))
+        snapshot = cast(ConfigFile[MCD], pool["", "test"])
+        snapshot.config.modify("foo", "changed")
+        pool.configs[""]["test"].config.modify("foo", "changed")
+        assert pool["", "test"] == file
+
+        snapshot = cast(ConfigFile[MCD], pool["", "test"])
+        cast(ConfigFile[MCD], pool.get("", "test")).config.modify("foo", "changed")
+        assert snapshot == file
+
     @staticmethod
     def test_repr(pool: ConfigPool) -> None:
         assert repr(pool.configs) in repr(pool)
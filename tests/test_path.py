@@ -1,6 +1,10 @@
+import random
+import warnings
+from collections.abc import Callable
 from copy import deepcopy
 from typing import Any
 
+from pytest import MonkeyPatch
 from pytest import fixture
 from pytest import mark
 from pytest import raises
@@ -12,12 +16,63 @@ from utils import safe_warns
 from c41811.config import AttrKey
 from c41811.config import IndexKey
 from c41811.config import Path
+from c41811.config import PathCache
+from c41811.config import PathCacheInfo
 from c41811.config import PathSyntaxParser
 from c41811.config.abc import AnyKey
 from c41811.config.errors import ConfigDataPathSyntaxException
 from c41811.config.errors import UnknownTokenTypeError
 
 
+def _count_backslash(s: str) -> int:
+    count = 1
+    while s and (s[-1] == "\\"):
+        count += 1
+        s = s[:-1]
+    return count
+
+
+def _legacy_tokenize(string: str) -> tuple[str, ...]:
+    """0.3.1之前的逆向分词实现，作为等价性测试的参照"""  # noqa: RUF002
+    if not string.startswith((r"\.", r"\[", r"\{")):
+        string = rf"\.{string}"
+
+    tokens: list[str] = [""]
+    while string:
+        string, sep, token = string.rpartition("\\")
+
+        if not token:
+            token += tokens.pop()
+        elif sep and (token[0] not in {".", "\\", "[", "]", "{", "}"}) and _count_backslash(string) % 2:
+            warnings.warn(rf"invalid escape sequence '\{token[0]}'", SyntaxWarning, stacklevel=2)
+
+        index_safe = (len(tokens) > 0) and (len(tokens[-1]) > 1)
+        if index_safe and (tokens[-1][1] not in {".", "[", "]", "{", "}"}):
+            token += tokens.pop()
+
+        if token.startswith(("]", "}")) and token[1:]:
+            tokens.append(token[1:])
+            token = token[:1]
+
+        tokens.append(sep + token)
+
+    tokens.reverse()
+    if tokens[-1] == "":
+        tokens.pop()
+
+    return tuple(tokens)
+
+
+def _record[R](func: Callable[[str], R], string: str) -> tuple[R | tuple[type[BaseException], str], list[str]]:
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        try:
+            result: R | tuple[type[BaseException], str] = func(string)
+        except Exception as err:  # noqa: BLE001
+            result = (type(err), str(err))
+    return result, [str(warn.message) for warn in warns]
+
+
 class TestKey:
     @staticmethod
     @mark.parametrize(
@@ -225,6 +280,60 @@ class TestPath:
         assert repr(keys)[1:-1] in repr(Path(keys))
 
 
+class TestPathCache:
+    @staticmethod
+    @fixture
+    def cache() -> PathCache:
+        return PathCache(maxsize=2)
+
+    @staticmethod
+    def test_lru(cache: PathCache) -> None:
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.cache_info() == PathCacheInfo(hits=3, misses=2, maxsize=2, currsize=2)
+
+        cache.cache_clear()
+        assert cache.cache_info() == PathCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    @staticmethod
+    def test_maxsize(cache: PathCache) -> None:
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.maxsize = 1
+        assert len(cache) == 1
+        assert cache.get("b") == 2
+
+        cache.maxsize = 0
+        cache.put("c", 3)
+        assert len(cache) == 0
+        with raises(ValueError, match="non-negative"):
+            cache.maxsize = -1
+
+    @staticmethod
+    def test_from_str() -> None:
+        class SubPath(Path):
+            pass
+
+        Path.cache.cache_clear()
+        path = Path.from_str(r"\.a\[0\]")
+        assert Path.from_str(r"\.a\[0\]") is path
+        assert type(SubPath.from_str(r"\.a\[0\]")) is SubPath
+        assert Path.cache.cache_info()[:2] == (1, 2)
+
+        maxsize = Path.cache.maxsize
+        try:
+            Path.cache.maxsize = 0
+            assert Path.from_str(r"\.a") is not Path.from_str(r"\.a")
+        finally:
+            Path.cache.maxsize = maxsize
+
+
 class TestPathSyntaxParser:
     @staticmethod
     @fixture
@@ -234,7 +343,7 @@ class TestPathSyntaxParser:
     @staticmethod
     @fixture(autouse=True, scope="function")
     def _clear_cache() -> None:
-        PathSyntaxParser.tokenize.cache_clear()
+        Path.cache.cache_clear()
 
     TokenizeTests: tuple[str, tuple[tuple[str, list[str], EW], ...]] = (
         "string, result, ignore_warns",
@@ -311,3 +420,30 @@ class TestPathSyntaxParser:
             path = parser.parse(string)
         if not e_info:
             assert path == path_obj
+
+    @staticmethod
+    @mark.parametrize("seed", range(5))
+    def test_fuzz_equivalence(monkeypatch: MonkeyPatch, seed: int) -> None:
+        rng = random.Random(seed)  # noqa: S311
+        alphabet = ("\\", "\\", "\\", ".", "[", "]", "{", "}", "a", "0", "1", " ")
+        strings = ["".join(rng.choices(alphabet, k=rng.randint(0, 16))) for _ in range(3000)]
+
+        current = [(_record(PathSyntaxParser.tokenize, s), _record(PathSyntaxParser.parse, s)) for s in strings]
+        monkeypatch.setattr(PathSyntaxParser, "tokenize", staticmethod(_legacy_tokenize))
+        legacy = [(_record(PathSyntaxParser.tokenize, s), _record(PathSyntaxParser.parse, s)) for s in strings]
+
+        for string, current_result, legacy_result in zip(strings, current, legacy, strict=True):
+            assert current_result == legacy_result, string
+
+    @staticmethod
+    @mark.parametrize(
+        "string, result",
+        (
+            ("a\\\\" * 10000, (r"\." + "a\\\\" * 10000,)),
+            (r"\[1\]" * 10000, (r"\[1", r"\]") * 10000),
+            ("\\\\" * 10000 + "a", (r"\." + "\\\\" * 10000 + "a",)),
+        ),
+    )
+    def test_tokenize_long(string: str, result: tuple[str, ...]) -> None:
+        assert PathSyntaxParser.tokenize(string) == result
+        assert _legacy_tokenize(string) == result
@@ -4,14 +4,20 @@ from contextlib import contextmanager
 from contextlib import suppress
 from numbers import Real
 from pathlib import Path
+from threading import Thread
 from typing import IO
 from typing import Any
 
+from pytest import MonkeyPatch
 from pytest import mark
 from pytest import raises
 
+from c41811.config import safe_writer
+from c41811.config.safe_writer import Durability
 from c41811.config.safe_writer import LockFlags
 from c41811.config.safe_writer import acquire_lock
+from c41811.config.safe_writer import batch_commit
+from c41811.config.safe_writer import current_batch
 from c41811.config.safe_writer import release_lock
 from c41811.config.safe_writer import safe_open
 
@@ -68,6 +74,167 @@ class TestSafeOpen:
         with raises(FileNotFoundError), safe_open(tmp_path / "test.txt", mode="r"):
             pass
 
+    @staticmethod
+    @mark.parametrize("mode", ["r", "rb"])
+    def test_read_without_copy(tmp_path: Path, mode: str) -> None:
+        (tmp_path / "test.txt").write_text("foo")
+        with safe_open(tmp_path / "test.txt", mode=mode) as file:
+            assert os.listdir(tmp_path) == ["test.txt"]
+            assert file.read() in ("foo", b"foo")
+
+    @staticmethod
+    def test_read_concurrent_shared(tmp_path: Path) -> None:
+        (tmp_path / "test.txt").write_text("foo")
+        with (
+            safe_open(tmp_path / "test.txt", mode="r", timeout=0.1) as file1,
+            safe_open(tmp_path / "test.txt", mode="r", timeout=0.1) as file2,
+        ):
+            assert file1.read() == file2.read() == "foo"
+
+    @staticmethod
+    def test_read_concurrent_write(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        opened: list[IO[Any]] = []
+        replaced_while_open: list[str] = []
+        open_path = safe_writer.TempTextIOManager.open_path
+        replace_atomic = safe_writer.replace_atomic
+
+        def _open_path(self: Any, path: str, mode: str) -> IO[Any]:
+            file = open_path(self, path, mode)
+            opened.append(file)
+            return file
+
+        def _replace_atomic(src: str, dst: str, **kwargs: Any) -> None:
+            # Windows 上替换仍被打开的文件会失败
+            if not all(file.closed for file in opened):
+                replaced_while_open.append(dst)
+            replace_atomic(src, dst, **kwargs)
+
+        monkeypatch.setattr(safe_writer.TempTextIOManager, "open_path", _open_path)
+        monkeypatch.setattr(safe_writer, "replace_atomic", _replace_atomic)
+
+        def _write() -> None:
+            for i in range(100):
+                with safe_open(tmp_path / "test.txt", mode="w", timeout=None) as file:
+                    file.write(str(i))
+
+        (tmp_path / "test.txt").write_text("-1")
+        thread = Thread(target=_write)
+        thread.start()
+        contents: set[str] = set()
+        while thread.is_alive():
+            with safe_open(tmp_path / "test.txt", mode="r", timeout=None) as file:
+                contents.add(file.read())
+        thread.join()
+
+        assert not replaced_while_open
+        assert contents <= {str(i) for i in range(-1, 100)}
+        assert (tmp_path / "test.txt").read_text() == "99"
+
+    @staticmethod
+    def test_read_error_keep_file(tmp_path: Path) -> None:
+        (tmp_path / "test.txt").write_text("foo")
+        with suppress(RuntimeError), safe_open(tmp_path / "test.txt", mode="r"):
+            raise RuntimeError
+        assert (tmp_path / "test.txt").read_text() == "foo"
+
+    @staticmethod
+    @mark.skipif(os.name == "nt", reason="directory is synced by MoveFileExW")
+    @mark.parametrize(
+        "durability, fsync_count",
+        [(Durability.NONE, 0), (Durability.FILE, 1), (Durability.FILE_AND_DIR, 2)],
+    )
+    def test_durability(tmp_path: Path, monkeypatch: MonkeyPatch, durability: Durability, fsync_count: int) -> None:
+        calls: list[int] = []
+        monkeypatch.setattr(safe_writer, "_proper_fsync", calls.append)
+        with safe_open(tmp_path / "test.txt", mode="w", durability=durability) as file:
+            file.write("foo")
+        assert (tmp_path / "test.txt").read_text() == "foo"
+        assert os.listdir(tmp_path) == ["test.txt"]
+        assert len(calls) == fsync_count
+
+    @staticmethod
+    @mark.skipif(os.name == "nt", reason="directory is synced by MoveFileExW")
+    def test_batch_commit(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        calls: list[int] = []
+        monkeypatch.setattr(safe_writer, "_proper_fsync", calls.append)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "0.txt").write_text("old")
+
+        assert current_batch() is None
+        with batch_commit() as batch:
+            assert current_batch() is batch
+            for path in ("0.txt", "1.txt", "sub/2.txt"):
+                with safe_open(tmp_path / path, mode="w") as file:
+                    file.write(path)
+            with batch_commit() as nested:
+                assert nested is batch
+            assert len(batch) == 3
+            assert (tmp_path / "0.txt").read_text() == "old"
+            assert not (tmp_path / "1.txt").exists()
+            assert len(calls) == 3
+        assert current_batch() is None
+
+        assert (tmp_path / "0.txt").read_text() == "0.txt"
+        assert (tmp_path / "1.txt").read_text() == "1.txt"
+        assert (tmp_path / "sub" / "2.txt").read_text() == "sub/2.txt"
+        assert sorted(os.listdir(tmp_path)) == ["0.txt", "1.txt", "sub"]
+        # 每个文件一次, 两个目录各一次
+        assert len(calls) == 5
+
+    @staticmethod
+    def test_batch_commit_rewrite(tmp_path: Path) -> None:
+        with batch_commit() as batch:
+            for content in ("foo", "bar"):
+                with safe_open(tmp_path / "test.txt", mode="w") as file:
+                    file.write(content)
+            assert len(batch) == 1
+        assert (tmp_path / "test.txt").read_text() == "bar"
+        assert os.listdir(tmp_path) == ["test.txt"]
+
+    @staticmethod
+    def test_batch_commit_concurrent_write(tmp_path: Path) -> None:
+        def _write() -> None:
+            with safe_open(tmp_path / "test.txt", mode="w", timeout=None) as file:
+                file.write("thread")
+
+        with batch_commit():
+            with safe_open(tmp_path / "test.txt", mode="w") as file:
+                file.write("batch")
+            thread = Thread(target=_write)
+            thread.start()
+            # 等待提交期间其他线程的写入被阻塞
+            thread.join(0.1)
+            assert thread.is_alive()
+            assert not (tmp_path / "test.txt").exists()
+        thread.join()
+
+        assert (tmp_path / "test.txt").read_text() == "thread"
+        assert os.listdir(tmp_path) == ["test.txt"]
+
+    @staticmethod
+    def test_stale_temp_file_reused(tmp_path: Path) -> None:
+        # 模拟异常退出遗留的临时文件
+        (tmp_path / "test.txt.tmp").write_text("stale")
+        for content in ("foo", "bar"):
+            with safe_open(tmp_path / "test.txt", mode="w") as file:
+                file.write(content)
+        assert (tmp_path / "test.txt").read_text() == "bar"
+        assert os.listdir(tmp_path) == ["test.txt"]
+
+    @staticmethod
+    def test_batch_commit_rollback(tmp_path: Path) -> None:
+        committed: list[None] = []
+        (tmp_path / "0.txt").write_text("old")
+        with suppress(RuntimeError), batch_commit() as batch:
+            batch.call_after_commit(lambda: committed.append(None))
+            for path in ("0.txt", "1.txt"):
+                with safe_open(tmp_path / path, mode="w") as file:
+                    file.write("new")
+            raise RuntimeError
+        assert (tmp_path / "0.txt").read_text() == "old"
+        assert os.listdir(tmp_path) == ["0.txt"]
+        assert not committed
+
     if os.name == "nt":
 
         def test_lock(self, tmp_path: Path) -> None:
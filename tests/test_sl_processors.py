@@ -13,6 +13,7 @@ from typing import override
 
 from mypy_extensions import KwArg
 from mypy_extensions import VarArg
+from pytest import MonkeyPatch
 from pytest import fixture
 from pytest import mark
 from pytest import raises
@@ -30,6 +31,7 @@ from c41811.config import ComponentSL
 from c41811.config import ConfigDataFactory
 from c41811.config import ConfigFile
 from c41811.config import ConfigPool
+from c41811.config import Durability
 from c41811.config import EnvironmentConfigData
 from c41811.config import HJsonSL
 from c41811.config import JPropertiesConfigData as JPropCD
@@ -52,10 +54,12 @@ from c41811.config import TarFileSL
 from c41811.config import TomlKitSL
 from c41811.config import ZipCompressionTypes
 from c41811.config import ZipFileSL
+from c41811.config import safe_writer
 from c41811.config.abc import ABCConfigSL
 from c41811.config.abc import SLArgumentType
 from c41811.config.errors import ComponentMetadataException
 from c41811.config.errors import FailedProcessConfigFileError
+from c41811.config.errors import UnsupportedConfigFormatError
 
 type LFTests = tuple[tuple[Any, tuple[EE, ...], tuple[SLArgumentType, ...]], ...]
 JsonTests: LFTests = (
@@ -275,6 +279,203 @@ def test_local_file_sl_processors(
     assert loaded_file == file
 
 
+@mark.parametrize(
+    "sl_cls, raw_data",
+    (
+        (JsonSL, {"a": 1, "b": {"c": 2}}),
+        (PickleSL, {"a": 1, "b": {"c": 2}}),
+        (PlainTextSL, "A\nB\nC"),
+    ),
+)
+def test_skip_unchanged(pool: ConfigPool, sl_cls: type[BasicLocalFileConfigSL], raw_data: Any) -> None:
+    sl_obj = sl_cls(skip_unchanged=True)
+    sl_obj.register_to(pool)
+    file_name = f"TestConfigFile{sl_obj.supported_file_patterns[0]}"
+    path = Path(pool.helper.calc_path(pool.root_path, "", file_name))
+
+    def _stat() -> tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_ino, stat.st_mtime_ns
+
+    file: ConfigFile[Any] = ConfigFile(ConfigDataFactory(raw_data), config_format=sl_obj.reg_name)
+    pool.save("", file_name, config=file)
+    content = path.read_bytes()
+    sl_cls().save(pool, file, pool.root_path, "", f"plain{sl_obj.supported_file_patterns[0]}")
+    assert content == (path.parent / f"plain{sl_obj.supported_file_patterns[0]}").read_bytes()
+
+    before = _stat()
+    pool.save("", file_name, config=file)
+    assert _stat() == before
+
+    sl_obj._digests.clear()  # noqa: SLF001
+    pool.save("", file_name, config=file)
+    assert _stat() == before
+
+    path.write_bytes(bytes(len(content)))
+    pool.save("", file_name, config=file)
+    assert path.read_bytes() == content
+
+    pool.remove("", file_name)
+    assert pool.load("", file_name) == file
+
+
+@mark.skipif(os.name == "nt", reason="directory is synced by MoveFileExW")
+def test_durability(pool: ConfigPool, monkeypatch: MonkeyPatch) -> None:
+    calls: list[int] = []
+    monkeypatch.setattr(safe_writer, "_proper_fsync", calls.append)
+    file: ConfigFile[Any] = ConfigFile(MappingConfigData({"a": 1}))
+
+    JsonSL().register_to(pool)
+    pool.save("", "default.json", config=file)
+    assert len(calls) == 2
+
+    calls.clear()
+    pool.durability = Durability.NONE
+    pool.save("", "pool.json", config=file)
+    assert not calls
+
+    JsonSL(durability=Durability.FILE).register_to(pool)
+    pool.save("", "sl.json", config=file)
+    assert len(calls) == 1
+
+    calls.clear()
+    ZipFileSL(durability=Durability.FILE_AND_DIR).register_to(pool)
+    pool.save("", "sl.json.zip", config=file)
+    assert len(calls) == 2
+    pool.remove("", "sl.json.zip")
+    assert pool.load("", "sl.json.zip").config == file.config
+
+
+def test_compress_file_legacy_override(pool: ConfigPool) -> None:
+    compressed: list[str] = []
+
+    class LegacyZipFileSL(ZipFileSL):
+        in_memory = False
+
+        @override
+        def compress_file(self, file_path: str, extract_dir: str) -> None:  # type: ignore[override]
+            compressed.append(file_path)
+            super().compress_file(file_path, extract_dir)
+
+    sl = LegacyZipFileSL().register_to(pool)
+    JsonSL().register_to(pool)
+    file: ConfigFile[Any] = ConfigFile(MappingConfigData({"a": 1}))
+    file_name = f"legacy.json{sl.supported_file_patterns[0]}"
+    pool.save("", file_name, config=file)
+    assert len(compressed) == 1
+    pool.remove("", file_name)
+    assert pool.load("", file_name).config == file.config
+
+    path = pool.helper.calc_path(pool.root_path, "", file_name)
+    BasicCompressedConfigSL.write_members(sl, path, {"other.txt": b"other"})
+    assert len(compressed) == 2
+    assert sl.read_member(path, "other.txt") == b"other"
+
+
+@mark.skipif(os.name == "nt", reason="directory is synced by MoveFileExW")
+def test_component_batch_commit(pool: ConfigPool, monkeypatch: MonkeyPatch) -> None:
+    calls: list[int] = []
+    monkeypatch.setattr(safe_writer, "_proper_fsync", calls.append)
+    comp_sl = ComponentSL().register_to(pool)
+    JsonSL().register_to(pool)
+
+    members = {f"member{i}.json": MappingConfigData({"index": i}) for i in range(30)}
+    config_data: ComponentConfigData[Any, Any] = ComponentConfigData(
+        ComponentMetaParser().convert_config2meta(MappingConfigData({"members": list(members)})),  # type: ignore[arg-type]
+        members=members,
+    )
+    pool.save("", "config.json.component", config=ConfigFile(config_data, config_format=comp_sl.reg_name))
+    # 元配置与30个成员各一次, 目录一次
+    assert len(calls) == 32
+
+    pool.remove("", "config.json.component")
+    assert pool.load("", "config.json.component").config.members == config_data.members
+
+
+SniffTests: tuple[tuple[type[BasicLocalFileConfigSL], Any], ...] = (
+    (CBOR2SL, {"a": 1, "b": {"c": [0.5, None]}}),
+    (JPropertiesSL, JPropCD({"a": "b c", "d.e": "f"})),
+    (JsonSL, {"a": 1, "b": {"c": [0.5, None]}}),
+    (JsonSL, [[1, 2], {"a": 3}]),
+    (PickleSL, {"a": 1, "b": {"c": [0.5, None]}}),
+    (PlainTextSL, "A\nB\nC"),
+    (PyYamlSL, {"a": 1, "b": {"c": [0.5, None]}}),
+    (PyYamlSL, [1, {"a": 2}]),
+    (RTomlSL, {"a": 1, "b": {"c": [0.5]}}),
+)
+
+
+@mark.parametrize("sl_cls, raw_data", SniffTests)
+def test_sniff(pool: ConfigPool, sl_cls: type[BasicLocalFileConfigSL], raw_data: Any) -> None:
+    for cls in (PlainTextSL, JPropertiesSL, RTomlSL, PyYamlSL, JsonSL, PickleSL, CBOR2SL, ZipFileSL, TarFileSL):
+        cls().register_to(pool)
+    reg_name = sl_cls().reg_name
+    file: ConfigFile[Any] = ConfigFile(ConfigDataFactory(raw_data), config_format=reg_name)
+    pool.save("", "config", config=file)
+    pool.remove("", "config")
+
+    assert pool._sniff_formats("", "config")[0] == reg_name  # noqa: SLF001
+    assert pool.load("", "config") == file
+
+
+def test_custom_sniff(pool: ConfigPool) -> None:
+    class MagicSL(PlainTextSL):
+        @property
+        @override
+        def processor_reg_name(self) -> str:
+            return "magic"
+
+        @override
+        def sniff(self, head: bytes) -> float:
+            return 1.0 if head.startswith(b"#!magic") else 0.0
+
+    JsonSL().register_to(pool)
+    MagicSL().register_to(pool)
+    path = Path(pool.helper.calc_path(pool.root_path, "", "config"))
+    path.write_text("#!magic\n{}")
+    assert pool.load("", "config").config_format == "magic"
+
+    # 文件名匹配时不读取文件内容
+    path.rename(path.with_suffix(".json"))
+    with raises(FailedProcessConfigFileError):
+        pool.load("", "config.json")
+
+    with raises(UnsupportedConfigFormatError):
+        pool.load("", "missing")
+
+
+def test_sniff_shared_lock(pool: ConfigPool, monkeypatch: MonkeyPatch) -> None:
+    opened: list[str] = []
+    open_path = safe_writer.TempTextIOManager.open_path
+
+    def _open_path(self: Any, path: str, mode: str) -> Any:
+        opened.append(mode)
+        return open_path(self, path, mode)
+
+    JsonSL().register_to(pool)
+    Path(pool.helper.calc_path(pool.root_path, "", "config")).write_text("{}")
+    monkeypatch.setattr(safe_writer.TempTextIOManager, "open_path", _open_path)
+    # 嗅探与加载都通过safe_open读取, 加载时会重新读取文件
+    assert pool.load("", "config").config_format == "json"
+    assert opened == ["rb", "r"]
+
+
+def test_sniff_encoding(pool: ConfigPool) -> None:
+    class UTF16JsonSL(JsonSL):
+        _s_open_kwargs = {"mode": "w", "encoding": "utf-16"}  # noqa: RUF012
+        _l_open_kwargs = {"mode": "r", "encoding": "utf-16"}  # noqa: RUF012
+
+    PlainTextSL().register_to(pool)
+    UTF16JsonSL().register_to(pool)
+    file: ConfigFile[Any] = ConfigFile(ConfigDataFactory({"a": "文本"}), config_format="json")
+    pool.save("", "config", config=file)
+    pool.remove("", "config")
+
+    # 按SL处理器加载时的编码解码, 而不是总按utf-8
+    assert pool._sniff_formats("", "config") == ["json"]  # noqa: SLF001
+    assert pool.load("", "config") == file
+
+
 TarFileTests = (
     ({"Now": {"supports": {"compression": "!"}}}, (), {"compression": TarCompressionTypes.GZIP}),
     ({"a": True, "b": {"c": [0.5, None]}}, (), {"compression": TarCompressionTypes.BZIP2}),
@@ -338,6 +539,53 @@ def test_compressed_file_sl_processors(
     assert loaded_file == file
 
 
+@mark.parametrize(
+    "compressed_sl",
+    (ZipFileSL(compression=ZipCompressionTypes.ZIP), TarFileSL(compression=TarCompressionTypes.GZIP)),
+)
+def test_compressed_in_memory(pool: ConfigPool, compressed_sl: BasicCompressedConfigSL) -> None:
+    compressed_sl.register_to(pool)
+    text_sl = PlainTextSL().register_to(pool)
+    file_name = f"config{text_sl.supported_file_patterns[0]}{compressed_sl.supported_file_patterns[0]}"
+    path = Path(pool.helper.calc_path(pool.root_path, "", file_name))
+
+    file: ConfigFile[Any] = ConfigFile(ConfigDataFactory("A\nB"), config_format=text_sl.reg_name)
+    pool.save("", file_name, config=file)
+    pool.remove("", file_name)
+    assert pool.load("", file_name) == file
+    # 没有创建临时目录
+    assert os.listdir(pool.root_path) == [file_name]
+
+    # 兼容解压到临时目录后压缩的文件
+    extract_dir = path.parent / "extract"
+    extract_dir.mkdir()
+    (extract_dir / compressed_sl.filename_formatter(file_name)).write_text("C")
+    compressed_sl.compress_file(str(path), str(extract_dir))
+    pool.remove("", file_name)
+    assert pool.load("", file_name).config.data == "C"
+
+    path.unlink()
+    compressed_sl.write_members(str(path), {"other.txt": b"other"})
+    pool.remove("", file_name)
+    with raises(FileNotFoundError):
+        pool.load("", file_name)
+
+    # 保存时保留其他成员
+    pool.save("", file_name, config=file)
+    assert compressed_sl.read_member(str(path), "other.txt") == b"other"
+    pool.remove("", file_name)
+    assert pool.load("", file_name) == file
+
+    # 基于解压与压缩的默认实现
+    member = compressed_sl.filename_formatter(file_name)
+    BasicCompressedConfigSL.write_members(compressed_sl, str(path), {member: b"D", "sub/new.txt": b"new"})
+    assert BasicCompressedConfigSL.read_member(compressed_sl, str(path), member) == b"D"
+    assert compressed_sl.read_member(str(path), "sub/new.txt") == b"new"
+    assert compressed_sl.read_member(str(path), "other.txt") == b"other"
+    with raises(KeyError):
+        BasicCompressedConfigSL.read_member(compressed_sl, str(path), "missing.txt")
+
+
 ComponentTests: tuple[
     str,
     tuple[
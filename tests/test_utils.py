@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Any
 from typing import cast
 
@@ -8,10 +10,12 @@ from c41811.config import ComponentMember
 
 # noinspection PyProtectedMember
 from c41811.config.processor.component import _component_loader_kwargs_builder as component_loader_kwargs_builder
+from c41811.config.utils import CopyPolicy
 from c41811.config.utils import FrozenArguments
 from c41811.config.utils import Ref
 from c41811.config.utils import Unset
 from c41811.config.utils import UnsetType
+from c41811.config.utils import fast_deepcopy
 from c41811.config.utils import singleton
 
 
@@ -139,3 +143,45 @@ def test_frozen_arguments() -> None:
     with raises(TypeError):
         fa | None  # type: ignore[operator]
     assert fa != NotImplemented
+
+
+def _cyclic_data() -> dict[str, Any]:
+    cyclic: dict[str, Any] = {"list": [1, 2.0, "3"], "tuple": (b"4", None)}
+    cyclic["self"] = cyclic
+    cyclic["shared"] = (cyclic["list"], cyclic["list"])
+    return cyclic
+
+
+@mark.parametrize(
+    "obj",
+    (
+        1,
+        "str",
+        (1, 2, 3),
+        {"a": {"b": [1, 2, {"c": (3, [4])}]}, "d": {5, 6}},
+        OrderedDict((("a", OrderedDict((("b", 1),))),)),
+        [frozenset({1}), FrozenArguments((1,), {"a": [2]})],
+    ),
+)
+def test_fast_deepcopy(obj: Any) -> None:
+    copied = fast_deepcopy(obj)
+    assert copied == obj
+    assert type(copied) is type(obj)
+    assert (copied is obj) is (deepcopy(obj) is obj)
+
+
+def test_fast_deepcopy_references() -> None:
+    data = _cyclic_data()
+    copied = fast_deepcopy(data)
+    assert copied["self"] is copied
+    assert copied["list"] is not data["list"]
+    assert copied["shared"][0] is copied["shared"][1] is copied["list"]
+    assert copied["tuple"] is data["tuple"]
+
+
+@mark.parametrize("policy", [CopyPolicy.DEEPCOPY, CopyPolicy.FAST, CopyPolicy.NONE])
+def test_copy_policy(policy: CopyPolicy) -> None:
+    data = {"a": [1, {"b": 2}]}
+    copied = policy.copy(data)
+    assert copied == data
+    assert (copied is data) is (policy is CopyPolicy.NONE)
@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path as FPath
+from typing import Any
+
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+from pytest import warns
+
+from c41811.config import ConfigPool
+from c41811.config import ConfigWatcher
+from c41811.config import JsonSL
+from c41811.config.abc import ABCConfigFile
+from c41811.config.errors import UnsavedChangesError
+from c41811.config.watcher import _libc
+
+BACKENDS = ["poll", mark.skipif(_libc is None, reason="inotify is not supported")("inotify")]
+
+
+def _write(path: str, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@fixture
+def pool(tmpdir: FPath) -> ConfigPool:
+    pool = ConfigPool(root_path=str(tmpdir))
+    JsonSL().register_to(pool)
+    return pool
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_reload(pool: ConfigPool, backend: Any) -> None:
+    path = os.path.join(pool.root_path, "test.json")
+    _write(path, {"foo": 1})
+    file = pool.load("", "test.json")
+
+    reloaded: list[tuple[str, str, ABCConfigFile[Any]]] = []
+    with ConfigWatcher(
+        pool, backend=backend, debounce=0.05, interval=0.05, on_reload=lambda *args: reloaded.append(args)
+    ) as watcher:
+        assert watcher.running
+        assert watcher.backend == backend
+        assert watcher.pool is pool
+        with raises(RuntimeError, match="already running"):
+            watcher.start()
+
+        time.sleep(0.1)
+        _write(path, {"foo": 22})
+        assert _wait_until(lambda: pool.load("", "test.json") is not file)
+        new = pool.load("", "test.json")
+        assert new.config.retrieve("foo") == 22
+        assert reloaded == [("", "test.json", new)]
+    assert not watcher.running
+    watcher.stop()
+
+
+@mark.skipif(_libc is None, reason="inotify is not supported")
+def test_debounce(pool: ConfigPool) -> None:
+    path = os.path.join(pool.root_path, "test.json")
+    _write(path, {"foo": 0})
+    pool.load("", "test.json")
+
+    reloaded: list[Any] = []
+    with ConfigWatcher(pool, backend="inotify", debounce=0.3, on_reload=lambda *args: reloaded.append(args)):
+        time.sleep(0.1)
+        for i in range(1, 10):
+            _write(path, {"foo": "x" * i})
+        assert _wait_until(lambda: bool(reloaded))
+        time.sleep(0.4)
+    assert len(reloaded) == 1
+    assert pool.load("", "test.json").config.retrieve("foo") == "x" * 9
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_reload_error(pool: ConfigPool, backend: Any) -> None:
+    path = os.path.join(pool.root_path, "test.json")
+    _write(path, {"foo": 1})
+    file = pool.load("", "test.json")
+
+    errors: list[tuple[str, str, Exception]] = []
+    with ConfigWatcher(pool, backend=backend, debounce=0.05, interval=0.05, on_error=lambda *args: errors.append(args)):
+        time.sleep(0.1)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        assert _wait_until(lambda: bool(errors))
+    assert errors[0][:2] == ("", "test.json")
+    assert pool.load("", "test.json") is file
+
+    with warns(RuntimeWarning, match="failed to reload"), ConfigWatcher(pool, backend="poll", interval=0.05):
+        time.sleep(0.3)
+
+
+def test_callback_error(pool: ConfigPool) -> None:
+    path = os.path.join(pool.root_path, "test.json")
+    _write(path, {"foo": 1})
+    pool.load("", "test.json")
+
+    def _raise(*_: Any) -> None:
+        msg = "callback failed"
+        raise ValueError(msg)
+
+    # 回调抛出的错误不会终止监视线程
+    errors: list[tuple[str, str, Exception]] = []
+    with ConfigWatcher(
+        pool, backend="poll", interval=0.05, on_reload=_raise, on_error=lambda *args: errors.append(args)
+    ) as watcher:
+        time.sleep(0.1)
+        _write(path, {"foo": 2})
+        assert _wait_until(lambda: bool(errors))
+        assert watcher.running
+        assert isinstance(errors[0][2], ValueError)
+        assert pool.load("", "test.json").config.retrieve("foo") == 2
+
+    with (
+        warns(RuntimeWarning, match="callback failed"),
+        ConfigWatcher(pool, backend="poll", interval=0.05, on_reload=_raise, on_error=_raise) as watcher,
+    ):
+        time.sleep(0.1)
+        _write(path, {"foo": 3})
+        assert _wait_until(lambda: pool.load("", "test.json").config.retrieve("foo") == 3)
+        time.sleep(0.1)
+        assert watcher.running
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_reload_dirty(pool: ConfigPool, backend: Any) -> None:
+    path = os.path.join(pool.root_path, "test.json")
+    _write(path, {"foo": 1})
+    file = pool.load("", "test.json")
+    file.config["bar"] = 2
+
+    errors: list[tuple[str, str, Exception]] = []
+    with ConfigWatcher(pool, backend=backend, debounce=0.05, interval=0.05, on_error=lambda *args: errors.append(args)):
+        time.sleep(0.1)
+        _write(path, {"foo": 3})
+        assert _wait_until(lambda: bool(errors))
+        time.sleep(0.3)
+        # 写入过程中可能观察到多次状态变化, 但文件不再变化后不会重复报告
+        reported = len(errors)
+        time.sleep(0.3)
+        assert len(errors) == reported
+    for error in errors:
+        assert error[:2] == ("", "test.json")
+        assert isinstance(error[2], UnsavedChangesError)
+    assert pool.load("", "test.json") is file
+    assert file.config.data == {"foo": 1, "bar": 2}
+    assert file.dirty